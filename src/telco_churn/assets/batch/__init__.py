@@ -1,5 +1,6 @@
 from . import (
     action,
+    backfill,
     bronze,
     churn_batch,
     features,
@@ -7,12 +8,14 @@ from . import (
     report,
     scored,
     silver,
+    stream,
     summary,
     upload_report,
 )
 
 BATCH_ASSET_MODULES = [
     action,
+    backfill,
     churn_batch,
     bronze,
     features,
@@ -20,6 +23,7 @@ BATCH_ASSET_MODULES = [
     report,
     scored,
     silver,
+    stream,
     summary,
     upload_report,
 ]
@@ -1,8 +1,12 @@
+from functools import partial
+
 import pandas as pd
 import dagster as dg
 from telco_churn.batch.action import build_actions_df
+from telco_churn.batch.incremental import explain_incremental
+from telco_churn.batch.partitions import BATCH_PARTITIONS
 
-@dg.asset(name="batch_action_df", required_resource_keys={"hf_model"})
+@dg.asset(name="batch_action_df", required_resource_keys={"hf_model", "scoring", "db", "meta"}, partitions_def=BATCH_PARTITIONS)
 def batch_action_df(
     context: dg.AssetExecutionContext,
     batch_features_df: pd.DataFrame,
@@ -10,14 +14,49 @@ def batch_action_df(
 ) -> pd.DataFrame | None:
     """Create batch suggested action dataframe."""
     hf_model = context.resources.hf_model
+    scoring = context.resources.scoring
     bundle = hf_model.get_model_bundle()
+    scorer = scoring.scorer(model=bundle.model, names=bundle.feature_names, explainer=bundle.explainer)
+
+    explained: list[int] = []
+    top_reasons = int(scoring.top_reasons)
+
+    if top_reasons > 1:
+        # The incremental cache holds top-1 features only; multi-reason output explains every flagged row.
+        actions = build_actions_df(
+            scored=batch_scored_df,
+            X=batch_features_df,
+            model=bundle.model,
+            names=bundle.feature_names,
+            explain=partial(scorer.top_reason_indices, k=top_reasons),
+            top_reasons=top_reasons,
+        )
+    elif scoring.incremental:
+        def explain(X_flagged: pd.DataFrame):
+            top, n = explain_incremental(
+                connect=context.resources.db.connect_cache,
+                X=X_flagged,
+                model_version=bundle.model_version,
+                explain=scorer.top_feature_names,
+            )
+            explained.append(n)
+            return top
 
-    actions = build_actions_df(
-        scored=batch_scored_df,
-        X=batch_features_df,
-        model=bundle.model,
-        names=bundle.feature_names,
-    )
+        actions = build_actions_df(
+            scored=batch_scored_df,
+            X=batch_features_df,
+            model=bundle.model,
+            names=bundle.feature_names,
+            explain=explain,
+        )
+    else:
+        actions = build_actions_df(
+            scored=batch_scored_df,
+            X=batch_features_df,
+            model=bundle.model,
+            names=bundle.feature_names,
+            explain=scorer.top_feature_names,
+        )
 
     if actions is None:
         context.add_output_metadata({
@@ -28,9 +67,12 @@ def batch_action_df(
 
     context.add_output_metadata({
         "has_actions": True,
+        "incremental": bool(scoring.incremental),
+        "top_reasons": top_reasons,
+        "rows_explained": int(sum(explained)) if explained else actions.shape[0],
         "rows": actions.shape[0],
         "columns": actions.shape[1],
-        "preview": dg.MetadataValue.md(actions.head(5).to_markdown(index=False)),
+        **context.resources.meta.preview(actions),
     })
 
     return actions
@@ -0,0 +1,66 @@
+import pandas as pd
+import dagster as dg
+from telco_churn.batch.backfill import resolve_batch_sources, batch_ids_for, score_batch_file
+from telco_churn.batch.upload import upload_batch_files
+
+@dg.asset(
+    name="batch_backfill_reports",
+    required_resource_keys={"db", "hf_model", "hf_data", "batch_ctx", "scoring", "meta"},
+    config_schema={
+        "sources": dg.Field([str], description="Batch parquet paths, globs, partition dirs or HF data paths."),
+        "top_k": dg.Field(int, default_value=0),
+        "upload": dg.Field(bool, default_value=False),
+    },
+)
+def batch_backfill_reports(context: dg.AssetExecutionContext) -> list[dict]:
+    """Score many batch files with one loaded model; one reports/batch_<id> per file."""
+    db = context.resources.db
+    hf_data = context.resources.hf_data
+    batch_ctx = context.resources.batch_ctx
+    bundle = context.resources.hf_model.get_model_bundle()
+    scorer = context.resources.scoring.scorer(
+        model=bundle.model,
+        names=bundle.feature_names,
+        explainer=bundle.explainer,
+    )
+    upload = bool(context.op_config["upload"])
+
+    sources = resolve_batch_sources(context.op_config["sources"], download=hf_data.download_data)
+    if not sources:
+        raise ValueError("No batch files to backfill.")
+    batch_ids = batch_ids_for(sources)
+
+    reports: list[dict] = []
+    with db.connect() as con, scorer.session():
+        for source, batch_id in zip(sources, batch_ids):
+            ctx = batch_ctx.get(batch_id=batch_id)
+            report = score_batch_file(
+                con=con,
+                source=source,
+                ctx=ctx,
+                bundle=bundle,
+                scorer=scorer,
+                top_k=int(context.op_config["top_k"]),
+                top_reasons=int(context.resources.scoring.top_reasons),
+            )
+            if upload:
+                report.update(upload_batch_files(
+                    hf_data=hf_data,
+                    batch_report=report,
+                    reports_root=ctx.reports_root,
+                    update_latest=False,
+                ))
+            context.log.info(f"Backfilled {source} -> {ctx.batch_root} ({report['rows']} rows)")
+            reports.append(report)
+
+    table = pd.DataFrame(reports)[["batch_id", "source", "rows", "flagged"]]
+    context.add_output_metadata({
+        "model_version": bundle.model_version,
+        "batches": len(reports),
+        "rows": int(table["rows"].sum()),
+        "flagged": int(table["flagged"].sum()),
+        "uploaded": upload,
+        **context.resources.meta.preview(table),
+    })
+
+    return reports
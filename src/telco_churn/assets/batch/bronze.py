@@ -1,27 +1,21 @@
 import dagster as dg
-import duckdb
 from telco_churn.data_layers.bronze.ingest import build_bronze
+from telco_churn.data_layers.fused import bronze_view, drop_relation
+from telco_churn.batch.partitions import BATCH_PARTITIONS, batch_partition
 
-@dg.asset(name="bronze_batch_table", required_resource_keys={"db"})
+@dg.asset(name="bronze_batch_table", required_resource_keys={"db", "meta", "batch_ctx"}, partitions_def=BATCH_PARTITIONS)
 def bronze_batch_table(context: dg.AssetExecutionContext, churn_batch: str) -> str:
-    """Batch churn data to DB table."""
+    """Batch churn data to DB table (a view over the parquet unless layered)."""
     db = context.resources.db
-    with duckdb.connect(str(db.db_path())) as con:
-        table_name = build_bronze(con, churn_batch, "bronze.batch")
-
-        rows = con.execute(f"select count(*) from {table_name}").fetchone()[0]
-        cols = con.execute(f"describe {table_name}").fetchall()
-        preview_df = con.execute(f"select * from {table_name} limit 5").df()
-
-        context.add_output_metadata({
-            "db_path": dg.MetadataValue.path(str(db.db_path())),
-            "table": table_name,
-            "rows": rows,
-            "columns": len(cols),
-            "schema": dg.MetadataValue.md(
-                "\n".join([f"- `{name}`: {dtype}" for (name, dtype, *_rest) in cols])
-            ),
-            "preview": dg.MetadataValue.md(preview_df.to_markdown(index=False)),
-        })
+    meta = context.resources.meta
+    db_path = dg.MetadataValue.path(str(db.db_path(batch_partition(context))))
+    with db.connect(batch_partition(context)) as con:
+        if context.resources.batch_ctx.layered:
+            drop_relation(con, "bronze.batch")
+            table_name = build_bronze(con, churn_batch, "bronze.batch")
+            context.add_output_metadata(meta.table(con, table_name, db_path=db_path, table=table_name))
+        else:
+            table_name = bronze_view(con, churn_batch, "bronze.batch")
+            context.add_output_metadata(meta.parquet(churn_batch, db_path=db_path, table=table_name, view=True))
 
         return table_name
@@ -1,23 +1,19 @@
 import os
-import pandas as pd
 import dagster as dg
+from telco_churn.batch.partitions import BATCH_PARTITIONS, batch_file_for
 
-@dg.asset(name="churn_batch", required_resource_keys={"hf_data"})
+@dg.asset(name="churn_batch", required_resource_keys={"hf_data", "meta"}, partitions_def=BATCH_PARTITIONS)
 def churn_batch(context: dg.AssetExecutionContext) -> str:
     """Ingest batch data."""
     hf_data = context.resources.hf_data
-    local_path = hf_data.download_data("data/bronze/churn_batch.parquet")
+    local_path = hf_data.download_data(batch_file_for(context.partition_key))
 
     file_bytes = os.path.getsize(local_path)
 
-    df_head = pd.read_parquet(local_path).head(5)
-
-    context.add_output_metadata({
-        "path": dg.MetadataValue.path(local_path),
-        "bytes": file_bytes,
-        "rows_previewed": len(df_head),
-        "columns": len(df_head.columns),
-        "preview": dg.MetadataValue.md(df_head.to_markdown(index=False)),
-    })
+    context.add_output_metadata(context.resources.meta.parquet(
+        local_path,
+        path=dg.MetadataValue.path(local_path),
+        bytes=file_bytes,
+    ))
 
     return local_path
\ No newline at end of file
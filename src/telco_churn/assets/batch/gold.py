@@ -1,40 +1,33 @@
-import duckdb
 import dagster as dg
-from telco_churn.db.executor import SQLExecutor
+from telco_churn.data_layers.fused import gold_features
+from telco_churn.batch.partitions import BATCH_PARTITIONS, batch_partition
 
-GOLD_SQL_PKG = "telco_churn.data_layers.gold"
-FEATURES_SQL_FILE = "features.sql"
-
-@dg.asset(name="gold_batch_table", required_resource_keys={"db"})
+@dg.asset(name="gold_batch_table", required_resource_keys={"db", "meta", "batch_ctx"}, partitions_def=BATCH_PARTITIONS)
 def gold_batch_table(context: dg.AssetExecutionContext, silver_batch_table: str) -> str:
-    """Model ready feature table."""
+    """Model ready feature table; with fused layers the one materialized table (or a view when materialize_gold is off)."""
     db = context.resources.db
-    with duckdb.connect(str(db.db_path())) as con:
-        ex = SQLExecutor(con)
-
-        template = ex.load_sql(GOLD_SQL_PKG, FEATURES_SQL_FILE)
-        sql = template.format(
-            features_table="gold.batch_features",
-            base_table=silver_batch_table,
-        )
-        ex.execute_script(sql)
-
-        table_name = "gold.batch_features"
+    batch_ctx = context.resources.batch_ctx
+    materialize = batch_ctx.layered or batch_ctx.materialize_gold
+    db_path = dg.MetadataValue.path(str(db.db_path(batch_partition(context))))
+    with db.connect(batch_partition(context)) as con:
+        table_name = gold_features(con, silver_batch_table, "gold.batch_features", materialize=materialize)
 
-        rows = con.execute(f"select count(*) from {table_name}").fetchone()[0]
-        cols = con.execute(f"describe {table_name}").fetchall()
-        preview_df = con.execute(f"select * from {table_name} limit 5").df()
+        if not materialize:
+            context.add_output_metadata({
+                "db_path": db_path,
+                "table": table_name,
+                "source_table": silver_batch_table,
+                "view": True,
+            })
+            return table_name
 
-        context.add_output_metadata({
-            "db_path": dg.MetadataValue.path(str(db.db_path())),
-            "table": table_name,
-            "source_table": silver_batch_table,
-            "rows": rows,
-            "columns": len(cols),
-            "schema": dg.MetadataValue.md(
-                "\n".join([f"- `{name}`: {dtype}" for (name, dtype, *_rest) in cols])
-            ),
-            "preview": dg.MetadataValue.md(preview_df.to_markdown(index=False)),
-        })
+        context.add_output_metadata(context.resources.meta.table(
+            con,
+            table_name,
+            db_path=db_path,
+            table=table_name,
+            source_table=silver_batch_table,
+            fused=not batch_ctx.layered,
+        ))
 
         return table_name
@@ -1,10 +1,13 @@
 import pandas as pd
+import pyarrow.parquet as pq
 import dagster as dg
 import json
 from pathlib import Path
 import os
+from telco_churn.batch.scored import scored_table
+from telco_churn.batch.partitions import BATCH_PARTITIONS, batch_partition
 
-@dg.asset(name="batch_report", required_resource_keys={"batch_ctx"})
+@dg.asset(name="batch_report", required_resource_keys={"batch_ctx"}, partitions_def=BATCH_PARTITIONS)
 def batch_report(
     context: dg.AssetExecutionContext,
     batch_scored_df: pd.DataFrame,
@@ -13,9 +16,9 @@ def batch_report(
 ) -> dict:
     """Assembled report on current batch."""
     batch_ctx = context.resources.batch_ctx
-    ctx = batch_ctx.get()
+    ctx = batch_ctx.get(batch_id=batch_partition(context))
 
-    batch_scored_df.to_parquet(ctx.scored_path, index=False)
+    pq.write_table(scored_table(batch_scored_df), ctx.scored_path)
     batch_action_df.to_parquet(ctx.actions_path, index=False)
 
     with open(ctx.summary_path, "w", encoding="utf-8") as f:
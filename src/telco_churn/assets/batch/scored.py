@@ -1,16 +1,29 @@
 import pandas as pd
 import dagster as dg
 from telco_churn.batch.scored import build_scored_df
+from telco_churn.batch.incremental import score_incremental
+from telco_churn.batch.partitions import BATCH_PARTITIONS, batch_partition
 
-@dg.asset(name="batch_scored_df", required_resource_keys={"hf_model", "batch_ctx"})
+@dg.asset(name="batch_scored_df", required_resource_keys={"hf_model", "batch_ctx", "scoring", "db", "meta"}, partitions_def=BATCH_PARTITIONS)
 def batch_scored_df(context: dg.AssetExecutionContext, batch_features_df: pd.DataFrame) -> pd.DataFrame:
     """Model score results dataframe"""
     hf_model = context.resources.hf_model
     batch_ctx = context.resources.batch_ctx
-    ctx = batch_ctx.get()
+    scoring = context.resources.scoring
+    ctx = batch_ctx.get(batch_id=batch_partition(context))
     bundle = hf_model.get_model_bundle()
-        
-    proba = bundle.model.predict_proba(batch_features_df)[:, 1]
+    scorer = scoring.scorer(model=bundle.model, names=bundle.feature_names)
+
+    if scoring.incremental:
+        proba, rows_scored = score_incremental(
+            connect=context.resources.db.connect_cache,
+            X=batch_features_df,
+            model_version=bundle.model_version,
+            predict=scorer.predict_proba,
+        )
+    else:
+        proba = scorer.predict_proba(batch_features_df)
+        rows_scored = len(batch_features_df)
     thr = float(bundle.threshold)
 
     scored = build_scored_df(
@@ -18,14 +31,20 @@ def batch_scored_df(context: dg.AssetExecutionContext, batch_features_df: pd.Dat
         proba=proba,
         batch_id=ctx.batch_id,
         threshold=thr,
+        top_k=scoring.priority_top_k,
     )
 
     context.add_output_metadata({
         "batch_id": str(ctx.batch_id),
         "threshold": thr,
+        "n_workers": scorer.n_workers,
+        "incremental": bool(scoring.incremental),
+        "rows_scored": int(rows_scored),
+        "rows_reused": int(len(batch_features_df) - rows_scored),
+        "rows_ranked": int(scored["priority_rank"].notna().sum()),
         "rows": scored.shape[0],
         "columns": scored.shape[1],
-        "preview": dg.MetadataValue.md(scored.head(5).to_markdown(index=False)),
+        **context.resources.meta.preview(scored),
     })
 
     return scored
@@ -1,40 +1,45 @@
-import duckdb
 import dagster as dg
 from telco_churn.db.executor import SQLExecutor
+from telco_churn.data_layers.fused import drop_relation, silver_view
+from telco_churn.batch.partitions import BATCH_PARTITIONS, batch_partition
 
 SILVER_SQL_PKG = "telco_churn.data_layers.silver"
 BASE_SQL_FILE = "base.sql"
 
-@dg.asset(name="silver_batch_table", required_resource_keys={"db"})
+@dg.asset(name="silver_batch_table", required_resource_keys={"db", "meta", "batch_ctx"}, partitions_def=BATCH_PARTITIONS)
 def silver_batch_table(context: dg.AssetExecutionContext, bronze_batch_table: str) -> str:
-    """Cleaned and normalised batch."""
+    """Cleaned and normalised batch (a view over bronze unless layered)."""
     db = context.resources.db
-    with duckdb.connect(str(db.db_path())) as con:
+    db_path = dg.MetadataValue.path(str(db.db_path(batch_partition(context))))
+    with db.connect(batch_partition(context)) as con:
+        table_name = "silver.batch_base"
+
+        if not context.resources.batch_ctx.layered:
+            silver_view(con, bronze_batch_table, table_name)
+            context.add_output_metadata({
+                "db_path": db_path,
+                "table": table_name,
+                "source_table": bronze_batch_table,
+                "view": True,
+            })
+            return table_name
+
         ex = SQLExecutor(con)
 
         template = ex.load_sql(SILVER_SQL_PKG, BASE_SQL_FILE)
         sql = template.format(
-            base_table="silver.batch_base",
+            base_table=table_name,
             bronze_table=bronze_batch_table,
         )
+        drop_relation(con, table_name)
         ex.execute_script(sql)
 
-        table_name = "silver.batch_base"
-
-        rows = con.execute(f"select count(*) from {table_name}").fetchone()[0]
-        cols = con.execute(f"describe {table_name}").fetchall()
-        preview_df = con.execute(f"select * from {table_name} limit 5").df()
-
-        context.add_output_metadata({
-            "db_path": dg.MetadataValue.path(str(db.db_path())),
-            "table": table_name,
-            "source_table": bronze_batch_table,
-            "rows": rows,
-            "columns": len(cols),
-            "schema": dg.MetadataValue.md(
-                "\n".join([f"- `{name}`: {dtype}" for (name, dtype, *_rest) in cols])
-            ),
-            "preview": dg.MetadataValue.md(preview_df.to_markdown(index=False)),
-        })
+        context.add_output_metadata(context.resources.meta.table(
+            con,
+            table_name,
+            db_path=db_path,
+            table=table_name,
+            source_table=bronze_batch_table,
+        ))
 
         return table_name
@@ -0,0 +1,130 @@
+import json
+import os
+import dagster as dg
+from telco_churn.db.executor import SQLExecutor
+from telco_churn.batch.stream import score_stream, DEFAULT_CHUNK_ROWS
+from telco_churn.batch.upload import upload_batch_files
+from telco_churn.batch.partitions import BATCH_PARTITIONS, batch_partition
+from telco_churn.modeling.compiled.design_sql import create_design_view
+
+DESIGN_VIEW = "gold.batch_design"
+
+@dg.asset(
+    name="batch_stream_report",
+    partitions_def=BATCH_PARTITIONS,
+    required_resource_keys={"db", "hf_model", "batch_ctx"},
+    config_schema={
+        "chunk_rows": dg.Field(int, default_value=DEFAULT_CHUNK_ROWS),
+        "top_k": dg.Field(int, default_value=0),
+        "top_reasons": dg.Field(int, default_value=1),
+        "design_view": dg.Field(bool, default_value=False),
+    },
+)
+def batch_stream_report(context: dg.AssetExecutionContext, gold_batch_table: str) -> dict:
+    """Score, explain and report the batch chunk by chunk with bounded memory."""
+    db = context.resources.db
+    hf_model = context.resources.hf_model
+    batch_ctx = context.resources.batch_ctx
+    ctx = batch_ctx.get(batch_id=batch_partition(context))
+    bundle = hf_model.get_model_bundle()
+    chunk_rows = int(context.op_config["chunk_rows"])
+    model = bundle.model
+    source_table = gold_batch_table
+    design_meta = {"design_view": False}
+
+    with db.connect(batch_partition(context)) as con:
+        ex = SQLExecutor(con)
+        if context.op_config["design_view"]:
+            design = create_design_view(
+                con,
+                bundle.model,
+                source_table=gold_batch_table,
+                view_name=DESIGN_VIEW,
+                feature_names=bundle.feature_names,
+            )
+            design_meta = {"design_view": design.verified, "design_parity_diff": design.parity_diff}
+            if design.verified:
+                model = design.model
+                source_table = design.view_name
+
+        result = score_stream(
+            reader=ex.record_batches(f"SELECT * FROM {source_table}", chunk_rows),
+            model=model,
+            names=bundle.feature_names,
+            threshold=float(bundle.threshold),
+            batch_id=ctx.batch_id,
+            scored_path=ctx.scored_path,
+            actions_path=ctx.actions_path,
+            chunk_rows=chunk_rows,
+            top_k=int(context.op_config["top_k"]),
+            top_reasons=int(context.op_config["top_reasons"]),
+            explainer=bundle.explainer,
+        )
+
+    summary = result.summary.summary(
+        batch_id=ctx.batch_id,
+        model_version=bundle.model_version,
+        threshold=bundle.threshold,
+        top_k=3,
+    )
+    with open(ctx.summary_path, "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2)
+
+    context.add_output_metadata({
+        "batch_id": str(ctx.batch_id),
+        "chunk_rows": chunk_rows,
+        "chunks": result.chunks,
+        "rows": result.rows,
+        "flagged": result.flagged,
+        **design_meta,
+
+        "scored_path": dg.MetadataValue.path(str(ctx.scored_path)),
+        "actions_path": dg.MetadataValue.path(str(ctx.actions_path)),
+        "summary_path": dg.MetadataValue.path(str(ctx.summary_path)),
+
+        "scored_bytes": os.path.getsize(ctx.scored_path),
+        "actions_bytes": os.path.getsize(ctx.actions_path),
+        "summary_bytes": os.path.getsize(ctx.summary_path),
+
+        "hf_batch_path": str(ctx.hf_batch_path),
+    })
+
+    return {
+        "scored_path": str(ctx.scored_path),
+        "actions_path": str(ctx.actions_path),
+        "summary_path": str(ctx.summary_path),
+        "hf_batch_path": ctx.hf_batch_path,
+        "batch_id": ctx.batch_id,
+    }
+
+@dg.asset(
+    name="upload_batch_stream_report",
+    partitions_def=BATCH_PARTITIONS,
+    required_resource_keys={"hf_data", "batch_ctx"},
+    config_schema={"upload": dg.Field(bool, default_value=False)},
+)
+def upload_batch_stream_report(context: dg.AssetExecutionContext, batch_stream_report: dict) -> dict:
+    """Upload streamed batch report to hugging face reports archive."""
+    if not context.op_config["upload"]:
+        context.add_output_metadata({
+            "uploaded": False,
+            "batch_id": str(batch_stream_report.get("batch_id")),
+        })
+        return batch_stream_report
+
+    uploaded = upload_batch_files(
+        hf_data=context.resources.hf_data,
+        batch_report=batch_stream_report,
+        reports_root=context.resources.batch_ctx.get(batch_id=batch_partition(context)).reports_root,
+    )
+
+    context.add_output_metadata({
+        "uploaded": True,
+        "batch_id": str(batch_stream_report["batch_id"]),
+        **uploaded,
+    })
+
+    return {
+        **batch_stream_report,
+        **uploaded,
+    }
@@ -1,8 +1,9 @@
 import pandas as pd
 import dagster as dg
 from telco_churn.batch.summary import build_batch_summary_core
+from telco_churn.batch.partitions import BATCH_PARTITIONS, batch_partition
 
-@dg.asset(name="batch_summary", required_resource_keys={"hf_model", "batch_ctx"})
+@dg.asset(name="batch_summary", required_resource_keys={"hf_model", "batch_ctx"}, partitions_def=BATCH_PARTITIONS)
 def batch_summary(
     context: dg.AssetExecutionContext,
     batch_scored_df: pd.DataFrame,
@@ -11,7 +12,7 @@ def batch_summary(
     """Batch results summary."""
     hf_model = context.resources.hf_model
     batch_ctx = context.resources.batch_ctx
-    ctx = batch_ctx.get()
+    ctx = batch_ctx.get(batch_id=batch_partition(context))
     bundle = hf_model.get_model_bundle()
 
     summary = build_batch_summary_core(
@@ -1,28 +1,56 @@
 import dagster as dg
-import duckdb
-from telco_churn.data_layers.bronze.ingest import build_bronze
+from telco_churn.data_layers.bronze.ingest import build_bronze, ingest_bronze_incremental, manifest_entries
+from telco_churn.assets.etl.versions import input_version, is_current, version_of, versioned
 
-@dg.asset(name="bronze_data_table", required_resource_keys={"db"})
-def bronze_data_table(context: dg.AssetExecutionContext, churn_history: str) -> str:
+@dg.asset(
+    name="bronze_data_table",
+    required_resource_keys={"db", "meta"},
+    config_schema={
+        "incremental": dg.Field(bool, default_value=False),
+        "sources": dg.Field(
+            [str],
+            default_value=[],
+            description="Parquet drops (files, globs, directories) for incremental mode; defaults to churn_history.",
+        ),
+    },
+)
+def bronze_data_table(context: dg.AssetExecutionContext, churn_history: str) -> dg.Output[str]:
     """Historical churn data to DB table."""
     db = context.resources.db
-    with duckdb.connect(str(db.db_path())) as con:
-        table_name = build_bronze(con, churn_history, "bronze.train")
+    table_name = "bronze.train"
+    with db.connect() as con:
+        if context.op_config["incremental"]:
+            sources = context.op_config["sources"] or [churn_history]
+            ingest = ingest_bronze_incremental(con, sources, table_name)
+            version = version_of("incremental", *[f"{path}:{digest}" for path, digest in manifest_entries(con, table_name)])
+            memoized = not ingest.changed
+            ingest_meta = {
+                "new_files": len(ingest.new_files),
+                "replaced_files": len(ingest.replaced_files),
+                "skipped_files": len(ingest.skipped_files),
+                "rows_added": ingest.rows_added,
+            }
+            context.log.info(
+                f"Incremental bronze: {len(ingest.new_files)} new, {len(ingest.replaced_files)} replaced, "
+                f"{len(ingest.skipped_files)} unchanged files ({ingest.rows_added} rows added)"
+            )
+        else:
+            version = version_of("full", input_version(context, "churn_history"))
+            memoized = is_current(context, con, table_name, version)
+            if memoized:
+                context.log.info(f"{table_name} is up to date (data version {version}); keeping it.")
+            else:
+                build_bronze(con, churn_history, table_name)
+            ingest_meta = {}
 
-        rows = con.execute(f"select count(*) from {table_name}").fetchone()[0]
-        cols = con.execute(f"describe {table_name}").fetchall()
-        preview_df = con.execute(f"select * from {table_name} limit 5").df()
+        context.add_output_metadata(context.resources.meta.table(
+            con,
+            table_name,
+            db_path=dg.MetadataValue.path(str(db.db_path())),
+            table=table_name,
+            source_path=churn_history,
+            memoized=memoized,
+            **ingest_meta,
+        ))
 
-        context.add_output_metadata({
-            "db_path": dg.MetadataValue.path(str(db.db_path())),
-            "table": table_name,
-            "source_path": churn_history,
-            "rows": rows,
-            "columns": len(cols),
-            "schema": dg.MetadataValue.md(
-                "\n".join([f"- `{name}`: {dtype}" for (name, dtype, *_rest) in cols])
-            ),
-            "preview": dg.MetadataValue.md(preview_df.to_markdown(index=False)),
-        })
-
-        return table_name
+        return versioned(table_name, version)
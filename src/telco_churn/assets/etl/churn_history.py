@@ -1,9 +1,11 @@
 import os
 import dagster as dg
+from telco_churn.data_layers.bronze.ingest import file_hash
+from telco_churn.assets.etl.versions import versioned
 
 @dg.asset(name="churn_history", required_resource_keys={"hf_data"})
-def churn_history(context: dg.AssetExecutionContext) -> str:
-    """Ingest churn history data."""
+def churn_history(context: dg.AssetExecutionContext) -> dg.Output[str]:
+    """Ingest churn history data (data version = content hash of the file)."""
     hf_data = context.resources.hf_data
     local_path = hf_data.download_data("data/bronze/churn_history.parquet")
 
@@ -14,4 +16,4 @@ def churn_history(context: dg.AssetExecutionContext) -> str:
         "bytes": os.path.getsize(local_path),
     })
 
-    return local_path
+    return versioned(local_path, file_hash(local_path))
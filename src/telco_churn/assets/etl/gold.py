@@ -1,40 +1,43 @@
-import duckdb
 import dagster as dg
 from telco_churn.db.executor import SQLExecutor
+from telco_churn.data_layers.incremental import build_gold_features
+from telco_churn.assets.etl.versions import input_version, is_current, sql_file_version, version_of, versioned
 
 GOLD_SQL_PKG = "telco_churn.data_layers.gold"
 FEATURES_SQL_FILE = "features.sql"
+GOLD_CODE_VERSION = sql_file_version(GOLD_SQL_PKG, FEATURES_SQL_FILE)
 
-@dg.asset(name="gold_data_table", required_resource_keys={"db"})
-def gold_data_table(context: dg.AssetExecutionContext, silver_data_table: str) -> str:
-    """Engineered features data table."""
+@dg.asset(name="gold_data_table", required_resource_keys={"db", "meta"}, code_version=GOLD_CODE_VERSION)
+def gold_data_table(context: dg.AssetExecutionContext, silver_data_table: str) -> dg.Output[str]:
+    """Engineered features data table (recomputes only customers changed by an incremental silver build)."""
     db = context.resources.db
-    with duckdb.connect(str(db.db_path())) as con:
-        ex = SQLExecutor(con)
+    table_name = "gold.train_features"
+    version = version_of(input_version(context, "silver_data_table"), GOLD_CODE_VERSION)
+    with db.connect() as con:
+        if is_current(context, con, table_name, version):
+            context.log.info(f"{table_name} is up to date (data version {version}); keeping it.")
+            build_meta = {"memoized": True}
+        else:
+            ex = SQLExecutor(con)
+            build = build_gold_features(
+                con,
+                ex.load_sql(GOLD_SQL_PKG, FEATURES_SQL_FILE),
+                base_table=silver_data_table,
+                features_table=table_name,
+            )
+            build_meta = {
+                "memoized": False,
+                "build_mode": build.mode,
+                **({"rows_changed": build.rows_changed} if build.rows_changed is not None else {}),
+            }
 
-        template = ex.load_sql(GOLD_SQL_PKG, FEATURES_SQL_FILE)
-        sql = template.format(
-            features_table="gold.train_features",
-            base_table=silver_data_table,
-        )
-        ex.execute_script(sql)
+        context.add_output_metadata(context.resources.meta.table(
+            con,
+            table_name,
+            db_path=dg.MetadataValue.path(str(db.db_path())),
+            table=table_name,
+            source_table=silver_data_table,
+            **build_meta,
+        ))
 
-        table_name = "gold.train_features"
-
-        rows = con.execute(f"select count(*) from {table_name}").fetchone()[0]
-        cols = con.execute(f"describe {table_name}").fetchall()
-        preview_df = con.execute(f"select * from {table_name} limit 5").df()
-
-        context.add_output_metadata({
-            "db_path": dg.MetadataValue.path(str(db.db_path())),
-            "table": table_name,
-            "source_table": silver_data_table,
-            "rows": rows,
-            "columns": len(cols),
-            "schema": dg.MetadataValue.md(
-                "\n".join([f"- `{name}`: {dtype}" for (name, dtype, *_rest) in cols])
-            ),
-            "preview": dg.MetadataValue.md(preview_df.to_markdown(index=False)),
-        })
-
-        return table_name
+        return versioned(table_name, version)
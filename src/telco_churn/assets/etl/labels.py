@@ -1,34 +1,45 @@
-import duckdb
 import dagster as dg
 from telco_churn.db.executor import SQLExecutor
+from telco_churn.data_layers.incremental import build_labels
+from telco_churn.assets.etl.versions import input_version, is_current, sql_file_version, version_of, versioned
 
 SILVER_SQL_PKG = "telco_churn.data_layers.silver"
 LABEL_SQL_FILE = "label.sql"
+MERGE_SQL_FILE = "merge.sql"
+LABELS_CODE_VERSION = sql_file_version(SILVER_SQL_PKG, LABEL_SQL_FILE, MERGE_SQL_FILE)
 
-@dg.asset(name="labels_table", required_resource_keys={"db"})
-def labels_table(context: dg.AssetExecutionContext, bronze_data_table: str) -> str:
-    """Churn labels data table."""
+@dg.asset(name="labels_table", required_resource_keys={"db", "meta"}, code_version=LABELS_CODE_VERSION)
+def labels_table(context: dg.AssetExecutionContext, bronze_data_table: str) -> dg.Output[str]:
+    """Churn labels per customer (upserts only new bronze rows when bronze is incremental)."""
     db = context.resources.db
-    with duckdb.connect(str(db.db_path())) as con:
-        ex = SQLExecutor(con)
-        ex.execute_script(ex.load_sql(SILVER_SQL_PKG, LABEL_SQL_FILE))
+    table_name = "silver.labels"
+    version = version_of(input_version(context, "bronze_data_table"), LABELS_CODE_VERSION)
+    with db.connect() as con:
+        if is_current(context, con, table_name, version):
+            context.log.info(f"{table_name} is up to date (data version {version}); keeping it.")
+            build_meta = {"memoized": True}
+        else:
+            ex = SQLExecutor(con)
+            build = build_labels(
+                con,
+                ex.load_sql(SILVER_SQL_PKG, LABEL_SQL_FILE),
+                ex.load_sql(SILVER_SQL_PKG, MERGE_SQL_FILE),
+                bronze_table=bronze_data_table,
+                labels_table=table_name,
+            )
+            build_meta = {
+                "memoized": False,
+                "build_mode": build.mode,
+                **({"rows_changed": build.rows_changed} if build.rows_changed is not None else {}),
+            }
 
-        table_name = "silver.labels"
+        context.add_output_metadata(context.resources.meta.table(
+            con,
+            table_name,
+            db_path=dg.MetadataValue.path(str(db.db_path())),
+            table=table_name,
+            source_table=bronze_data_table,
+            **build_meta,
+        ))
 
-        rows = con.execute(f"select count(*) from {table_name}").fetchone()[0]
-        cols = con.execute(f"describe {table_name}").fetchall()
-        preview_df = con.execute(f"select * from {table_name} limit 5").df()
-
-        context.add_output_metadata({
-            "db_path": dg.MetadataValue.path(str(db.db_path())),
-            "table": table_name,
-            "source_table": bronze_data_table,
-            "rows": rows,
-            "columns": len(cols),
-            "schema": dg.MetadataValue.md(
-                "\n".join([f"- `{name}`: {dtype}" for (name, dtype, *_rest) in cols])
-            ),
-            "preview": dg.MetadataValue.md(preview_df.to_markdown(index=False)),
-        })
-
-        return table_name
+        return versioned(table_name, version)
@@ -1,40 +1,45 @@
-import duckdb
 import dagster as dg
 from telco_churn.db.executor import SQLExecutor
+from telco_churn.data_layers.incremental import build_silver_base
+from telco_churn.assets.etl.versions import input_version, is_current, sql_file_version, version_of, versioned
 
 SILVER_SQL_PKG = "telco_churn.data_layers.silver"
 BASE_SQL_FILE = "base.sql"
+MERGE_SQL_FILE = "merge.sql"
+SILVER_CODE_VERSION = sql_file_version(SILVER_SQL_PKG, BASE_SQL_FILE, MERGE_SQL_FILE)
 
-@dg.asset(name="silver_data_table", required_resource_keys={"db"})
-def silver_data_table(context: dg.AssetExecutionContext, bronze_data_table: str) -> str:
-    """Normalised and cleaned features data table."""
+@dg.asset(name="silver_data_table", required_resource_keys={"db", "meta"}, code_version=SILVER_CODE_VERSION)
+def silver_data_table(context: dg.AssetExecutionContext, bronze_data_table: str) -> dg.Output[str]:
+    """Normalised and cleaned features data table (merges only new bronze rows when bronze is incremental)."""
     db = context.resources.db
-    with duckdb.connect(str(db.db_path())) as con:
-        ex = SQLExecutor(con)
+    table_name = "silver.train_base"
+    version = version_of(input_version(context, "bronze_data_table"), SILVER_CODE_VERSION)
+    with db.connect() as con:
+        if is_current(context, con, table_name, version):
+            context.log.info(f"{table_name} is up to date (data version {version}); keeping it.")
+            build_meta = {"memoized": True}
+        else:
+            ex = SQLExecutor(con)
+            build = build_silver_base(
+                con,
+                ex.load_sql(SILVER_SQL_PKG, BASE_SQL_FILE),
+                ex.load_sql(SILVER_SQL_PKG, MERGE_SQL_FILE),
+                bronze_table=bronze_data_table,
+                base_table=table_name,
+            )
+            build_meta = {
+                "memoized": False,
+                "build_mode": build.mode,
+                **({"rows_changed": build.rows_changed} if build.rows_changed is not None else {}),
+            }
 
-        template = ex.load_sql(SILVER_SQL_PKG, BASE_SQL_FILE)
-        sql = template.format(
-            base_table="silver.train_base",
-            bronze_table=bronze_data_table,
-        )
-        ex.execute_script(sql)
+        context.add_output_metadata(context.resources.meta.table(
+            con,
+            table_name,
+            db_path=dg.MetadataValue.path(str(db.db_path())),
+            table=table_name,
+            source_table=bronze_data_table,
+            **build_meta,
+        ))
 
-        table_name = "silver.train_base"
-
-        rows = con.execute(f"select count(*) from {table_name}").fetchone()[0]
-        cols = con.execute(f"describe {table_name}").fetchall()
-        preview_df = con.execute(f"select * from {table_name} limit 5").df()
-
-        context.add_output_metadata({
-            "db_path": dg.MetadataValue.path(str(db.db_path())),
-            "table": table_name,
-            "source_table": bronze_data_table,
-            "rows": rows,
-            "columns": len(cols),
-            "schema": dg.MetadataValue.md(
-                "\n".join([f"- `{name}`: {dtype}" for (name, dtype, *_rest) in cols])
-            ),
-            "preview": dg.MetadataValue.md(preview_df.to_markdown(index=False)),
-        })
-
-        return table_name
+        return versioned(table_name, version)
@@ -1,4 +1,3 @@
-import duckdb
 from pathlib import Path
 import os
 import dagster as dg
@@ -18,7 +17,7 @@ def upload_train_table(context: dg.AssetExecutionContext, train_table: str) -> s
     out_path = Path(REPO_ROOT / "data/gold/churn_train.parquet")
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with duckdb.connect(str(db.db_path())) as con:
+    with db.connect() as con:
         ex = SQLExecutor(con)
         ex.write_parquet("SELECT * FROM gold.join_train", str(out_path))
 
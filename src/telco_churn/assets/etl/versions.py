@@ -0,0 +1,54 @@
+"""
+Data versions for the DuckDB-backed ETL assets.
+
+An asset's version hashes its input versions (upstream data versions or the source file hash) with
+its SQL; when it equals the version of the asset's last materialization and the table still exists,
+the asset keeps the table instead of rebuilding it.
+"""
+
+import hashlib
+from importlib.resources import files
+from typing import Optional
+
+import dagster as dg
+import duckdb
+
+from telco_churn.data_layers.bronze.ingest import table_columns
+
+DATA_VERSION_TAG = "dagster/data_version"
+
+def version_of(*parts: Optional[str]) -> Optional[str]:
+    """Hash of parts; None when any part is unknown (never memoized)."""
+    if any(part is None for part in parts):
+        return None
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(str(part).encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()[:16]
+
+def sql_file_version(package: str, *filenames: str) -> str:
+    return version_of(*[(files(package) / name).read_text(encoding="utf-8") for name in filenames])
+
+def latest_data_version(context: dg.AssetExecutionContext, asset_key: dg.AssetKey) -> Optional[str]:
+    event = context.instance.get_latest_materialization_event(asset_key)
+    if event is None or event.asset_materialization is None:
+        return None
+    return (event.asset_materialization.tags or {}).get(DATA_VERSION_TAG)
+
+def input_version(context: dg.AssetExecutionContext, asset_name: str) -> Optional[str]:
+    return latest_data_version(context, dg.AssetKey(asset_name))
+
+def is_current(
+    context: dg.AssetExecutionContext,
+    con: duckdb.DuckDBPyConnection,
+    table: str,
+    version: Optional[str],
+) -> bool:
+    """True when the last materialization has this version and its table is still in the database."""
+    if version is None:
+        return False
+    return latest_data_version(context, context.asset_key) == version and table_columns(con, table) is not None
+
+def versioned(value, version: Optional[str]) -> dg.Output:
+    return dg.Output(value, data_version=dg.DataVersion(version) if version is not None else None)
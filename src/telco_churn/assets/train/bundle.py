@@ -1,10 +1,13 @@
 import dagster as dg
 import os
 from telco_churn.paths import REPO_ROOT
-from telco_churn.modeling.types import FitOut, TuningResult
+from telco_churn.modeling.types import TTSCV, FitOut, TuningResult
 from telco_churn.modeling.run_id import make_run_id
 from telco_churn.modeling.bundle.model_artifact import ModelArtifact
 from telco_churn.modeling.bundle.write_bundle import write_bundle
+from telco_churn.modeling.compiled.scorer import COMPILED_MODEL_FILE
+from telco_churn.modeling.bundle.split_model import SPLIT_DIR
+from telco_churn.explainability.backends import EXPLAINER_FILE
 from telco_churn.modeling.types import BundleOut
 from telco_churn.modeling.config import (
     TARGET_COL, PRIMARY_METRIC, METRIC_DIRECTION, HOLDOUT_SIZE, CV_SPLITS, SEED,
@@ -14,6 +17,7 @@ from telco_churn.config import CURRENT_ARTIFACT_VERSION
 @dg.asset(name="artifact_bundle", required_resource_keys={"train_cfg"})
 def artifact_bundle(
     context: dg.AssetExecutionContext, 
+    data_splits: TTSCV,
     fit_pipeline: FitOut,
     best_threshold: float,
     holdout_evaluation: dict[str, float],
@@ -58,6 +62,8 @@ def artifact_bundle(
         direction=METRIC_DIRECTION,
         cfg=cfg,
         feature_names=fit_pipeline.feature_names,
+        parity_sample=data_splits.X_holdout,
+        log=context.log,
     )
 
     required = ["model.joblib", "metrics.json", "metadata.json"]
@@ -84,6 +90,9 @@ def artifact_bundle(
         "model_bytes": os.path.getsize(bundle_dir / "model.joblib"),
         "metrics_bytes": os.path.getsize(bundle_dir / "metrics.json"),
         "metadata_bytes": os.path.getsize(bundle_dir / "metadata.json"),
+        "compiled_model": (bundle_dir / COMPILED_MODEL_FILE).exists(),
+        "split_model": (bundle_dir / SPLIT_DIR).exists(),
+        "explainer": (bundle_dir / EXPLAINER_FILE).exists(),
 
         "holdout_metrics": holdout_evaluation,
         "best_params": best_hyperparameters.best_params,
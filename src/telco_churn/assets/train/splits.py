@@ -4,7 +4,7 @@ from sklearn.model_selection import StratifiedKFold, train_test_split
 from telco_churn.modeling.config import TARGET_COL, HOLDOUT_SIZE, SEED, CV_SPLITS
 from telco_churn.modeling.types import TTSCV
 
-@dg.asset(name="data_splits")
+@dg.asset(name="data_splits", required_resource_keys={"meta"})
 def data_splits(context: dg.AssetExecutionContext, train_data: str) -> TTSCV:
     """Establish data splits: TTS and CV."""
     df = pd.read_parquet(train_data)
@@ -35,7 +35,7 @@ def data_splits(context: dg.AssetExecutionContext, train_data: str) -> TTSCV:
         "y_train_counts": y_train.value_counts(dropna=False).to_dict(),
         "y_holdout_counts": y_holdout.value_counts(dropna=False).to_dict(),
 
-        "X_train_preview": dg.MetadataValue.md(X_train.head(5).to_markdown(index=False)),
+        **{f"X_train_{k}": v for k, v in context.resources.meta.preview(X_train).items()},
     })
 
     return TTSCV(X_train, X_holdout, y_train, y_holdout, cv)
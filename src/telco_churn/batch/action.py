@@ -2,11 +2,29 @@
 Action report for batch.
 """
 
+from typing import Callable, Optional
+
+import numpy as np
 import pandas as pd
 
-from telco_churn.explainability.decision_codes import DECISION_CODES
-from telco_churn.explainability.action_map import DECISION_ACTIONS
-from telco_churn.explainability.explain import top_feature_name, build_explainer
+from telco_churn.explainability.explain import build_explainer, top_feature_indices, top_reason_indices
+from telco_churn.explainability.reason_map import ReasonCodeMap
+from telco_churn.batch.priority import rank_order
+
+ACTIONS_COLS = [
+    "priority_rank",
+    "batch_id",
+    "customer_id",
+    "probability",
+    "risk_bucket",
+    "reason_code",
+    "recommended_action",
+    "action_summary",
+]
+
+def actions_cols(top_reasons: int = 1) -> list[str]:
+    """ACTIONS_COLS plus reason_code_2 .. reason_code_<top_reasons>."""
+    return ACTIONS_COLS + [f"reason_code_{i}" for i in range(2, int(top_reasons) + 1)]
 
 def build_actions_df(
     *,
@@ -14,50 +32,46 @@ def build_actions_df(
     X: pd.DataFrame,
     model,
     names,
+    explain: Optional[Callable[[pd.DataFrame], np.ndarray]] = None,
+    top_reasons: int = 1,
+    reasons: Optional[ReasonCodeMap] = None,
+    explainer=None,
 ) -> pd.DataFrame | None:
-    actions = scored.loc[scored["decision"].eq(1)].copy()
-    
-    if actions.empty:
+    """Flagged rows with reason codes and actions; X is the frame scored was built from (same row order).
+
+    explain returns the top feature name per row, or with top_reasons > 1 a (rows x top_reasons)
+    array of distinct reason indices (ReasonCodeMap.top_reasons).
+    """
+    flagged = np.flatnonzero(scored["decision"].to_numpy() == 1)
+    if flagged.size == 0:
         return None
-    
-    flagged_ids = actions["customer_id"].unique()
-    X_flagged = X.loc[X["customer_id"].isin(flagged_ids)].copy()
-    
-    explainer = build_explainer(pipe=model)
-
-    top_feature_list: list[str] = []
-    for _, r in X_flagged.iterrows():
-        X_row = pd.DataFrame([r.to_dict()])
-        top_feature_list.append(top_feature_name(pipe=model, feature_names=names, explainer=explainer, X_row=X_row))
-
-    X_flagged["top_feature"] = top_feature_list
-    
-    actions = actions.merge(
-        X_flagged[["customer_id", "top_feature"]],
-        on="customer_id",
-        how="left",
-        validate="one_to_one",
-    )
-    
-    actions["reason_code"] = actions["top_feature"].map(DECISION_CODES).fillna("OTHER")
-    actions["recommended_action"] = actions["reason_code"].map(DECISION_ACTIONS).fillna(
-        DECISION_ACTIONS["OTHER"]
-    )
-    
-    actions["action_summary"] = actions.apply(
-        lambda r: f'{r["reason_code"]}: {r["recommended_action"]}',
-        axis=1,
-    )
-
-    actions_cols = [
-        "priority_rank",
-        "batch_id",
-        "customer_id",
-        "probability",
-        "risk_bucket",
-        "reason_code",
-        "recommended_action",
-        "action_summary",
-    ]
-    
-    return actions.sort_values("priority_rank").reset_index(drop=True)[actions_cols]
\ No newline at end of file
+
+    actions = scored.iloc[flagged].copy()
+    actions["batch_id"] = scored.attrs["batch_id"]
+
+    X_flagged = X.iloc[flagged]
+    reasons = reasons if reasons is not None else ReasonCodeMap.from_feature_names(names)
+    if explain is None and explainer is None:
+        explainer = build_explainer(pipe=model)
+
+    if top_reasons > 1:
+        if explain is None:
+            top = top_reason_indices(pipe=model, explainer=explainer, X=X_flagged, reasons=reasons, k=top_reasons)
+        else:
+            top = np.asarray(explain(X_flagged))
+        primary = top[:, 0]
+    else:
+        if explain is None:
+            feature_idx = top_feature_indices(pipe=model, explainer=explainer, X=X_flagged, k=1)[:, 0]
+        else:
+            feature_idx = reasons.feature_index(explain(X_flagged))
+        primary = reasons.reason_index(feature_idx)
+
+    actions["reason_code"] = reasons.reason_categorical(primary)
+    actions["recommended_action"] = reasons.action_categorical(primary)
+    actions["action_summary"] = reasons.summary_categorical(primary)
+    for i in range(1, top_reasons):
+        actions[f"reason_code_{i + 1}"] = reasons.reason_categorical(top[:, i])
+
+    order = rank_order(actions["priority_rank"].to_numpy(dtype="int64"))
+    return actions.iloc[order].reset_index(drop=True)[actions_cols(top_reasons)]
@@ -0,0 +1,156 @@
+"""
+Backfill: score many batch parquet files through bronze -> silver -> gold -> score -> report with one loaded model.
+"""
+
+from __future__ import annotations
+
+import glob
+import hashlib
+import json
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Optional
+
+import duckdb
+import pandas as pd
+import pyarrow.parquet as pq
+
+from functools import partial
+
+from telco_churn.batch.action import build_actions_df, actions_cols
+from telco_churn.batch.scored import build_scored_df, scored_table
+from telco_churn.batch.summary import build_batch_summary_core
+from telco_churn.batch.partitions import safe_key
+from telco_churn.data_layers.fused import build_fused_gold
+
+BACKFILL_BRONZE_TABLE = "bronze.backfill_batch"
+BACKFILL_SILVER_TABLE = "silver.backfill_base"
+BACKFILL_GOLD_TABLE = "gold.backfill_features"
+
+def resolve_batch_sources(
+    sources: list[str],
+    *,
+    download: Optional[Callable[[str], str]] = None,
+) -> list[Path]:
+    """Expand local paths / globs / partition directories; anything else is fetched with download (e.g. an HF data path)."""
+    resolved: list[Path] = []
+    for src in sources:
+        p = Path(src)
+        if p.is_dir():
+            matches = sorted(p.rglob("*.parquet"))
+            if not matches:
+                raise FileNotFoundError(f"No parquet files under partition directory: {p}")
+            resolved.extend(matches)
+        elif glob.has_magic(src):
+            matches = sorted(Path(m) for m in glob.glob(src, recursive=True))
+            if not matches:
+                raise FileNotFoundError(f"No batch files match: {src}")
+            resolved.extend(matches)
+        elif p.exists():
+            resolved.append(p)
+        elif download is not None:
+            resolved.append(Path(download(src)))
+        else:
+            raise FileNotFoundError(f"Batch file not found: {src}")
+
+    unique: dict[Path, Path] = {}
+    for p in resolved:
+        unique.setdefault(p.resolve(), p)
+    return list(unique.values())
+
+def batch_id_for(path: Path, *, keep_stem: bool = False) -> str:
+    """Report id from the file name, or from hive-style partition dirs (dt=2024-01-01/part-0.parquet)."""
+    path = Path(path)
+    partitions = [part for part in path.parent.parts if "=" in part]
+    generic = re.fullmatch(r"(part|data)[-_]?\d*", path.stem) is not None
+    stem = [] if partitions and generic and not keep_stem else [path.stem]
+    raw = "_".join(partitions + stem)
+    return safe_key(raw)
+
+def _path_hash(path: Path) -> str:
+    return hashlib.sha256(Path(path).resolve().as_posix().encode("utf-8")).hexdigest()[:8]
+
+def batch_ids_for(sources: list[Path]) -> list[str]:
+    """One report id per source, unique across the backfill.
+
+    Part files of a partition dir keep their stem when the dir holds several; ids that still collide
+    (same file name in different dirs) get a short hash of the resolved path.
+    """
+    ids = [batch_id_for(p) for p in sources]
+    counts = Counter(ids)
+    ids = [batch_id_for(p, keep_stem=True) if counts[i] > 1 else i for p, i in zip(sources, ids)]
+    counts = Counter(ids)
+    ids = [f"{i}_{_path_hash(p)}" if counts[i] > 1 else i for p, i in zip(sources, ids)]
+    duplicates = sorted(i for i, n in Counter(ids).items() if n > 1)
+    if duplicates:
+        raise ValueError(f"Backfill sources map to duplicate batch ids: {duplicates}")
+    return ids
+
+def build_gold_batch(con: duckdb.DuckDBPyConnection, source: Path) -> str:
+    """Fused bronze -> silver views, gold materialized in one query over the file."""
+    return build_fused_gold(
+        con,
+        str(source),
+        bronze_table=BACKFILL_BRONZE_TABLE,
+        base_table=BACKFILL_SILVER_TABLE,
+        features_table=BACKFILL_GOLD_TABLE,
+    )
+
+def score_batch_file(
+    *,
+    con: duckdb.DuckDBPyConnection,
+    source: Path,
+    ctx,
+    bundle,
+    scorer,
+    top_k: int = 0,
+    top_reasons: int = 1,
+) -> dict:
+    """Run one batch file end to end and write its report under ctx.batch_root."""
+    gold_table = build_gold_batch(con, source)
+    X = con.execute(f"SELECT * FROM {gold_table}").df()
+    threshold = float(bundle.threshold)
+
+    scored = build_scored_df(
+        X=X,
+        proba=scorer.predict_proba(X),
+        batch_id=ctx.batch_id,
+        threshold=threshold,
+        top_k=top_k,
+    )
+    actions = build_actions_df(
+        scored=scored,
+        X=X,
+        model=bundle.model,
+        names=bundle.feature_names,
+        explain=partial(scorer.top_reason_indices, k=top_reasons) if top_reasons > 1 else scorer.top_feature_names,
+        top_reasons=top_reasons,
+    )
+    summary = build_batch_summary_core(
+        batch_id=ctx.batch_id,
+        model_version=bundle.model_version,
+        threshold=threshold,
+        scored=scored,
+        actions=actions,
+        top_k=3,
+    )
+
+    pq.write_table(scored_table(scored), ctx.scored_path)
+    if actions is not None:
+        actions.to_parquet(ctx.actions_path, index=False)
+    else:
+        pd.DataFrame(columns=actions_cols(top_reasons)).to_parquet(ctx.actions_path, index=False)
+    with open(ctx.summary_path, "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2)
+
+    return {
+        "source": str(source),
+        "rows": int(summary["total_scored"]),
+        "flagged": int(summary["flagged_count"]),
+        "scored_path": str(ctx.scored_path),
+        "actions_path": str(ctx.actions_path),
+        "summary_path": str(ctx.summary_path),
+        "hf_batch_path": ctx.hf_batch_path,
+        "batch_id": ctx.batch_id,
+    }
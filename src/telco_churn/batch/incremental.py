@@ -0,0 +1,156 @@
+"""
+Incremental batch scoring: reuse probabilities / top features for customers whose gold feature row is unchanged.
+
+The cache is shared by concurrent partition processes. connect() opens it (holding whatever lock
+serializes writers) only around the lookup and the write, never while the model runs.
+"""
+
+from typing import Callable, ContextManager
+
+import duckdb
+import numpy as np
+import pandas as pd
+
+CACHE_TABLE = "scores.batch_cache"
+
+def feature_hashes(X: pd.DataFrame) -> np.ndarray:
+    """uint64 hash of each gold feature row (customer_id excluded)."""
+    return pd.util.hash_pandas_object(X.drop(columns=["customer_id"]), index=False).to_numpy(dtype=np.uint64)
+
+def ensure_cache(con: duckdb.DuckDBPyConnection) -> None:
+    con.execute("CREATE SCHEMA IF NOT EXISTS scores;")
+    con.execute(f"""
+        CREATE TABLE IF NOT EXISTS {CACHE_TABLE} (
+            customer_id   VARCHAR NOT NULL,
+            feature_hash  UBIGINT NOT NULL,
+            model_version VARCHAR NOT NULL,
+            probability   DOUBLE  NOT NULL,
+            top_feature   VARCHAR,
+            scored_at     TIMESTAMPTZ NOT NULL DEFAULT current_timestamp,
+            PRIMARY KEY (customer_id, model_version)
+        );
+    """)
+
+def _keys(X: pd.DataFrame) -> pd.DataFrame:
+    return pd.DataFrame({
+        "pos": np.arange(len(X), dtype=np.int64),
+        "customer_id": X["customer_id"].astype(str).to_numpy(),
+        "feature_hash": feature_hashes(X),
+    })
+
+def lookup_cached(con: duckdb.DuckDBPyConnection, *, keys: pd.DataFrame, model_version: str) -> pd.DataFrame:
+    """Cache hits for keys (pos, customer_id, feature_hash) -> pos, probability, top_feature."""
+    con.register("incoming_keys", keys)
+    try:
+        return con.execute(f"""
+            SELECT k.pos, c.probability, c.top_feature
+            FROM incoming_keys k
+            JOIN {CACHE_TABLE} c
+              ON c.customer_id = k.customer_id
+             AND c.feature_hash = k.feature_hash
+             AND c.model_version = ?
+            ORDER BY k.pos
+        """, [model_version]).df()
+    finally:
+        con.unregister("incoming_keys")
+
+def store_scores(con: duckdb.DuckDBPyConnection, *, rows: pd.DataFrame, model_version: str) -> None:
+    """Upsert fresh probabilities (customer_id, feature_hash, probability); resets stale top features.
+    Entries of other model versions are dropped, the cache only serves the current champion."""
+    con.execute(f"DELETE FROM {CACHE_TABLE} WHERE model_version <> ?", [model_version])
+    if rows.empty:
+        return
+    con.register("fresh_scores", rows[["customer_id", "feature_hash", "probability"]])
+    try:
+        con.execute(f"""
+            INSERT INTO {CACHE_TABLE} (customer_id, feature_hash, model_version, probability, top_feature)
+            SELECT customer_id, feature_hash, ?, probability, NULL
+            FROM fresh_scores
+            ON CONFLICT (customer_id, model_version) DO UPDATE SET
+                feature_hash = excluded.feature_hash,
+                probability  = excluded.probability,
+                top_feature  = NULL,
+                scored_at    = now()
+        """, [model_version])
+    finally:
+        con.unregister("fresh_scores")
+
+def store_top_features(con: duckdb.DuckDBPyConnection, *, rows: pd.DataFrame, model_version: str) -> None:
+    """Attach top features (customer_id, feature_hash, top_feature) to matching cache entries."""
+    if rows.empty:
+        return
+    con.register("fresh_top", rows[["customer_id", "feature_hash", "top_feature"]])
+    try:
+        con.execute(f"""
+            UPDATE {CACHE_TABLE} AS c
+            SET top_feature = t.top_feature
+            FROM fresh_top t
+            WHERE c.customer_id = t.customer_id
+              AND c.feature_hash = t.feature_hash
+              AND c.model_version = ?
+        """, [model_version])
+    finally:
+        con.unregister("fresh_top")
+
+def score_incremental(
+    *,
+    connect: Callable[[], ContextManager[duckdb.DuckDBPyConnection]],
+    X: pd.DataFrame,
+    model_version: str,
+    predict: Callable[[pd.DataFrame], np.ndarray],
+) -> tuple[np.ndarray, int]:
+    """Probabilities for every row of X, scoring only cache misses. Returns (proba, rows_scored)."""
+    keys = _keys(X)
+    with connect() as con:
+        ensure_cache(con)
+        hits = lookup_cached(con, keys=keys, model_version=model_version)
+
+    proba = np.empty(len(X), dtype=np.float64)
+    miss = np.ones(len(X), dtype=bool)
+    hit_pos = hits["pos"].to_numpy(dtype=np.int64)
+    proba[hit_pos] = hits["probability"].to_numpy(dtype=np.float64)
+    miss[hit_pos] = False
+
+    miss_pos = np.flatnonzero(miss)
+    if miss_pos.size:
+        proba[miss_pos] = predict(X.iloc[miss_pos])
+    with connect() as con:
+        store_scores(
+            con,
+            rows=keys.iloc[miss_pos].assign(probability=proba[miss_pos]),
+            model_version=model_version,
+        )
+
+    return proba, int(miss_pos.size)
+
+def explain_incremental(
+    *,
+    connect: Callable[[], ContextManager[duckdb.DuckDBPyConnection]],
+    X: pd.DataFrame,
+    model_version: str,
+    explain: Callable[[pd.DataFrame], np.ndarray],
+) -> tuple[np.ndarray, int]:
+    """Top feature for every row of X, explaining only rows without a cached top feature. Returns (names, rows_explained)."""
+    keys = _keys(X)
+    with connect() as con:
+        ensure_cache(con)
+        hits = lookup_cached(con, keys=keys, model_version=model_version)
+    hits = hits.loc[hits["top_feature"].notna()]
+
+    top = np.empty(len(X), dtype=object)
+    miss = np.ones(len(X), dtype=bool)
+    hit_pos = hits["pos"].to_numpy(dtype=np.int64)
+    top[hit_pos] = hits["top_feature"].to_numpy(dtype=object)
+    miss[hit_pos] = False
+
+    miss_pos = np.flatnonzero(miss)
+    if miss_pos.size:
+        top[miss_pos] = explain(X.iloc[miss_pos])
+        with connect() as con:
+            store_top_features(
+                con,
+                rows=keys.iloc[miss_pos].assign(top_feature=top[miss_pos]),
+                model_version=model_version,
+            )
+
+    return top, int(miss_pos.size)
@@ -0,0 +1,132 @@
+"""
+Process-pool scoring and explanation over row ranges of a batch.
+"""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable, Iterator
+
+import numpy as np
+import pandas as pd
+
+from telco_churn.explainability.explain import build_explainer, top_feature_names, top_reason_indices
+from telco_churn.explainability.reason_map import ReasonCodeMap
+
+_WORKER: dict[str, Any] = {}
+
+def _init_worker(model, names, single_threaded: bool = True, explainer=None) -> None:
+    if single_threaded and "clf__n_jobs" in model.get_params():
+        model.set_params(clf__n_jobs=1)
+    _WORKER["model"] = model
+    _WORKER["names"] = names
+    _WORKER["explainer"] = explainer if explainer is not None else build_explainer(pipe=model)
+    _WORKER["reasons"] = ReasonCodeMap.from_feature_names(names) if names is not None else None
+
+def _predict_chunk(X: pd.DataFrame) -> np.ndarray:
+    return _WORKER["model"].predict_proba(X)[:, 1]
+
+def _explain_chunk(X: pd.DataFrame) -> np.ndarray:
+    return top_feature_names(
+        pipe=_WORKER["model"],
+        feature_names=_WORKER["names"],
+        explainer=_WORKER["explainer"],
+        X=X,
+    )
+
+def _explain_reasons_chunk(X: pd.DataFrame, k: int) -> np.ndarray:
+    return top_reason_indices(
+        pipe=_WORKER["model"],
+        explainer=_WORKER["explainer"],
+        X=X,
+        reasons=_WORKER["reasons"],
+        k=k,
+    )
+
+def row_ranges(n_rows: int, chunk_rows: int) -> list[tuple[int, int]]:
+    if chunk_rows <= 0:
+        raise ValueError("chunk_rows must be > 0.")
+    return [(start, min(start + chunk_rows, n_rows)) for start in range(0, n_rows, chunk_rows)]
+
+def resolve_workers(n_workers: int) -> int:
+    if n_workers < 0:
+        return os.cpu_count() or 1
+    return max(int(n_workers), 1)
+
+@dataclass
+class ParallelScorer:
+    """Score / explain row ranges in worker processes; the model (and explainer, if given) is shipped once per worker."""
+    model: Any
+    names: list[str] | None
+    explainer: Any = None
+    n_workers: int = 1
+    chunk_rows: int = 50_000
+
+    _pool: ProcessPoolExecutor | None = field(default=None, init=False, repr=False)
+    _local: bool = field(default=False, init=False, repr=False)
+
+    def _start_pool(self, workers: int) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=mp.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.model, self.names, True, self.explainer),
+        )
+
+    @contextmanager
+    def session(self) -> Iterator["ParallelScorer"]:
+        """Keep workers (model + explainer loaded once each) alive across calls, e.g. for a backfill."""
+        workers = resolve_workers(self.n_workers)
+        if workers <= 1:
+            _init_worker(self.model, self.names, single_threaded=False, explainer=self.explainer)
+            self._local = True
+        else:
+            self._pool = self._start_pool(workers)
+        try:
+            yield self
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+            if self._local:
+                _WORKER.clear()
+                self._local = False
+
+    def _map(self, fn: Callable[[pd.DataFrame], np.ndarray], X: pd.DataFrame) -> np.ndarray:
+        ranges = row_ranges(len(X), self.chunk_rows)
+        workers = min(resolve_workers(self.n_workers), len(ranges))
+
+        if self._local:
+            parts = [fn(X.iloc[start:stop]) for start, stop in ranges]
+        elif self._pool is not None:
+            parts = list(self._pool.map(fn, [X.iloc[start:stop] for start, stop in ranges]))
+        elif workers <= 1:
+            _init_worker(self.model, self.names, single_threaded=False, explainer=self.explainer)
+            try:
+                parts = [fn(X.iloc[start:stop]) for start, stop in ranges]
+            finally:
+                _WORKER.clear()
+        else:
+            with self._start_pool(workers) as pool:
+                parts = list(pool.map(fn, [X.iloc[start:stop] for start, stop in ranges]))
+
+        if not parts:
+            return np.empty(0)
+        return np.concatenate(parts)
+
+    def predict_proba(self, X: pd.DataFrame) -> np.ndarray:
+        """Positive-class probabilities in row order."""
+        return self._map(_predict_chunk, X)
+
+    def top_feature_names(self, X: pd.DataFrame) -> np.ndarray:
+        """Top contributing feature name per row, in row order."""
+        return self._map(_explain_chunk, X)
+
+    def top_reason_indices(self, X: pd.DataFrame, k: int = 3) -> np.ndarray:
+        """Top-k distinct reason indices per row (rows x k, ReasonCodeMap order), in row order."""
+        return self._map(partial(_explain_reasons_chunk, k=k), X)
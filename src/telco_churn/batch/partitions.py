@@ -0,0 +1,24 @@
+"""
+Batch partitions: one partition per batch file.
+"""
+
+import re
+from typing import Optional
+
+import dagster as dg
+
+BATCH_PARTITIONS = dg.DynamicPartitionsDefinition(name="batch")
+
+# Partition key -> bronze file in the HF dataset repo ("churn_batch" is the original single batch file).
+BATCH_FILE_TEMPLATE = "data/bronze/{partition_key}.parquet"
+
+def safe_key(raw: str) -> str:
+    """Partition key / file name reduced to characters safe for paths and batch ids."""
+    return re.sub(r"[^A-Za-z0-9_-]+", "_", raw).strip("_")
+
+def batch_partition(context) -> Optional[str]:
+    """Sanitized partition key of the running asset, or None for unpartitioned runs."""
+    return safe_key(context.partition_key) if context.has_partition_key else None
+
+def batch_file_for(partition_key: str) -> str:
+    return BATCH_FILE_TEMPLATE.format(partition_key=partition_key)
@@ -0,0 +1,97 @@
+"""
+Priority ranks for the flagged / top-K set without a full-batch sort.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+UNRANKED = 0
+
+def _select_top(proba: np.ndarray, pos: np.ndarray, k: int) -> np.ndarray:
+    """Indices (into proba / pos) of the k highest probabilities, ties broken by lower pos. O(n)."""
+    n = proba.shape[0]
+    if k >= n:
+        return np.arange(n)
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+
+    kth = np.partition(proba, n - k)[n - k]
+    above = np.flatnonzero(proba > kth)
+    ties = np.flatnonzero(proba == kth)
+    ties = ties[np.argsort(pos[ties], kind="stable")[: k - above.shape[0]]]
+    return np.concatenate([above, ties])
+
+@dataclass
+class PrioritySet:
+    """Mergeable candidate set for priority ranking.
+
+    Rows with probability >= threshold are always ranked (they are a prefix of the global
+    order), plus the top_k overall when top_k exceeds the flagged count. Chunks and worker
+    results are fed with their global row offset and pruned as they arrive, so only the
+    ranked set is ever sorted.
+    """
+    threshold: float
+    top_k: int = 0
+    proba: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64), repr=False)
+    pos: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64), repr=False)
+
+    def _size(self) -> int:
+        return max(int(np.count_nonzero(self.proba >= self.threshold)), int(self.top_k))
+
+    def _prune(self) -> "PrioritySet":
+        keep = _select_top(self.proba, self.pos, self._size())
+        self.proba = self.proba[keep]
+        self.pos = self.pos[keep]
+        return self
+
+    def update(self, proba, offset: int = 0) -> "PrioritySet":
+        p = np.asarray(proba, dtype=np.float64)
+        self.proba = np.concatenate([self.proba, p])
+        self.pos = np.concatenate([self.pos, np.arange(offset, offset + p.shape[0], dtype=np.int64)])
+        return self._prune()
+
+    def merge(self, other: "PrioritySet") -> "PrioritySet":
+        if self.threshold != other.threshold or self.top_k != other.top_k:
+            raise ValueError("Cannot merge priority sets with different threshold / top_k.")
+        return PrioritySet(
+            threshold=self.threshold,
+            top_k=self.top_k,
+            proba=np.concatenate([self.proba, other.proba]),
+            pos=np.concatenate([self.pos, other.pos]),
+        )._prune()
+
+    def positions(self) -> np.ndarray:
+        """Global row positions of the ranked set, highest priority first."""
+        return self.pos[np.lexsort((self.pos, -self.proba))]
+
+    def ranks(self, n_rows: int) -> np.ndarray:
+        """1-based int32 ranks for n_rows rows; rows outside the ranked set get UNRANKED."""
+        ranks = np.full(n_rows, UNRANKED, dtype=np.int32)
+        order = self.positions()
+        ranks[order] = np.arange(1, order.shape[0] + 1, dtype=np.int32)
+        return ranks
+
+def priority_ranks(proba, *, threshold: float, top_k: int = 0) -> np.ndarray:
+    """Exact ranks (pandas rank(method="first") on -proba) for the flagged / top_k rows, UNRANKED elsewhere."""
+    p = np.asarray(proba, dtype=np.float64)
+    return PrioritySet(threshold=threshold, top_k=top_k).update(p).ranks(p.shape[0])
+
+def rank_series(ranks: np.ndarray, index=None) -> pd.Series:
+    """Nullable Int32 priority_rank column; UNRANKED rows become <NA>."""
+    ranks = np.asarray(ranks, dtype=np.int32)
+    return pd.Series(pd.arrays.IntegerArray(ranks, ranks == UNRANKED), index=index)
+
+def rank_order(ranks) -> np.ndarray:
+    """Positions that sort rows by rank; O(n) when ranks are exactly 1..n."""
+    ranks = np.asarray(ranks, dtype=np.int64)
+    n = ranks.shape[0]
+    if n and ranks.min() == 1 and ranks.max() == n:
+        order = np.full(n, -1, dtype=np.int64)
+        order[ranks - 1] = np.arange(n)
+        if (order >= 0).all():
+            return order
+    return np.argsort(ranks, kind="stable")
@@ -2,7 +2,29 @@
 Scored batch dataframe.
 """
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+
+from telco_churn.batch.priority import priority_ranks, rank_series, UNRANKED
+
+RISK_BINS = [-1, 0.33, 0.66, 1.0]
+RISK_LABELS = ["low", "medium", "high"]
+
+SCORED_COLS = [
+    "customer_id",
+    "probability",
+    "decision",
+    "risk_bucket",
+    "priority_rank",
+]
+
+# Batch-level constants: DataFrame.attrs in memory, parquet schema metadata on disk.
+SCORED_META_KEYS = ["batch_id", "threshold"]
+
+def risk_bucket_codes(proba) -> np.ndarray:
+    """Index into RISK_LABELS per row (same right-closed bins as pd.cut over RISK_BINS)."""
+    return np.searchsorted(np.asarray(RISK_BINS[1:-1]), np.asarray(proba, dtype=np.float64), side="left").astype("int8")
 
 def build_scored_df(
     *,
@@ -10,35 +32,50 @@ def build_scored_df(
     proba: pd.Series,
     batch_id: str,
     threshold: float,
+    top_k: int = 0,
 ) -> pd.DataFrame:
-    scored = X.copy()
-    
-    scored["batch_id"] = batch_id
+    proba = np.asarray(proba, dtype=np.float64)
+    index = X.index
 
-    scored["probability"] = proba
+    scored = pd.DataFrame(
+        {
+            "customer_id": X["customer_id"].to_numpy(),
+            "probability": proba.astype("float32"),
+            "decision": (proba >= float(threshold)).astype("int8"),
+            "risk_bucket": pd.Categorical.from_codes(risk_bucket_codes(proba), categories=RISK_LABELS, ordered=True),
+            "priority_rank": rank_series(priority_ranks(proba, threshold=threshold, top_k=top_k)).array,
+        },
+        index=index,
+        copy=False,
+    )
+    scored.attrs.update({"batch_id": batch_id, "threshold": float(threshold)})
 
-    scored["threshold"] = float(threshold)
-    
-    scored["decision"] = (scored["probability"] >= scored["threshold"]).astype("int8")
+    return scored
 
-    scored["risk_bucket"] = pd.cut(
-        scored["probability"],
-        bins=[-1, 0.33, 0.66, 1.0],
-        labels=["low", "medium", "high"],
-    )
+def scored_metadata(*, batch_id: str, threshold: float) -> dict[bytes, bytes]:
+    return {b"batch_id": str(batch_id).encode(), b"threshold": repr(float(threshold)).encode()}
 
-    scored["priority_rank"] = scored["probability"].rank(
-        ascending=False,
-        method="first",
-    ).astype("int32")
-
-    cols = [
-        "batch_id",
-        "customer_id",
-        "probability",
-        "decision",
-        "threshold",
-        "risk_bucket",
-        "priority_rank",
-    ]
-    return scored[cols]
\ No newline at end of file
+def scored_table(scored: pd.DataFrame) -> pa.Table:
+    """Arrow table straight from the scored columns' buffers, batch constants in schema metadata."""
+    columns = [c for c in SCORED_COLS if c in scored.columns]
+    arrays = []
+    for c in columns:
+        col = scored[c].array
+        if c == "risk_bucket":
+            arrays.append(pa.DictionaryArray.from_arrays(
+                pa.array(np.asarray(col.codes, dtype=np.int8)),
+                pa.array(RISK_LABELS, type=pa.string()),
+                ordered=True,
+            ))
+        elif c == "priority_rank":
+            ranks = np.asarray(col.to_numpy(dtype="int32", na_value=UNRANKED))
+            arrays.append(pa.array(ranks, type=pa.int32(), mask=ranks == UNRANKED))
+        elif c == "customer_id":
+            arrays.append(pa.array(np.asarray(col, dtype=object), type=pa.string()))
+        else:
+            arrays.append(pa.array(np.asarray(col)))
+
+    table = pa.Table.from_arrays(arrays, names=columns)
+    return table.replace_schema_metadata(
+        scored_metadata(batch_id=scored.attrs["batch_id"], threshold=scored.attrs["threshold"])
+    )
@@ -0,0 +1,148 @@
+"""
+Streaming batch scoring over Arrow record batches.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from telco_churn.batch.scored import build_scored_df, scored_table, scored_metadata, SCORED_COLS
+from telco_churn.batch.action import build_actions_df, actions_cols
+from telco_churn.batch.summary import BatchSummaryAccumulator
+from telco_churn.batch.priority import PrioritySet, UNRANKED, rank_order
+from telco_churn.explainability.explain import build_explainer
+from telco_churn.explainability.reason_map import ReasonCodeMap
+
+DEFAULT_CHUNK_ROWS = 100_000
+
+@dataclass(frozen=True)
+class StreamResult:
+    rows: int
+    flagged: int
+    chunks: int
+    scored_path: Path
+    actions_path: Path
+    summary: BatchSummaryAccumulator
+
+class ParquetAppender:
+    """Append DataFrames / Arrow tables to one parquet file, schema fixed by the first write."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._writer: pq.ParquetWriter | None = None
+
+    def write(self, data: pd.DataFrame | pa.Table) -> None:
+        tbl = pa.Table.from_pandas(data, preserve_index=False) if isinstance(data, pd.DataFrame) else data
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.path, tbl.schema)
+        else:
+            tbl = tbl.cast(self._writer.schema)
+        self._writer.write_table(tbl)
+
+    def close(self, empty_columns: list[str] | None = None) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        elif empty_columns is not None:
+            pd.DataFrame(columns=empty_columns).to_parquet(self.path, index=False)
+
+def score_stream(
+    *,
+    reader: pa.RecordBatchReader,
+    model,
+    names,
+    threshold: float,
+    batch_id: str,
+    scored_path: Path,
+    actions_path: Path,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    top_k: int = 0,
+    top_reasons: int = 1,
+    explainer=None,
+) -> StreamResult:
+    scored_path = Path(scored_path)
+    actions_path = Path(actions_path)
+    scored_part = scored_path.with_name(f"{scored_path.stem}.part.parquet")
+    actions_part = actions_path.with_name(f"{actions_path.stem}.part.parquet")
+
+    scored_w = ParquetAppender(scored_part)
+    actions_w = ParquetAppender(actions_part)
+
+    priority = PrioritySet(threshold=threshold, top_k=top_k)
+    offset = 0
+    chunks = 0
+    flagged = 0
+    acc = BatchSummaryAccumulator()
+    reasons = ReasonCodeMap.from_feature_names(names)
+    explainer = explainer if explainer is not None else build_explainer(pipe=model)
+
+    try:
+        for rb in reader:
+            if rb.num_rows == 0:
+                continue
+
+            X = rb.to_pandas()
+            X.index = pd.RangeIndex(offset, offset + len(X))
+
+            proba = model.predict_proba(X)[:, 1]
+            scored = build_scored_df(X=X, proba=proba, batch_id=batch_id, threshold=threshold)
+            scored_w.write(scored_table(scored).drop_columns(["priority_rank"]))
+            acc.update_scores(scored["probability"], scored["decision"], scored["risk_bucket"].cat.codes)
+
+            actions = build_actions_df(
+                scored=scored,
+                X=X,
+                model=model,
+                names=names,
+                top_reasons=top_reasons,
+                reasons=reasons,
+                explainer=explainer,
+            )
+            if actions is not None:
+                is_flagged = scored["decision"].eq(1)
+                row_pos = pd.Series(scored.index[is_flagged], index=scored.loc[is_flagged, "customer_id"])
+                actions["row_pos"] = actions["customer_id"].map(row_pos).astype("int64")
+                actions_w.write(actions.drop(columns=["priority_rank"]))
+                acc.update_reasons(actions["reason_code"])
+                flagged += len(actions)
+
+            priority.update(proba, offset=offset)
+            offset += len(X)
+            chunks += 1
+    finally:
+        scored_w.close()
+        actions_w.close()
+
+    ranks = priority.ranks(offset)
+    meta = scored_metadata(batch_id=batch_id, threshold=threshold)
+
+    scored_out = ParquetAppender(scored_path)
+    if scored_part.exists():
+        start = 0
+        for rb in pq.ParquetFile(scored_part).iter_batches(batch_size=chunk_rows):
+            part = ranks[start:start + rb.num_rows]
+            rb = rb.append_column("priority_rank", pa.array(part, type=pa.int32(), mask=part == UNRANKED))
+            scored_out.write(pa.Table.from_batches([rb]).select(SCORED_COLS).replace_schema_metadata(meta))
+            start += rb.num_rows
+        scored_part.unlink()
+    scored_out.close(empty_columns=SCORED_COLS)
+
+    actions_out = ParquetAppender(actions_path)
+    if actions_part.exists():
+        actions = pq.read_table(actions_part).to_pandas()
+        actions["priority_rank"] = ranks[actions["row_pos"].to_numpy()]
+        actions_out.write(actions.iloc[rank_order(actions["priority_rank"])].reset_index(drop=True)[actions_cols(top_reasons)])
+        actions_part.unlink()
+    actions_out.close(empty_columns=actions_cols(top_reasons))
+
+    return StreamResult(
+        rows=offset,
+        flagged=flagged,
+        chunks=chunks,
+        scored_path=scored_path,
+        actions_path=actions_path,
+        summary=acc,
+    )
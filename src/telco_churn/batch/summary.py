@@ -2,63 +2,185 @@
 Summarize batch report.
 """
 
+from __future__ import annotations
+
+import math
+from collections import Counter
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from typing import Any, Iterable
+
+import numpy as np
 import pandas as pd
 
+from telco_churn.batch.scored import RISK_LABELS, risk_bucket_codes
+
+SKETCH_BINS = 10_000
+
+@dataclass
+class BatchSummaryAccumulator:
+    """Single-pass, mergeable batch statistics.
+
+    Scores are probabilities in [0, 1], so quantiles come from a fixed-width histogram
+    (SKETCH_BINS bins, error <= 1 / SKETCH_BINS). Every field merges by addition, so
+    merging chunk / worker / batch accumulators is exact and order independent.
+    """
+    bins: int = SKETCH_BINS
+    count: int = 0
+    flagged: int = 0
+    prob_sum: float = 0.0
+    hist: np.ndarray = field(default=None, repr=False)
+    bucket_counts: Counter = field(default_factory=Counter)
+    reason_counts: Counter = field(default_factory=Counter)
+
+    def __post_init__(self):
+        if self.hist is None:
+            self.hist = np.zeros(self.bins, dtype=np.int64)
+
+    def update_scores(self, probability, decision, risk_codes=None) -> "BatchSummaryAccumulator":
+        p = np.asarray(probability, dtype=np.float64)
+        if p.size == 0:
+            return self
+
+        self.count += int(p.size)
+        self.flagged += int(np.count_nonzero(np.asarray(decision)))
+        self.prob_sum = math.fsum([self.prob_sum, math.fsum(p)])
+
+        idx = np.clip((p * self.bins).astype(np.int64), 0, self.bins - 1)
+        self.hist += np.bincount(idx, minlength=self.bins)
+
+        bucket = risk_bucket_codes(p) if risk_codes is None else np.asarray(risk_codes)
+        for i, n in enumerate(np.bincount(bucket, minlength=len(RISK_LABELS))):
+            self.bucket_counts[RISK_LABELS[i]] += int(n)
+        return self
+
+    def update_reasons(self, reason_codes: Iterable) -> "BatchSummaryAccumulator":
+        counts = pd.Series(reason_codes).astype(str).value_counts()
+        self.reason_counts.update({code: int(n) for code, n in counts.items()})
+        return self
+
+    def merge(self, other: "BatchSummaryAccumulator") -> "BatchSummaryAccumulator":
+        if self.bins != other.bins:
+            raise ValueError(f"Cannot merge sketches with {self.bins} and {other.bins} bins")
+        return BatchSummaryAccumulator(
+            bins=self.bins,
+            count=self.count + other.count,
+            flagged=self.flagged + other.flagged,
+            prob_sum=math.fsum([self.prob_sum, other.prob_sum]),
+            hist=self.hist + other.hist,
+            bucket_counts=self.bucket_counts + other.bucket_counts,
+            reason_counts=self.reason_counts + other.reason_counts,
+        )
+
+    def mean(self) -> float:
+        return float(self.prob_sum / self.count) if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Linear-interpolated quantile (pandas convention) read off the histogram."""
+        if not self.count:
+            return 0.0
+        rank = q * (self.count - 1)
+        cum = np.cumsum(self.hist)
+        b = int(np.searchsorted(cum, rank, side="right"))
+        before = int(cum[b - 1]) if b else 0
+        frac = (rank - before + 0.5) / int(self.hist[b])
+        return float(min((b + frac) / self.bins, 1.0))
+
+    def top_reason_codes(self, top_k: int = 3) -> list[dict]:
+        actions_count = sum(self.reason_counts.values())
+        ranked = sorted(self.reason_counts.items(), key=lambda kv: (-kv[1], kv[0]))
+        return [
+            {"reason_code": code, "count": int(cnt), "share": float(cnt / actions_count)}
+            for code, cnt in ranked[:top_k]
+        ]
+
+    def to_dict(self) -> dict[str, Any]:
+        nz = np.flatnonzero(self.hist)
+        return {
+            "bins": int(self.bins),
+            "count": int(self.count),
+            "flagged": int(self.flagged),
+            "prob_sum": float(self.prob_sum),
+            "hist_index": nz.tolist(),
+            "hist_count": self.hist[nz].tolist(),
+            "bucket_counts": dict(self.bucket_counts),
+            "reason_counts": dict(self.reason_counts),
+        }
+
+    @classmethod
+    def from_dict(cls, d: dict[str, Any]) -> "BatchSummaryAccumulator":
+        hist = np.zeros(int(d["bins"]), dtype=np.int64)
+        hist[np.asarray(d["hist_index"], dtype=np.int64)] = np.asarray(d["hist_count"], dtype=np.int64)
+        return cls(
+            bins=int(d["bins"]),
+            count=int(d["count"]),
+            flagged=int(d["flagged"]),
+            prob_sum=float(d["prob_sum"]),
+            hist=hist,
+            bucket_counts=Counter(d.get("bucket_counts", {})),
+            reason_counts=Counter(d.get("reason_counts", {})),
+        )
+
+    def summary(
+        self,
+        *,
+        batch_id: str,
+        model_version: str,
+        threshold: float,
+        top_k: int = 3,
+    ) -> dict:
+        total_scored = int(self.count)
+        flagged_count = int(self.flagged)
+
+        return {
+            "batch_id": batch_id,
+            "scored_at_utc": datetime.now(timezone.utc).isoformat(),
+            "model_version": model_version,
+            "threshold": float(threshold),
+
+            "total_scored": total_scored,
+            "flagged_count": flagged_count,
+            "flag_rate": float(flagged_count / total_scored) if total_scored else 0.0,
+
+            "score_mean": self.mean(),
+            "score_median": self.quantile(0.5),
+            "score_p95": self.quantile(0.95),
+
+            "risk_bucket_counts": {label: int(self.bucket_counts.get(label, 0)) for label in RISK_LABELS},
+
+            "actions_count": int(sum(self.reason_counts.values())),
+            "top_reason_codes": self.top_reason_codes(top_k),
+
+            "accumulator": self.to_dict(),
+        }
+
+def merge_summaries(summaries: Iterable[dict]) -> BatchSummaryAccumulator:
+    """Roll up summary.json payloads (e.g. across batches) into one accumulator."""
+    acc = BatchSummaryAccumulator()
+    for s in summaries:
+        acc = acc.merge(BatchSummaryAccumulator.from_dict(s["accumulator"]))
+    return acc
+
 def build_batch_summary_core(
     *,
     batch_id: str,
     model_version: str,
     threshold: float,
     scored: pd.DataFrame,
-    actions: pd.DataFrame,
+    actions: pd.DataFrame | None,
     top_k: int = 3,
 ) -> dict:
-    total_scored = int(len(scored))
-    flagged_count = int(scored["decision"].sum())
-    flag_rate = float(flagged_count / total_scored) if total_scored else 0.0
-
-    s = scored["probability"].astype(float)
-    score_mean = float(s.mean()) if total_scored else 0.0
-    score_median = float(s.median()) if total_scored else 0.0
-    score_p95 = float(s.quantile(0.95)) if total_scored else 0.0
-
-    bucket_counts = scored["risk_bucket"].astype("string").value_counts().to_dict()
-    risk_bucket_counts = {
-        "low": int(bucket_counts.get("low", 0)),
-        "medium": int(bucket_counts.get("medium", 0)),
-        "high": int(bucket_counts.get("high", 0)),
-    }
-
-    actions_count = int(len(actions))
-
-    if actions_count and "reason_code" in actions.columns:
-        rc = actions["reason_code"].astype("string").value_counts()
-        top_reason_codes = [
-            {"reason_code": str(code), "count": int(cnt), "share": float(cnt / actions_count)}
-            for code, cnt in rc.head(top_k).items()
-        ]
-    else:
-        top_reason_codes = []
-
-    return {
-        "batch_id": batch_id,
-        "scored_at_utc": datetime.now(timezone.utc).isoformat(),
-        "model_version": model_version,
-        "threshold": float(threshold),
-
-        "total_scored": total_scored,
-        "flagged_count": flagged_count,
-        "flag_rate": float(flag_rate),
-
-        "score_mean": float(score_mean),
-        "score_median": float(score_median),
-        "score_p95": float(score_p95),
-
-        "risk_bucket_counts": risk_bucket_counts,
-
-        "actions_count": actions_count,
-        "top_reason_codes": top_reason_codes,
-    }
-
+    acc = BatchSummaryAccumulator().update_scores(
+        scored["probability"],
+        scored["decision"],
+        scored["risk_bucket"].cat.codes,
+    )
+    if actions is not None and "reason_code" in actions.columns:
+        acc.update_reasons(actions["reason_code"])
 
+    return acc.summary(
+        batch_id=batch_id,
+        model_version=model_version,
+        threshold=threshold,
+        top_k=top_k,
+    )
@@ -0,0 +1,35 @@
+"""
+Upload batch report files to the hugging face reports archive.
+"""
+
+from pathlib import Path
+from telco_churn.batch.latest_batch import write_latest_pointer
+
+def upload_batch_files(*, hf_data, batch_report: dict, reports_root: Path, update_latest: bool = True) -> dict:
+    hf_batch_path = batch_report["hf_batch_path"]
+    batch_id = batch_report["batch_id"]
+
+    files = {
+        f"{hf_batch_path}/scored.parquet": str(batch_report["scored_path"]),
+        f"{hf_batch_path}/actions.parquet": str(batch_report["actions_path"]),
+        f"{hf_batch_path}/summary.json": str(batch_report["summary_path"]),
+    }
+
+    if update_latest:
+        latest_local = write_latest_pointer(
+            reports_root=Path(reports_root),
+            batch_id=batch_id,
+        )
+        files["reports/latest.json"] = str(latest_local)
+
+    hf_data.upload_files(files, commit_message=f"Upload batch report {batch_id}")
+
+    uploaded = {
+        "hf_batch_path": hf_batch_path,
+        "scored_hf": f"{hf_batch_path}/scored.parquet",
+        "actions_hf": f"{hf_batch_path}/actions.parquet",
+        "summary_hf": f"{hf_batch_path}/summary.json",
+    }
+    if update_latest:
+        uploaded["latest_hf"] = "reports/latest.json"
+    return uploaded
@@ -2,8 +2,20 @@
 Data parquet to DB table.
 """
 
-import duckdb
+import glob
+import hashlib
+import os
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Iterable
+
+import duckdb
+import pyarrow.parquet as pq
+
+MANIFEST_TABLE = "bronze.ingest_manifest"
+SOURCE_FILE_COL = "source_file"
+INGESTED_AT_COL = "ingested_at"
 
 def build_bronze(con: duckdb.DuckDBPyConnection, parquet_path: str, bronze_table: str) -> str:
     if not Path(parquet_path).exists():
@@ -19,3 +31,156 @@ def build_bronze(con: duckdb.DuckDBPyConnection, parquet_path: str, bronze_table
 
 
     return bronze_table
+
+@dataclass
+class IngestResult:
+    table: str
+    new_files: list[str] = field(default_factory=list)
+    replaced_files: list[str] = field(default_factory=list)
+    skipped_files: list[str] = field(default_factory=list)
+    rows_added: int = 0
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.new_files or self.replaced_files)
+
+def resolve_parquet_files(sources: str | Path | Iterable[str | Path]) -> list[Path]:
+    """Parquet files under directories, matching globs, or given directly (absolute, de-duplicated, sorted)."""
+    if isinstance(sources, (str, Path)):
+        sources = [sources]
+
+    files: set[Path] = set()
+    for src in sources:
+        p = Path(src)
+        if p.is_dir():
+            matches = list(p.rglob("*.parquet"))
+        elif glob.has_magic(str(src)):
+            matches = [Path(m) for m in glob.glob(str(src), recursive=True)]
+        elif p.exists():
+            matches = [p]
+        else:
+            raise FileNotFoundError(f"Parquet not found: {src}")
+        if not matches:
+            raise FileNotFoundError(f"No parquet files match: {src}")
+        files.update(m.resolve() for m in matches)
+    return sorted(files)
+
+def file_hash(path: Path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+def table_columns(con: duckdb.DuckDBPyConnection, table: str) -> list[str] | None:
+    schema, _, name = table.rpartition(".")
+    rows = con.execute(
+        "SELECT column_name FROM duckdb_columns() "
+        "WHERE database_name = current_database() AND schema_name = ? AND table_name = ?",
+        [schema or "main", name],
+    ).fetchall()
+    return [r[0] for r in rows] or None
+
+def _ensure_manifest(con: duckdb.DuckDBPyConnection, manifest_table: str) -> None:
+    con.execute(f"""
+        CREATE TABLE IF NOT EXISTS {manifest_table} (
+            target_table VARCHAR,
+            path VARCHAR,
+            size BIGINT,
+            mtime DOUBLE,
+            content_hash VARCHAR,
+            row_count BIGINT,
+            ingested_at TIMESTAMP,
+            PRIMARY KEY (target_table, path)
+        )
+    """)
+
+def manifest_entries(
+    con: duckdb.DuckDBPyConnection,
+    bronze_table: str,
+    *,
+    manifest_table: str = MANIFEST_TABLE,
+) -> list[tuple[str, str]]:
+    """(path, content_hash) of every file ingested into bronze_table, by path."""
+    return con.execute(
+        f"SELECT path, content_hash FROM {manifest_table} WHERE target_table = ? ORDER BY path",
+        [bronze_table],
+    ).fetchall()
+
+def ingest_bronze_incremental(
+    con: duckdb.DuckDBPyConnection,
+    sources: str | Path | Iterable[str | Path],
+    bronze_table: str,
+    *,
+    manifest_table: str = MANIFEST_TABLE,
+) -> IngestResult:
+    """Append parquet drops to bronze_table, recording each file in the manifest.
+
+    Files already in the manifest with the same content are skipped (size + mtime first, content hash
+    when those differ); a file whose content changed has its previous rows replaced. Rows are tagged
+    with source_file and ingested_at. A bronze_table without source_file (e.g. built by build_bronze)
+    is rebuilt from the given files.
+    """
+    files = resolve_parquet_files(sources)
+    result = IngestResult(table=bronze_table)
+
+    con.execute("CREATE SCHEMA IF NOT EXISTS bronze;")
+    _ensure_manifest(con, manifest_table)
+
+    ingested_at = datetime.now(timezone.utc).replace(tzinfo=None)
+    con.execute("BEGIN;")
+    try:
+        columns = table_columns(con, bronze_table)
+        table_exists = columns is not None and SOURCE_FILE_COL in columns
+        if not table_exists:
+            con.execute(f"DELETE FROM {manifest_table} WHERE target_table = ?", [bronze_table])
+            con.execute(f"DROP TABLE IF EXISTS {bronze_table}")
+
+        known = {
+            path: (size, mtime, content_hash)
+            for path, size, mtime, content_hash in con.execute(
+                f"SELECT path, size, mtime, content_hash FROM {manifest_table} WHERE target_table = ?",
+                [bronze_table],
+            ).fetchall()
+        }
+
+        for path in files:
+            key = str(path)
+            st = os.stat(path)
+            prev = known.get(key)
+            if prev is not None and prev[0] == st.st_size and prev[1] == st.st_mtime:
+                result.skipped_files.append(key)
+                continue
+
+            digest = file_hash(path)
+            if prev is not None and prev[2] == digest:
+                con.execute(
+                    f"UPDATE {manifest_table} SET size = ?, mtime = ? WHERE target_table = ? AND path = ?",
+                    [st.st_size, st.st_mtime, bronze_table, key],
+                )
+                result.skipped_files.append(key)
+                continue
+
+            select = (
+                f"SELECT *, ?::VARCHAR AS {SOURCE_FILE_COL}, ?::TIMESTAMP AS {INGESTED_AT_COL} "
+                "FROM read_parquet(?)"
+            )
+            params = [key, ingested_at, key]
+            if not table_exists:
+                con.execute(f"CREATE TABLE {bronze_table} AS {select}", params)
+                table_exists = True
+            else:
+                if prev is not None:
+                    con.execute(f"DELETE FROM {bronze_table} WHERE {SOURCE_FILE_COL} = ?", [key])
+                con.execute(f"INSERT INTO {bronze_table} BY NAME {select}", params)
+
+            rows = pq.read_metadata(path).num_rows
+            con.execute(
+                f"INSERT OR REPLACE INTO {manifest_table} VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [bronze_table, key, st.st_size, st.st_mtime, digest, rows, ingested_at],
+            )
+            (result.replaced_files if prev is not None else result.new_files).append(key)
+            result.rows_added += rows
+        con.execute("COMMIT;")
+    except Exception:
+        con.execute("ROLLBACK;")
+        raise
+
+    return result
@@ -0,0 +1,79 @@
+"""
+Fused bronze -> silver -> gold: the layer SQL as a chain of DuckDB views over read_parquet.
+
+DuckDB inlines the views into whichever statement reads the last layer, so the whole transform
+runs as one pipelined query (projection pushed down into the parquet scan) and only the final
+layer is materialized, if anything.
+"""
+
+import duckdb
+
+from telco_churn.db.executor import SQLExecutor
+
+SILVER_SQL_PKG = "telco_churn.data_layers.silver"
+GOLD_SQL_PKG = "telco_churn.data_layers.gold"
+BASE_SQL_FILE = "base.sql"
+FEATURES_SQL_FILE = "features.sql"
+
+def as_view(sql: str, table: str) -> str:
+    """Layer SQL with its CREATE OR REPLACE TABLE <table> AS turned into a view definition."""
+    create = f"CREATE OR REPLACE TABLE {table} AS"
+    if create not in sql:
+        raise ValueError(f"Layer SQL does not create {table}")
+    return sql.replace(create, f"CREATE OR REPLACE VIEW {table} AS", 1)
+
+def _sql_str(value: str) -> str:
+    return "'" + str(value).replace("'", "''") + "'"
+
+def drop_relation(con: duckdb.DuckDBPyConnection, name: str) -> None:
+    """Drop name whether it is currently a table or a view (switching between fused and layered runs)."""
+    schema, _, rel = name.rpartition(".")
+    row = con.execute(
+        "SELECT 'TABLE' FROM duckdb_tables() WHERE database_name = current_database() AND schema_name = ? AND table_name = ? "
+        "UNION ALL "
+        "SELECT 'VIEW' FROM duckdb_views() WHERE database_name = current_database() AND schema_name = ? AND view_name = ?",
+        [schema or "main", rel, schema or "main", rel],
+    ).fetchone()
+    if row is not None:
+        con.execute(f"DROP {row[0]} {name}")
+
+def bronze_view(con: duckdb.DuckDBPyConnection, parquet_path: str, bronze_table: str) -> str:
+    con.execute("CREATE SCHEMA IF NOT EXISTS bronze;")
+    drop_relation(con, bronze_table)
+    con.execute(f"CREATE VIEW {bronze_table} AS SELECT * FROM read_parquet({_sql_str(parquet_path)})")
+    return bronze_table
+
+def silver_view(con: duckdb.DuckDBPyConnection, bronze_table: str, base_table: str) -> str:
+    ex = SQLExecutor(con)
+    sql = ex.load_sql(SILVER_SQL_PKG, BASE_SQL_FILE).format(base_table=base_table, bronze_table=bronze_table)
+    drop_relation(con, base_table)
+    ex.execute_script(as_view(sql, base_table))
+    return base_table
+
+def gold_features(
+    con: duckdb.DuckDBPyConnection,
+    base_table: str,
+    features_table: str,
+    *,
+    materialize: bool = True,
+) -> str:
+    """gold features over base_table as a table, or as a view that is computed by whoever reads it."""
+    ex = SQLExecutor(con)
+    sql = ex.load_sql(GOLD_SQL_PKG, FEATURES_SQL_FILE).format(features_table=features_table, base_table=base_table)
+    drop_relation(con, features_table)
+    ex.execute_script(sql if materialize else as_view(sql, features_table))
+    return features_table
+
+def build_fused_gold(
+    con: duckdb.DuckDBPyConnection,
+    parquet_path: str,
+    *,
+    bronze_table: str,
+    base_table: str,
+    features_table: str,
+    materialize: bool = True,
+) -> str:
+    """parquet -> gold with bronze and silver as views; one query when gold is materialized."""
+    bronze_view(con, parquet_path, bronze_table)
+    silver_view(con, bronze_table, base_table)
+    return gold_features(con, base_table, features_table, materialize=materialize)
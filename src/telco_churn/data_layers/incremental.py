@@ -0,0 +1,263 @@
+"""
+Incremental silver / labels / gold builds over an incrementally ingested bronze table.
+
+Each built table has a row in layer_state: the hash of the SQL it was built with, a version that
+is bumped on every change, how it was last built, and (for bronze-fed tables) the bronze
+ingested_at watermark and row count it covers. A layer falls back to a full rebuild whenever its
+SQL changed, its table is gone, or its source cannot be diffed (no ingested_at column, bronze rows
+at or below the watermark were replaced, upstream skipped a version).
+"""
+
+import hashlib
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Iterator, Optional
+
+import duckdb
+
+from telco_churn.data_layers.bronze.ingest import INGESTED_AT_COL, table_columns
+
+LAYER_STATE_TABLE = "layer_state"
+
+FULL = "full"
+INCREMENTAL = "incremental"
+UNCHANGED = "unchanged"
+
+@dataclass(frozen=True)
+class LayerState:
+    sql_hash: str
+    version: int
+    mode: str
+    source_version: Optional[int]
+    watermark: Optional[datetime]
+    source_rows: Optional[int]
+
+@dataclass(frozen=True)
+class LayerBuild:
+    table: str
+    mode: str
+    version: int
+    rows_changed: Optional[int] = None
+
+def sql_version(*templates: str) -> str:
+    h = hashlib.sha256()
+    for template in templates:
+        h.update(template.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+def delta_table_for(table: str) -> str:
+    return f"{table}__delta"
+
+def changed_table_for(table: str) -> str:
+    """Keys (customer_id) whose rows changed in the last incremental build of table."""
+    return f"{table}__changed"
+
+@contextmanager
+def _transaction(con: duckdb.DuckDBPyConnection) -> Iterator[None]:
+    con.execute("BEGIN;")
+    try:
+        yield
+        con.execute("COMMIT;")
+    except Exception:
+        con.execute("ROLLBACK;")
+        raise
+
+def _ensure_state(con: duckdb.DuckDBPyConnection) -> None:
+    con.execute(f"""
+        CREATE TABLE IF NOT EXISTS {LAYER_STATE_TABLE} (
+            target_table VARCHAR PRIMARY KEY,
+            sql_hash VARCHAR,
+            version BIGINT,
+            mode VARCHAR,
+            source_version BIGINT,
+            watermark TIMESTAMP,
+            source_rows BIGINT,
+            built_at TIMESTAMP
+        )
+    """)
+
+def read_layer_state(con: duckdb.DuckDBPyConnection, table: str) -> Optional[LayerState]:
+    _ensure_state(con)
+    row = con.execute(
+        f"SELECT sql_hash, version, mode, source_version, watermark, source_rows "
+        f"FROM {LAYER_STATE_TABLE} WHERE target_table = ?",
+        [table],
+    ).fetchone()
+    return LayerState(*row) if row is not None else None
+
+def _write_state(
+    con: duckdb.DuckDBPyConnection,
+    table: str,
+    prev: Optional[LayerState],
+    *,
+    sql_hash: str,
+    mode: str,
+    source_version: Optional[int] = None,
+    watermark: Optional[datetime] = None,
+    source_rows: Optional[int] = None,
+) -> int:
+    version = prev.version + 1 if prev is not None else 1
+    con.execute(
+        f"INSERT OR REPLACE INTO {LAYER_STATE_TABLE} VALUES (?, ?, ?, ?, ?, ?, ?, current_timestamp)",
+        [table, sql_hash, version, mode, source_version, watermark, source_rows],
+    )
+    return version
+
+def _ts(x: datetime) -> str:
+    return f"TIMESTAMP '{x.isoformat(sep=' ')}'"
+
+def _key_match(keys_table: str, table: str) -> str:
+    return f"EXISTS (SELECT 1 FROM {keys_table} k WHERE k.customer_id IS NOT DISTINCT FROM {table}.customer_id)"
+
+def _bronze_watermark(con: duckdb.DuckDBPyConnection, bronze_table: str) -> tuple[Optional[datetime], Optional[int]]:
+    if INGESTED_AT_COL not in (table_columns(con, bronze_table) or []):
+        return None, None
+    watermark, rows = con.execute(f"SELECT max({INGESTED_AT_COL}), count(*) FROM {bronze_table}").fetchone()
+    return watermark, rows
+
+def _appendable(
+    con: duckdb.DuckDBPyConnection,
+    bronze_table: str,
+    table: str,
+    state: Optional[LayerState],
+    sql_hash: str,
+) -> bool:
+    """True when table can be brought up to date from bronze rows past its watermark alone."""
+    if state is None or state.sql_hash != sql_hash or state.watermark is None:
+        return False
+    if table_columns(con, table) is None:
+        return False
+    if INGESTED_AT_COL not in (table_columns(con, bronze_table) or []):
+        return False
+    (covered,) = con.execute(
+        f"SELECT count(*) FROM {bronze_table} WHERE {INGESTED_AT_COL} <= ?", [state.watermark]
+    ).fetchone()
+    return covered == state.source_rows
+
+def _build_from_bronze(
+    con: duckdb.DuckDBPyConnection,
+    *,
+    bronze_table: str,
+    table: str,
+    sql_hash: str,
+    render: Callable[[str, str], str],
+    apply_delta: Callable[[str], int],
+) -> LayerBuild:
+    """render(target_table, bronze_source) gives the layer SQL; apply_delta(delta_table) folds a delta into table."""
+    _ensure_state(con)
+    with _transaction(con):
+        state = read_layer_state(con, table)
+        watermark, source_rows = _bronze_watermark(con, bronze_table)
+
+        if _appendable(con, bronze_table, table, state, sql_hash):
+            if watermark == state.watermark:
+                return LayerBuild(table=table, mode=UNCHANGED, version=state.version, rows_changed=0)
+            delta = delta_table_for(table)
+            source = (
+                f"(SELECT * FROM {bronze_table} "
+                f"WHERE {INGESTED_AT_COL} > {_ts(state.watermark)} AND {INGESTED_AT_COL} <= {_ts(watermark)})"
+            )
+            con.execute(render(delta, source))
+            rows_changed = apply_delta(delta)
+            mode = INCREMENTAL
+        else:
+            con.execute(render(table, bronze_table))
+            rows_changed = None
+            mode = FULL
+
+        version = _write_state(
+            con, table, state, sql_hash=sql_hash, mode=mode, watermark=watermark, source_rows=source_rows,
+        )
+    return LayerBuild(table=table, mode=mode, version=version, rows_changed=rows_changed)
+
+def _keyed_merge(con: duckdb.DuckDBPyConnection, merge_template: str, table: str) -> Callable[[str], int]:
+    """apply_delta running merge.sql into table; returns the number of customer_ids whose row changed."""
+    changed = changed_table_for(table)
+
+    def merge(delta: str) -> int:
+        con.execute(merge_template.format(base_table=table, delta_table=delta, changed_table=changed))
+        return con.execute(f"SELECT count(*) FROM {changed}").fetchone()[0]
+
+    return merge
+
+def build_silver_base(
+    con: duckdb.DuckDBPyConnection,
+    base_template: str,
+    merge_template: str,
+    *,
+    bronze_table: str,
+    base_table: str,
+) -> LayerBuild:
+    """base.sql over new bronze rows only, merged into base_table keyed on customer_id."""
+    return _build_from_bronze(
+        con,
+        bronze_table=bronze_table,
+        table=base_table,
+        sql_hash=sql_version(base_template, merge_template),
+        render=lambda target, source: base_template.format(base_table=target, bronze_table=source),
+        apply_delta=_keyed_merge(con, merge_template, base_table),
+    )
+
+def build_labels(
+    con: duckdb.DuckDBPyConnection,
+    template: str,
+    merge_template: str,
+    *,
+    bronze_table: str,
+    labels_table: str,
+) -> LayerBuild:
+    """label.sql over new bronze rows only, upserted into labels_table by customer_id with merge.sql."""
+    return _build_from_bronze(
+        con,
+        bronze_table=bronze_table,
+        table=labels_table,
+        sql_hash=sql_version(template, merge_template),
+        render=lambda target, source: template.format(labels_table=target, bronze_table=source),
+        apply_delta=_keyed_merge(con, merge_template, labels_table),
+    )
+
+def build_gold_features(
+    con: duckdb.DuckDBPyConnection,
+    template: str,
+    *,
+    base_table: str,
+    features_table: str,
+) -> LayerBuild:
+    """features.sql for the customer_ids changed by the last incremental silver build, else in full."""
+    sql_hash = sql_version(template)
+    _ensure_state(con)
+    with _transaction(con):
+        state = read_layer_state(con, features_table)
+        base = read_layer_state(con, base_table)
+        in_sync = (
+            state is not None
+            and base is not None
+            and state.sql_hash == sql_hash
+            and table_columns(con, features_table) is not None
+        )
+
+        if in_sync and state.source_version == base.version:
+            return LayerBuild(table=features_table, mode=UNCHANGED, version=state.version, rows_changed=0)
+
+        if in_sync and base.mode == INCREMENTAL and state.source_version == base.version - 1:
+            changed = changed_table_for(base_table)
+            delta = delta_table_for(features_table)
+            source = f"(SELECT * FROM {base_table} WHERE {_key_match(changed, base_table)})"
+            con.execute(template.format(features_table=delta, base_table=source))
+            con.execute(f"DELETE FROM {features_table} WHERE {_key_match(changed, features_table)}")
+            con.execute(f"INSERT INTO {features_table} BY NAME SELECT * FROM {delta}")
+            con.execute(f"DROP TABLE {delta}")
+            (rows_changed,) = con.execute(f"SELECT count(*) FROM {changed}").fetchone()
+            mode = INCREMENTAL
+        else:
+            con.execute(template.format(features_table=features_table, base_table=base_table))
+            rows_changed = None
+            mode = FULL
+
+        version = _write_state(
+            con, features_table, state,
+            sql_hash=sql_hash, mode=mode, source_version=base.version if base is not None else None,
+        )
+    return LayerBuild(table=features_table, mode=mode, version=version, rows_changed=rows_changed)
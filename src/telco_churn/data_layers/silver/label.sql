@@ -1,13 +1,42 @@
--- Customer-level churn label (0/1) keyed by customer_id.
+-- Customer-level churn label (0/1) keyed by customer_id, one row per customer.
+-- Duplicates are resolved with the validation and precedence of base.sql (highest total_charges, then tenure),
+-- which are kept as columns so merge.sql can upsert new labels the same way.
 
 CREATE SCHEMA IF NOT EXISTS silver;
 
-CREATE OR REPLACE TABLE silver.labels AS
+CREATE OR REPLACE TABLE {labels_table} AS
+WITH typed AS (
+  SELECT
+    trim(customerID) AS customer_id,
+    CASE
+      WHEN lower(trim(Churn)) = 'yes' THEN 1
+      WHEN lower(trim(Churn)) = 'no'  THEN 0
+      ELSE NULL
+    END AS churn,
+    TRY_CAST(tenure       AS INTEGER) AS tenure,
+    TRY_CAST(TotalCharges AS DOUBLE)  AS total_charges
+  FROM {bronze_table}
+),
+validated AS (
+  SELECT
+    customer_id,
+    churn,
+    CASE WHEN tenure BETWEEN 0 AND 72 THEN tenure ELSE NULL END AS tenure,
+    CASE WHEN total_charges BETWEEN 18.8 AND 8684.8 THEN total_charges ELSE NULL END AS total_charges
+  FROM typed
+)
 SELECT
-  trim(customerID) AS customer_id,
-  CASE
-    WHEN lower(trim(Churn)) = 'yes' THEN 1
-    WHEN lower(trim(Churn)) = 'no'  THEN 0
-    ELSE NULL
-  END AS churn
-FROM bronze.train;
\ No newline at end of file
+  customer_id,
+  churn,
+  total_charges,
+  tenure
+FROM (
+  SELECT
+    validated.*,
+    ROW_NUMBER() OVER (
+      PARTITION BY customer_id
+      ORDER BY total_charges DESC NULLS LAST, tenure DESC NULLS LAST
+    ) AS rn
+  FROM validated
+)
+WHERE rn = 1;
@@ -0,0 +1,40 @@
+-- Merge deduplicated new rows ({delta_table}, built by base.sql or label.sql) into {base_table} with the same precedence as base.sql;
+-- customer_ids whose row changed are written to {changed_table}.
+
+CREATE OR REPLACE TEMP TABLE silver_merge_winners AS
+SELECT * EXCLUDE (rn)
+FROM (
+  SELECT
+    candidates.*,
+    ROW_NUMBER() OVER (
+      PARTITION BY customer_id
+      ORDER BY total_charges DESC NULLS LAST, tenure DESC NULLS LAST, merge_src
+    ) AS rn
+  FROM (
+    SELECT b.*, 0 AS merge_src
+    FROM {base_table} b
+    WHERE EXISTS (SELECT 1 FROM {delta_table} d WHERE d.customer_id IS NOT DISTINCT FROM b.customer_id)
+    UNION ALL BY NAME
+    SELECT d.*, 1 AS merge_src
+    FROM {delta_table} d
+  ) candidates
+)
+WHERE rn = 1;
+
+CREATE OR REPLACE TABLE {changed_table} AS
+SELECT customer_id
+FROM silver_merge_winners
+WHERE merge_src = 1;
+
+DELETE FROM {base_table}
+WHERE EXISTS (
+  SELECT 1 FROM {changed_table} c WHERE c.customer_id IS NOT DISTINCT FROM {base_table}.customer_id
+);
+
+INSERT INTO {base_table} BY NAME
+SELECT * EXCLUDE (merge_src)
+FROM silver_merge_winners
+WHERE merge_src = 1;
+
+DROP TABLE silver_merge_winners;
+DROP TABLE {delta_table};
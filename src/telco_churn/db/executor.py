@@ -7,12 +7,13 @@ from importlib.resources import files
 from typing import Any
 
 import duckdb
+import pyarrow as pa
 
 Params = tuple[Any, ...] | list[Any] | dict[str, Any] | None
 
 @dataclass
 class SQLExecutor:
-    """Wrapper around a DuckDB connection (load SQL, run statements, export parquet)."""
+    """Wrapper around a DuckDB connection (load SQL, run statements, stream Arrow batches, export parquet)."""
     con: duckdb.DuckDBPyConnection
 
     def load_sql(self, package: str, filename: str) -> str:
@@ -33,6 +34,11 @@ class SQLExecutor:
             self.con.execute("ROLLBACK;")
             raise
 
+    def record_batches(self, select_sql: str, batch_size: int) -> pa.RecordBatchReader:
+        cur = self.con.execute(select_sql)
+        to_reader = getattr(cur, "to_arrow_reader", None) or cur.fetch_record_batch
+        return to_reader(batch_size)
+
     def write_parquet(self, select_sql: str, out_path: str) -> None:
         stmt = f"COPY ({select_sql}) TO '{out_path}' (FORMAT PARQUET)"
         self.execute(stmt)
\ No newline at end of file
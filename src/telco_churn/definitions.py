@@ -9,12 +9,14 @@ from telco_churn.assets.train import TRAIN_ASSET_MODULES
 from telco_churn.assets.etl import DATA_ASSET_MODULES
 from telco_churn.assets.promotion import PROMOTION_ASSET_MODULES
 
-from telco_churn.jobs import etl, batch, train, promotion
+from telco_churn.jobs import etl, batch, batch_stream, batch_backfill, train, promotion
 from telco_churn.resources.duckdb import DuckDBResource
 from telco_churn.resources.data import HFDataResource
 from telco_churn.resources.model import HFModelResource
 from telco_churn.resources.batch import BatchContextResource
+from telco_churn.resources.scoring import ScoringResource
 from telco_churn.resources.train import TrainConfig
+from telco_churn.resources.metadata import MetadataResource
 from telco_churn.config import REPO_ID, REVISION
 
 
@@ -27,12 +29,14 @@ all_assets = dg.load_assets_from_modules(
 
 defs = dg.Definitions(
     assets=all_assets,
-    jobs=[etl, batch, train, promotion],
+    jobs=[etl, batch, batch_stream, batch_backfill, train, promotion],
     resources={
         "hf_data": HFDataResource(repo_id=REPO_ID, revision=REVISION),
         "hf_model": HFModelResource(repo_id=REPO_ID, revision=REVISION),
         "batch_ctx": BatchContextResource(repo_root=".", reports_dirname="reports"),
         "db": DuckDBResource(path="data/telco.duckdb"),
-        "train_cfg": TrainConfig()
+        "scoring": ScoringResource(),
+        "train_cfg": TrainConfig(),
+        "meta": MetadataResource(),
     },
 )
@@ -0,0 +1,172 @@
+"""Explainer backends: native booster contributions, closed-form linear contributions, shap fallback."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Type
+
+import joblib
+import numpy as np
+
+EXPLAINER_FILE = "explainer.joblib"
+
+
+def _dense(X_t) -> np.ndarray:
+    if hasattr(X_t, "toarray"):
+        X_t = X_t.toarray()
+    return np.asarray(X_t, dtype=np.float64)
+
+
+@dataclass(slots=True)
+class LGBContribExplainer:
+    """LightGBM TreeSHAP contributions via booster.predict(pred_contrib=True)."""
+    clf: Any
+
+    @staticmethod
+    def supports(clf) -> bool:
+        from lightgbm import LGBMClassifier
+        from telco_churn.modeling.bundle.split_model import NativeLGBClassifier
+        return isinstance(clf, (LGBMClassifier, NativeLGBClassifier))
+
+    def export_state(self) -> Any:
+        return None
+
+    @classmethod
+    def from_state(cls, clf, state: Any):
+        return cls(clf)
+
+    def shap_values(self, X_t) -> np.ndarray:
+        contrib = self.clf.booster_.predict(_dense(X_t), pred_contrib=True)
+        return np.asarray(contrib)[:, :-1]
+
+
+@dataclass(slots=True)
+class XGBContribExplainer:
+    """XGBoost TreeSHAP contributions via booster.predict(pred_contribs=True)."""
+    clf: Any
+
+    @staticmethod
+    def supports(clf) -> bool:
+        from xgboost import XGBClassifier
+        from telco_churn.modeling.bundle.split_model import NativeXGBClassifier
+        return isinstance(clf, (XGBClassifier, NativeXGBClassifier))
+
+    def export_state(self) -> Any:
+        return None
+
+    @classmethod
+    def from_state(cls, clf, state: Any):
+        return cls(clf)
+
+    def shap_values(self, X_t) -> np.ndarray:
+        from xgboost import DMatrix
+        booster = self.clf.get_booster()
+        dm = DMatrix(_dense(X_t), missing=np.nan)
+        contrib = booster.predict(dm, pred_contribs=True, validate_features=False)
+        return np.asarray(contrib)[:, :-1]
+
+
+@dataclass(slots=True)
+class LinearContribExplainer:
+    """Closed-form logit contributions for linear models: coef * transformed (standardized) value."""
+    clf: Any
+
+    @staticmethod
+    def supports(clf) -> bool:
+        from sklearn.linear_model import LogisticRegression
+        from telco_churn.modeling.bundle.split_model import NativeLinearClassifier
+        return isinstance(clf, (LogisticRegression, NativeLinearClassifier))
+
+    def export_state(self) -> Any:
+        return None
+
+    @classmethod
+    def from_state(cls, clf, state: Any):
+        return cls(clf)
+
+    def shap_values(self, X_t) -> np.ndarray:
+        coef = np.asarray(self.clf.coef_, dtype=np.float64)[-1]
+        return _dense(X_t) * coef
+
+
+@dataclass(slots=True)
+class ShapTreeExplainer:
+    """Fallback for classifiers without a native contribution path."""
+    clf: Any
+    _explainer: Any = None
+
+    @staticmethod
+    def supports(clf) -> bool:
+        return True
+
+    def prepare(self) -> "ShapTreeExplainer":
+        """Build the shap TreeExplainer (walks and converts the whole ensemble)."""
+        if self._explainer is None:
+            import shap
+            self._explainer = shap.TreeExplainer(self.clf)
+        return self
+
+    def export_state(self) -> Any:
+        return self.prepare()._explainer
+
+    @classmethod
+    def from_state(cls, clf, state: Any):
+        return cls(clf, state)
+
+    def shap_values(self, X_t):
+        return self.prepare()._explainer.shap_values(X_t)
+
+
+EXPLAINER_BACKENDS: Dict[str, Type] = {
+    "lgb": LGBContribExplainer,
+    "xgb": XGBContribExplainer,
+    "lr": LinearContribExplainer,
+    "shap": ShapTreeExplainer,
+}
+
+def available_backends() -> list[str]:
+    return sorted(EXPLAINER_BACKENDS.keys())
+
+
+def resolve_backend(clf) -> str:
+    for name, cls in EXPLAINER_BACKENDS.items():
+        if name != "shap" and cls.supports(clf):
+            return name
+    return "shap"
+
+
+def make_explainer(clf, *, backend: Optional[str] = None):
+    name = backend or resolve_backend(clf)
+    try:
+        cls = EXPLAINER_BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown explainer backend '{name}'. Options: {available_backends()}")
+    return cls(clf)
+
+
+def backend_name(explainer) -> str:
+    for name, cls in EXPLAINER_BACKENDS.items():
+        if type(explainer) is cls:
+            return name
+    raise ValueError(f"Not an explainer backend: {type(explainer).__name__}")
+
+
+def save_explainer(path: Path, explainer) -> Path:
+    """Persist the backend name plus whatever the backend precomputes (the converted ensemble for shap)."""
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    joblib.dump({"backend": backend_name(explainer), "state": explainer.export_state()}, tmp)
+    tmp.replace(path)
+    return path
+
+
+def load_explainer(path: Path, clf):
+    """Rebuild a saved explainer around clf without re-resolving the backend or re-converting the model."""
+    payload = joblib.load(path)
+    name = payload["backend"]
+    try:
+        cls = EXPLAINER_BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown explainer backend '{name}'. Options: {available_backends()}")
+    return cls.from_state(clf, payload["state"])
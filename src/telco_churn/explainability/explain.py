@@ -1,15 +1,87 @@
 """
-Build shap for prediction explanations.
+Build per-feature contributions for prediction explanations.
 """
 
+from typing import Optional
+
 import numpy as np
-import shap
 
-def build_explainer(*, pipe):
+from telco_churn.explainability.backends import make_explainer
+from telco_churn.explainability.reason_map import ReasonCodeMap
+
+EXPLAIN_CHUNK_SIZE = 10_000
+
+def build_explainer(*, pipe, backend: Optional[str] = None):
     clf = pipe.named_steps["clf"]
-    return shap.TreeExplainer(clf)
+    return make_explainer(clf, backend=backend)
+
+def transform_features(*, pipe, X):
+    return pipe.named_steps["pre"].transform(pipe.named_steps["spec"].transform(X))
+
+def _positive_class(sv) -> np.ndarray:
+    if isinstance(sv, list):
+        sv = sv[-1]
+    sv = np.asarray(sv)
+    if sv.ndim == 3:
+        sv = sv[:, :, -1]
+    return sv
+
+def shap_values_batch(*, explainer, X_t, chunk_size: int = EXPLAIN_CHUNK_SIZE) -> np.ndarray:
+    """SHAP values (rows x features) for an already transformed matrix, computed chunk_size rows at a time."""
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be > 0.")
+
+    n_rows = X_t.shape[0]
+    parts = [
+        _positive_class(explainer.shap_values(X_t[start:start + chunk_size]))
+        for start in range(0, n_rows, chunk_size)
+    ]
+    if not parts:
+        return np.empty((0, X_t.shape[1]), dtype=np.float64)
+    return np.concatenate(parts, axis=0)
+
+def top_k_indices(values: np.ndarray, k: int = 1) -> np.ndarray:
+    """Per-row indices of the k largest |values|, ordered by descending magnitude."""
+    mag = np.abs(np.asarray(values))
+    n_rows, n_cols = mag.shape
+    k = min(int(k), n_cols)
+    if k <= 0:
+        raise ValueError("k must be > 0.")
+
+    if k == 1:
+        return np.argmax(mag, axis=1).reshape(n_rows, 1)
+
+    if k < n_cols:
+        idx = np.argpartition(-mag, k - 1, axis=1)[:, :k]
+    else:
+        idx = np.tile(np.arange(n_cols), (n_rows, 1))
+
+    order = np.argsort(-np.take_along_axis(mag, idx, axis=1), axis=1, kind="stable")
+    return np.take_along_axis(idx, order, axis=1)
+
+def top_feature_indices(*, pipe, explainer, X, k: int = 1, chunk_size: int = EXPLAIN_CHUNK_SIZE) -> np.ndarray:
+    """Transform X once and return the top-k feature indices per row (rows x k)."""
+    X_t = transform_features(pipe=pipe, X=X)
+    sv = shap_values_batch(explainer=explainer, X_t=X_t, chunk_size=chunk_size)
+    return top_k_indices(sv, k=k)
+
+def top_reason_indices(
+    *,
+    pipe,
+    explainer,
+    X,
+    reasons: ReasonCodeMap,
+    k: int = 3,
+    chunk_size: int = EXPLAIN_CHUNK_SIZE,
+) -> np.ndarray:
+    """Transform X once and return the top-k distinct reason indices per row (rows x k)."""
+    X_t = transform_features(pipe=pipe, X=X)
+    sv = shap_values_batch(explainer=explainer, X_t=X_t, chunk_size=chunk_size)
+    return reasons.top_reasons(sv, k=k)
+
+def top_feature_names(*, pipe, feature_names, explainer, X, chunk_size: int = EXPLAIN_CHUNK_SIZE) -> np.ndarray:
+    idx = top_feature_indices(pipe=pipe, explainer=explainer, X=X, k=1, chunk_size=chunk_size)
+    return np.asarray(feature_names, dtype=object)[idx[:, 0]]
 
 def top_feature_name(*, pipe, feature_names, explainer, X_row):
-    X_t = pipe.named_steps["pre"].transform(pipe.named_steps["spec"].transform(X_row))
-    sv_row = np.asarray(explainer.shap_values(X_t))[0]
-    return feature_names[int(np.argmax(np.abs(sv_row)))]
+    return str(top_feature_names(pipe=pipe, feature_names=feature_names, explainer=explainer, X=X_row)[0])
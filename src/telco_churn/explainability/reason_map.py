@@ -0,0 +1,98 @@
+"""
+Precompiled feature index -> reason code -> recommended action mapping for a bundle's feature names.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from telco_churn.explainability.action_map import DECISION_ACTIONS
+from telco_churn.explainability.decision_codes import DECISION_CODES
+
+OTHER_REASON = "OTHER"
+NO_REASON = -1
+
+@dataclass(frozen=True)
+class ReasonCodeMap:
+    """Index arrays over the bundle's feature_names.
+
+    feature_reason has one extra trailing slot (index len(feature_names)) for features outside the
+    bundle, which map to OTHER. Reasons, actions and summaries are categorical categories, so
+    per-row columns are built from integer codes without per-row string work.
+    """
+    feature_names: list[str]
+    reason_codes: list[str]
+    feature_reason: np.ndarray
+    actions: list[str]
+    reason_action: np.ndarray
+
+    @classmethod
+    def from_feature_names(cls, feature_names) -> "ReasonCodeMap":
+        names = [str(n) for n in feature_names]
+        reason_codes = [c for c in DECISION_ACTIONS if c != OTHER_REASON]
+        reason_codes += sorted(set(DECISION_CODES.values()) - set(reason_codes) - {OTHER_REASON})
+        reason_codes.append(OTHER_REASON)
+        code_idx = {c: i for i, c in enumerate(reason_codes)}
+
+        feature_reason = np.asarray(
+            [code_idx[DECISION_CODES.get(n, OTHER_REASON)] for n in names] + [code_idx[OTHER_REASON]],
+            dtype=np.int16,
+        )
+
+        action_text = [DECISION_ACTIONS.get(c, DECISION_ACTIONS[OTHER_REASON]) for c in reason_codes]
+        actions = list(dict.fromkeys(action_text))
+        reason_action = np.asarray([actions.index(a) for a in action_text], dtype=np.int16)
+
+        return cls(
+            feature_names=names,
+            reason_codes=reason_codes,
+            feature_reason=feature_reason,
+            actions=actions,
+            reason_action=reason_action,
+        )
+
+    @property
+    def n_reasons(self) -> int:
+        return len(self.reason_codes)
+
+    def feature_index(self, top_features) -> np.ndarray:
+        """Feature index per top-feature name; unknown / missing names get the OTHER slot."""
+        idx = pd.Categorical(np.asarray(top_features, dtype=object), categories=self.feature_names).codes
+        return np.where(idx < 0, len(self.feature_names), idx).astype(np.int64)
+
+    def reason_index(self, feature_idx) -> np.ndarray:
+        return self.feature_reason[np.asarray(feature_idx, dtype=np.int64)]
+
+    def top_reasons(self, values: np.ndarray, k: int = 3) -> np.ndarray:
+        """Per-row top-k distinct reason indices (rows x k) by descending |contribution|, NO_REASON padded.
+
+        A reason ranks at the position of its strongest feature.
+        """
+        mag = np.abs(np.asarray(values))
+        n_rows, n_cols = mag.shape
+        order = np.argsort(-mag, axis=1, kind="stable")
+        reasons = self.feature_reason[order]
+
+        first = np.full((n_rows, self.n_reasons), n_cols, dtype=np.int64)
+        for r in np.unique(reasons):
+            hit = reasons == r
+            first[:, r] = np.where(hit.any(axis=1), hit.argmax(axis=1), n_cols)
+
+        k = min(int(k), self.n_reasons)
+        top = np.argsort(first, axis=1, kind="stable")[:, :k]
+        found = np.take_along_axis(first, top, axis=1) < n_cols
+        return np.where(found, top, NO_REASON).astype(np.int16)
+
+    def reason_categorical(self, reason_idx) -> pd.Categorical:
+        return pd.Categorical.from_codes(np.asarray(reason_idx, dtype=np.int16), categories=self.reason_codes)
+
+    def action_categorical(self, reason_idx) -> pd.Categorical:
+        return pd.Categorical.from_codes(self.reason_action[np.asarray(reason_idx, dtype=np.int64)], categories=self.actions)
+
+    def summary_categorical(self, reason_idx) -> pd.Categorical:
+        """'CODE: action' per row; one string per reason, not per row."""
+        summaries = [f"{c}: {self.actions[a]}" for c, a in zip(self.reason_codes, self.reason_action)]
+        return pd.Categorical.from_codes(np.asarray(reason_idx, dtype=np.int16), categories=summaries)
@@ -1,11 +1,19 @@
 from __future__ import annotations
 from pathlib import Path
-from huggingface_hub import hf_hub_download, HfApi
-from typing import Optional, Any
+from huggingface_hub import hf_hub_download, hf_hub_url, get_hf_file_metadata, HfApi, CommitOperationAdd
+from typing import TYPE_CHECKING, Optional, Any, Mapping
+from concurrent.futures import ThreadPoolExecutor
 import json
+import os
+import shutil
+import tempfile
 from huggingface_hub.utils import EntryNotFoundError
 import joblib
 
+if TYPE_CHECKING:
+    from telco_churn.modeling.compiled.scorer import CompiledTreeScorer
+    from telco_churn.modeling.bundle.split_model import SplitModel
+
 def download_dataset_hf(repo_id: str, filename: str, revision: str = "main") -> str:
     """Download a single file from a Hugging Face dataset repo using the normal HF cache."""
     return hf_hub_download(
@@ -40,6 +48,94 @@ def upload_dataset_hf(
         commit_message=commit_message or f"Upload {hf_path}",
     )
 
+def stage_commit_operations(
+    files: Mapping[str, str | Path],
+    *,
+    max_workers: int = 4,
+) -> list[CommitOperationAdd]:
+    """Validate local files (hf_path -> local_path) and hash them concurrently into commit operations."""
+    for hf_path, local_path in files.items():
+        p = Path(local_path)
+        if not p.exists():
+            raise FileNotFoundError(f"Local path not found for {hf_path}: {p}")
+        if not p.is_file():
+            raise IsADirectoryError(f"Expected a file for {hf_path}, got: {p}")
+
+    with ThreadPoolExecutor(max_workers=max(int(max_workers), 1)) as pool:
+        return list(pool.map(
+            lambda item: CommitOperationAdd(path_in_repo=item[0], path_or_fileobj=str(item[1])),
+            files.items(),
+        ))
+
+def upload_dataset_files_hf(
+    *,
+    files: Mapping[str, str | Path],
+    repo_id: str,
+    revision: str = "main",
+    commit_message: str | None = None,
+    max_workers: int = 4,
+    api: Any = None,
+) -> None:
+    """Upload several local files to a Hugging Face dataset repo as one atomic commit.
+
+    api defaults to HfApi(); any object with a compatible create_commit (e.g. LocalCommitApi) can stand in.
+    """
+    if not files:
+        return
+
+    operations = stage_commit_operations(files, max_workers=max_workers)
+    (api or HfApi()).create_commit(
+        repo_id=repo_id,
+        repo_type="dataset",
+        revision=revision,
+        operations=operations,
+        commit_message=commit_message or f"Upload {len(operations)} files",
+        num_threads=max(int(max_workers), 1),
+    )
+
+class LocalCommitApi:
+    """Local stand-in for HfApi.create_commit: materializes each commit under root/{repo_type}/{repo_id}/{revision}.
+
+    Files are copied to a staging directory first and only moved into place once every copy has
+    succeeded, so a failed commit leaves the previous tree untouched.
+    """
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+        self.commits: list[dict[str, Any]] = []
+
+    def create_commit(
+        self,
+        repo_id: str,
+        operations,
+        *,
+        commit_message: str,
+        repo_type: str | None = None,
+        revision: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        dest = self.root / (repo_type or "model") / repo_id / (revision or "main")
+        dest.mkdir(parents=True, exist_ok=True)
+        operations = list(operations)
+
+        with tempfile.TemporaryDirectory(dir=dest, prefix=".commit-") as staging:
+            staged = []
+            for i, op in enumerate(operations):
+                tmp = Path(staging) / str(i)
+                shutil.copyfile(op.path_or_fileobj, tmp)
+                staged.append((tmp, dest / op.path_in_repo))
+
+            for tmp, target in staged:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(tmp, target)
+
+        self.commits.append({
+            "repo_id": repo_id,
+            "revision": revision,
+            "message": commit_message,
+            "paths": [op.path_in_repo for op in operations],
+        })
+
 def upload_model_bundle(
     bundle_dir: str | Path,
     *,
@@ -132,6 +228,11 @@ def upload_model_json_hf(
         commit_message=msg,
     )
     
+def model_file_etag(*, repo_id: str, revision: str, path_in_repo: str) -> Optional[str]:
+    """ETag of a file in a HF model repo via a single HEAD request (no download)."""
+    url = hf_hub_url(repo_id=repo_id, filename=path_in_repo, repo_type="model", revision=revision)
+    return get_hf_file_metadata(url).etag
+
 def load_model_hf(*, repo_id: str, revision: str, path_in_repo: str) -> Any:
     """Download a model artifact from HF and load it with joblib."""
     local_file = hf_hub_download(
@@ -140,4 +241,61 @@ def load_model_hf(*, repo_id: str, revision: str, path_in_repo: str) -> Any:
         revision=revision,
         filename=path_in_repo,
     )
-    return joblib.load(local_file)
\ No newline at end of file
+    return joblib.load(local_file)
+
+def download_model_file_hf(*, repo_id: str, revision: str, path_in_repo: str) -> Optional[str]:
+    """Local path of a model repo file (None if the run has none)."""
+    try:
+        return hf_hub_download(
+            repo_id=repo_id,
+            repo_type="model",
+            revision=revision,
+            filename=path_in_repo,
+        )
+    except EntryNotFoundError:
+        return None
+
+def load_compiled_model_hf(*, repo_id: str, revision: str, path_in_repo: str) -> Optional[CompiledTreeScorer]:
+    """Download a compiled tree scorer (.npz) from HF (returns None if the run has none)."""
+    try:
+        local_file = hf_hub_download(
+            repo_id=repo_id,
+            repo_type="model",
+            revision=revision,
+            filename=path_in_repo,
+        )
+    except EntryNotFoundError:
+        return None
+    # Imported here: the compiled scorer pulls in numba, which plain data I/O should not pay for.
+    from telco_churn.modeling.compiled.scorer import load_compiled_npz
+    return load_compiled_npz(local_file)
+
+def load_split_model_hf(*, repo_id: str, revision: str, path_in_repo: str) -> Optional[SplitModel]:
+    """Download a split model directory (manifest first, then the files it lists); None if the run has none."""
+    from telco_churn.modeling.bundle.split_model import MANIFEST_FILE, SplitModel
+
+    try:
+        manifest_file = hf_hub_download(
+            repo_id=repo_id,
+            repo_type="model",
+            revision=revision,
+            filename=f"{path_in_repo}/{MANIFEST_FILE}",
+        )
+    except EntryNotFoundError:
+        return None
+
+    with open(manifest_file, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(
+            lambda name: hf_hub_download(
+                repo_id=repo_id,
+                repo_type="model",
+                revision=revision,
+                filename=f"{path_in_repo}/{name}",
+            ),
+            manifest["files"],
+        ))
+
+    return SplitModel(Path(manifest_file).parent)
@@ -0,0 +1,195 @@
+"""Persistent local cache of champion bundles, keyed by run, with pointer revalidation and an LRU bound."""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import joblib
+
+from telco_churn.io.atomic import atomic_write_json
+from telco_churn.io.locks import file_lock
+from telco_churn.modeling.compiled.scorer import COMPILED_MODEL_FILE, CompiledTreeScorer, load_compiled_npz, write_compiled_npz
+from telco_churn.modeling.bundle.split_model import SPLIT_DIR, SplitModel, load_split_model
+
+POINTER_FILE = "champion.json"
+LOCK_FILE = ".lock"
+ENTRY_FILE = "entry.json"
+MODEL_FILE = "model.joblib"
+
+@dataclass(frozen=True)
+class CachedBundle:
+    model_version: str
+    model: Any
+    compiled: Optional[CompiledTreeScorer]
+    threshold: Optional[float]
+    feature_names: Optional[list[str]]
+
+def _entry_dirname(model_version: str) -> str:
+    return model_version.replace("/", "__")
+
+@dataclass
+class ModelCache:
+    """On-disk champion cache.
+
+    Layout: root/champion.json (pointer etag + model_version + last check) and one directory per
+    model_version holding the model (split format when available, else uncompressed joblib loaded
+    memory-mapped), the compiled scorer and the bits of metadata.json the batch path needs.
+
+    Several processes may share the cache (multiprocess batch partitions). Entries are staged in a
+    private temp dir and published, added to and evicted under an exclusive lock on root/.lock;
+    loads take it shared. Recency is the entry dir's mtime, touched on every load.
+    """
+    root: Path
+    max_versions: int = 3
+    ttl_seconds: float = 0.0
+
+    def __post_init__(self):
+        self.root = Path(self.root).expanduser()
+
+    def _read_json(self, path: Path) -> Optional[dict[str, Any]]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def champion_version(
+        self,
+        *,
+        fetch_etag: Callable[[], Optional[str]],
+        fetch_pointer: Callable[[], dict[str, Any]],
+    ) -> str:
+        """Current champion model_version: cached pointer while fresh / etag unchanged, else re-read."""
+        pointer_path = self.root / POINTER_FILE
+        cached = self._read_json(pointer_path)
+        now = time.time()
+
+        if cached is not None and now - cached.get("checked_at", 0.0) < self.ttl_seconds:
+            return cached["model_version"]
+
+        try:
+            etag = fetch_etag()
+        except Exception:
+            if cached is None:
+                raise
+            return cached["model_version"]
+
+        if cached is not None and etag is not None and cached.get("etag") == etag:
+            model_version = cached["model_version"]
+        else:
+            model_version = fetch_pointer()["path_in_repo"]
+
+        atomic_write_json(pointer_path, {"etag": etag, "model_version": model_version, "checked_at": now})
+        return model_version
+
+    def _lock(self, *, shared: bool = False):
+        return file_lock(self.root / LOCK_FILE, shared=shared)
+
+    def _entry(self, entry_dir: Path) -> Optional[dict[str, Any]]:
+        """entry.json of a complete entry dir, else None."""
+        entry = self._read_json(entry_dir / ENTRY_FILE) if entry_dir.is_dir() else None
+        return entry if entry is not None and "model_version" in entry else None
+
+    def load(self, model_version: str) -> Optional[CachedBundle]:
+        entry_dir = self.root / _entry_dirname(model_version)
+        if not entry_dir.is_dir():
+            return None
+
+        with self._lock(shared=True):
+            entry = self._entry(entry_dir)
+            if entry is None or entry["model_version"] != model_version:
+                return None
+
+            model = load_split_model(entry_dir / SPLIT_DIR)
+            if model is None:
+                model = joblib.load(entry_dir / MODEL_FILE, mmap_mode="r")
+            compiled_path = entry_dir / COMPILED_MODEL_FILE
+            compiled = load_compiled_npz(compiled_path) if compiled_path.exists() else None
+            os.utime(entry_dir)
+
+        return CachedBundle(
+            model_version=model_version,
+            model=model,
+            compiled=compiled,
+            threshold=entry.get("threshold"),
+            feature_names=entry.get("feature_names"),
+        )
+
+    def store(self, bundle: CachedBundle) -> Path:
+        """Write an entry (staged privately, then renamed into place) and evict least recently used versions.
+
+        When another process published the same version first, its entry is kept and ours discarded.
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        entry_dir = self.root / _entry_dirname(bundle.model_version)
+        staging = Path(tempfile.mkdtemp(dir=self.root, prefix=f".{entry_dir.name}.", suffix=".tmp"))
+
+        try:
+            if isinstance(bundle.model, SplitModel):
+                shutil.copytree(bundle.model.split_dir, staging / SPLIT_DIR)
+            else:
+                joblib.dump(bundle.model, staging / MODEL_FILE)
+            if bundle.compiled is not None:
+                write_compiled_npz(staging, bundle.compiled)
+            atomic_write_json(staging / ENTRY_FILE, {
+                "model_version": bundle.model_version,
+                "threshold": bundle.threshold,
+                "feature_names": bundle.feature_names,
+            })
+
+            with self._lock():
+                if self._entry(entry_dir) is None:
+                    shutil.rmtree(entry_dir, ignore_errors=True)
+                    staging.replace(entry_dir)
+                os.utime(entry_dir)
+                self._evict(keep=bundle.model_version)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+        return entry_dir
+
+    def entry_file(self, model_version: str, name: str) -> Path:
+        return self.root / _entry_dirname(model_version) / name
+
+    def add_file(self, model_version: str, src: str | Path, name: str) -> Path:
+        """Copy a lazily fetched bundle file into an existing entry; src unchanged when the entry is gone."""
+        entry_dir = self.root / _entry_dirname(model_version)
+        if not entry_dir.is_dir():
+            return Path(src)
+        with self._lock():
+            if self._entry(entry_dir) is None:
+                return Path(src)
+            dest = entry_dir / name
+            fd, tmp = tempfile.mkstemp(dir=entry_dir, prefix=f".{name}.", suffix=".tmp")
+            os.close(fd)
+            shutil.copyfile(src, tmp)
+            os.replace(tmp, dest)
+        return dest
+
+    def evict(self, keep: Optional[str] = None) -> list[str]:
+        if not self.root.exists():
+            return []
+        with self._lock():
+            return self._evict(keep=keep)
+
+    def _evict(self, keep: Optional[str] = None) -> list[str]:
+        entries = []
+        for entry_dir in self.root.iterdir():
+            if entry_dir.name.startswith("."):
+                continue  # lock file / staging dirs of in-flight stores
+            entry = self._entry(entry_dir)
+            if entry is not None:
+                entries.append((entry_dir.stat().st_mtime, entry["model_version"], entry_dir))
+
+        entries.sort(key=lambda e: (e[1] == keep, e[0]), reverse=True)
+        evicted = []
+        for _, model_version, entry_dir in entries[max(self.max_versions, 1):]:
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            evicted.append(model_version)
+        return evicted
@@ -3,10 +3,28 @@ Jobs:
     ETL = raw data to train ready data.
     Train = train model artifact.
     Promotion = determine best current model artifact.
-    Batch = score incoming batch data. 
+    Batch = score incoming batch data (one dynamic partition per batch file). 
+    Batch stream = score incoming batch data in bounded-memory chunks.
+    Batch backfill = re-score many batch files with one loaded model.
 """
 
 import dagster as dg
+from telco_churn.batch.partitions import BATCH_PARTITIONS
+
+# Batch jobs default to light asset metadata (catalog counts, no extra scans or markdown previews);
+# set resources.meta.config.level to FULL in the run config to get previews back.
+LIGHT_METADATA = {"resources": {"meta": {"config": {"level": "LIGHT"}}}}
+
+# The stream report reads gold once, chunk by chunk, so gold stays a view over the fused layers.
+STREAM_CONFIG = {
+    "resources": {
+        **LIGHT_METADATA["resources"],
+        "batch_ctx": {"config": {"materialize_gold": False}},
+    },
+}
+
+# Partitioned batch runs use per-partition DuckDB files, so steps (and concurrent partition runs) can use separate processes.
+batch_executor = dg.multiprocess_executor.configured({"max_concurrent": 4})
 
 etl = dg.define_asset_job(
     "etl",
@@ -29,5 +47,21 @@ promotion = dg.define_asset_job(
 batch = dg.define_asset_job(
     "batch",
     selection=dg.AssetSelection.keys("upload_batch_report").upstream(),
+    partitions_def=BATCH_PARTITIONS,
+    executor_def=batch_executor,
+    config=LIGHT_METADATA,
+)
+
+batch_stream = dg.define_asset_job(
+    "batch_stream",
+    selection=dg.AssetSelection.keys("upload_batch_stream_report").upstream(),
+    partitions_def=BATCH_PARTITIONS,
+    executor_def=batch_executor,
+    config=STREAM_CONFIG,
+)
+
+batch_backfill = dg.define_asset_job(
+    "batch_backfill",
+    selection=dg.AssetSelection.keys("batch_backfill_reports"),
     executor_def=dg.in_process_executor,
 )
\ No newline at end of file
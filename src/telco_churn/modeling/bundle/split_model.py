@@ -0,0 +1,218 @@
+"""Split bundle format: native booster file + preprocessor arrays (.npy, mmap-able) + small JSON manifest."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, fields
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+from telco_churn.modeling.compiled.design import DesignPlan, compile_design, spec_is_float32
+from telco_churn.modeling.feature_spec.feature_spec import CompiledFeatureSpecTransformer, FeatureSpecTransformer
+
+SPLIT_DIR = "model_split"
+MANIFEST_FILE = "split.json"
+SPEC_FILE = "spec.json"
+SPLIT_FORMAT_VERSION = 1
+
+_BOOSTER_FILES = {"lgb": "booster.txt", "xgb": "booster.ubj"}
+_LINEAR_ARRAYS = ("coef", "intercept")
+
+
+class DesignTransformer:
+    """ColumnTransformer stand-in backed by a DesignPlan (dense, or CSR when the fitted transformer was sparse)."""
+
+    def __init__(self, plan: DesignPlan, *, sparse_output: bool = False):
+        self.plan = plan
+        self.sparse_output = sparse_output
+
+    def transform(self, X: pd.DataFrame):
+        out = self.plan.transform(X)
+        return sp.csr_matrix(out) if self.sparse_output else out
+
+
+class NativeLGBClassifier:
+    """Binary LightGBM booster loaded from its text model file."""
+
+    def __init__(self, booster):
+        self.booster_ = booster
+
+    def predict_proba(self, X_t) -> np.ndarray:
+        p = np.asarray(self.booster_.predict(X_t), dtype=np.float64)
+        return np.column_stack([1.0 - p, p])
+
+
+class NativeXGBClassifier:
+    """Binary XGBoost booster loaded from its UBJSON model file."""
+
+    def __init__(self, booster):
+        self._booster = booster
+
+    def get_booster(self):
+        return self._booster
+
+    def predict_proba(self, X_t) -> np.ndarray:
+        p = np.asarray(self._booster.inplace_predict(X_t, missing=np.nan, validate_features=False), dtype=np.float64)
+        return np.column_stack([1.0 - p, p])
+
+
+class NativeLinearClassifier:
+    """Binary logistic regression from coef / intercept arrays."""
+
+    def __init__(self, coef: np.ndarray, intercept: np.ndarray):
+        self.coef_ = coef
+        self.intercept_ = intercept
+
+    def predict_proba(self, X_t) -> np.ndarray:
+        margin = np.asarray(X_t @ self.coef_[-1]).ravel() + float(self.intercept_[-1])
+        p = 1.0 / (1.0 + np.exp(-margin))
+        return np.column_stack([1.0 - p, p])
+
+
+def _clf_kind(clf) -> str:
+    from sklearn.linear_model import LogisticRegression
+    if isinstance(clf, LogisticRegression):
+        return "lr"
+    try:
+        from lightgbm import LGBMClassifier
+        if isinstance(clf, LGBMClassifier):
+            return "lgb"
+    except ImportError:
+        pass
+    try:
+        from xgboost import XGBClassifier
+        if isinstance(clf, XGBClassifier):
+            return "xgb"
+    except ImportError:
+        pass
+    raise TypeError(f"No split format for classifier {type(clf).__name__}")
+
+
+def write_split_dir(split_dir: Path, pipe, *, run_id: str, model_type: str) -> Path:
+    """Write spec, preprocessor arrays and the native classifier of a fitted spec -> pre -> clf pipeline."""
+    spec, pre, clf = (pipe.named_steps[k] for k in ("spec", "pre", "clf"))
+    kind = _clf_kind(clf)
+    plan = compile_design(pre, input_float32=spec_is_float32(spec))
+
+    split_dir.mkdir(parents=True, exist_ok=True)
+    for k, v in asdict(plan).items():
+        if k != "input_columns":
+            np.save(split_dir / f"design__{k}.npy", np.ascontiguousarray(v))
+
+    if kind == "lgb":
+        clf.booster_.save_model(str(split_dir / _BOOSTER_FILES[kind]))
+    elif kind == "xgb":
+        clf.get_booster().save_model(str(split_dir / _BOOSTER_FILES[kind]))
+    else:
+        np.save(split_dir / "linear__coef.npy", np.asarray(clf.coef_, dtype=np.float64))
+        np.save(split_dir / "linear__intercept.npy", np.asarray(clf.intercept_, dtype=np.float64))
+
+    with open(split_dir / SPEC_FILE, "w", encoding="utf-8") as f:
+        json.dump({
+            "spec": spec.spec,
+            "add_missing_columns": spec.add_missing_columns,
+            "drop_columns": spec.drop_columns,
+            "compiled_dtype": spec.dtype if isinstance(spec, CompiledFeatureSpecTransformer) else None,
+        }, f)
+
+    with open(split_dir / MANIFEST_FILE, "w", encoding="utf-8") as f:
+        json.dump({
+            "format_version": SPLIT_FORMAT_VERSION,
+            "run_id": run_id,
+            "model_type": model_type,
+            "clf_kind": kind,
+            "input_columns": plan.input_columns,
+            "sparse_output": bool(getattr(pre, "sparse_output_", False)),
+            "files": split_files(kind),
+        }, f, indent=2)
+
+    return split_dir
+
+
+def split_files(kind: str) -> list[str]:
+    files = [SPEC_FILE] + [f"design__{f.name}.npy" for f in fields(DesignPlan) if f.name != "input_columns"]
+    if kind in _BOOSTER_FILES:
+        files.append(_BOOSTER_FILES[kind])
+    else:
+        files += [f"linear__{k}.npy" for k in _LINEAR_ARRAYS]
+    return files
+
+
+class SplitModel:
+    """Pipeline stand-in rebuilt lazily from a split directory.
+
+    Only the manifest is read up front; preprocessor arrays are memory-mapped and the booster is loaded
+    on first use. named_steps exposes spec / pre / clf so the explain path works unchanged.
+    """
+
+    def __init__(self, split_dir: str | Path, *, mmap_mode: Optional[str] = "r"):
+        self.split_dir = Path(split_dir)
+        self.mmap_mode = mmap_mode
+        with open(self.split_dir / MANIFEST_FILE, "r", encoding="utf-8") as f:
+            self.manifest = json.load(f)
+        self._steps: Optional[dict[str, Any]] = None
+
+    def __getstate__(self):
+        return {"split_dir": self.split_dir, "mmap_mode": self.mmap_mode, "manifest": self.manifest, "_steps": None}
+
+    def _load_plan(self) -> DesignPlan:
+        kw = {
+            f.name: np.load(self.split_dir / f"design__{f.name}.npy", mmap_mode=self.mmap_mode)
+            for f in fields(DesignPlan) if f.name != "input_columns"
+        }
+        kw["input_float32"] = bool(kw["input_float32"])
+        return DesignPlan(input_columns=list(self.manifest["input_columns"]), **kw)
+
+    def _load_spec(self):
+        with open(self.split_dir / SPEC_FILE, "r", encoding="utf-8") as f:
+            spec = json.load(f)
+        kw = {"add_missing_columns": spec["add_missing_columns"], "drop_columns": spec["drop_columns"]}
+        if spec.get("compiled_dtype"):
+            return CompiledFeatureSpecTransformer(spec["spec"], dtype=spec["compiled_dtype"], **kw).fit(None)
+        return FeatureSpecTransformer(spec["spec"], **kw)
+
+    def _load_clf(self):
+        kind = self.manifest["clf_kind"]
+        if kind == "lgb":
+            import lightgbm as lgb
+            return NativeLGBClassifier(lgb.Booster(model_file=str(self.split_dir / _BOOSTER_FILES[kind])))
+        if kind == "xgb":
+            import xgboost as xgb
+            booster = xgb.Booster()
+            booster.load_model(str(self.split_dir / _BOOSTER_FILES[kind]))
+            return NativeXGBClassifier(booster)
+        return NativeLinearClassifier(
+            *(np.load(self.split_dir / f"linear__{k}.npy", mmap_mode=self.mmap_mode) for k in _LINEAR_ARRAYS)
+        )
+
+    @property
+    def named_steps(self) -> dict[str, Any]:
+        if self._steps is None:
+            self._steps = {
+                "spec": self._load_spec(),
+                "pre": DesignTransformer(self._load_plan(), sparse_output=self.manifest["sparse_output"]),
+                "clf": self._load_clf(),
+            }
+        return self._steps
+
+    def get_params(self, deep: bool = True) -> dict[str, Any]:
+        return {}
+
+    def set_params(self, **params) -> "SplitModel":
+        return self
+
+    def predict_proba(self, X: pd.DataFrame) -> np.ndarray:
+        steps = self.named_steps
+        return steps["clf"].predict_proba(steps["pre"].transform(X))
+
+
+def load_split_model(split_dir: str | Path) -> Optional[SplitModel]:
+    """None when the directory holds no split bundle (e.g. runs written before the format existed)."""
+    split_dir = Path(split_dir)
+    if not (split_dir / MANIFEST_FILE).exists():
+        return None
+    return SplitModel(split_dir)
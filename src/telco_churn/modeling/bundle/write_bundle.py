@@ -5,6 +5,8 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any, Dict
 
+import pandas as pd
+
 from telco_churn.modeling.bundle.write_metrics import (
     assemble_metrics_payload,
     write_metrics_json,
@@ -14,6 +16,9 @@ from telco_churn.modeling.bundle.write_metadata import (
     write_metadata_json,
 )
 from telco_churn.modeling.bundle.write_model import write_model_joblib
+from telco_churn.modeling.bundle.write_compiled import write_compiled_model
+from telco_churn.modeling.bundle.write_split import write_split_model
+from telco_churn.modeling.bundle.write_explainer import write_explainer
 from telco_churn.modeling.bundle.model_artifact import ModelArtifact
 
 
@@ -29,8 +34,15 @@ def write_bundle(
     direction: str,
     cfg: Any = None,
     feature_names: list[str] | None = None,
+    parity_sample: pd.DataFrame,
+    log: Any = None,
 ) -> Path:
+    """parity_sample: feature rows the compiled model must reproduce before it is written (e.g. holdout).
+    log: logger for skipped optional artifacts (e.g. context.log); module loggers when None."""
     write_model_joblib(bundle_dir, artifact_obj)
+    write_compiled_model(bundle_dir, artifact_obj, parity_sample=parity_sample, log=log)
+    write_split_model(bundle_dir, artifact_obj)
+    write_explainer(bundle_dir, artifact_obj, log=log)
 
     metrics_payload = assemble_metrics_payload(
         run_id=artifact_obj.run_id,
@@ -0,0 +1,46 @@
+"""Compile tree-model pipelines into model_compiled.npz next to model.joblib."""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Any, Optional
+
+import pandas as pd
+
+from telco_churn.modeling.compiled.scorer import (
+    PARITY_ATOL,
+    PARITY_ROWS,
+    compile_pipeline,
+    parity_max_diff,
+    write_compiled_npz,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def write_compiled_model(
+    bundle_dir: Path,
+    artifact_obj: Any,
+    *,
+    parity_sample: pd.DataFrame,
+    log: Any = None,
+) -> Optional[Path]:
+    """Returns None when the model has no compiled form (e.g. logistic regression) or the compiled
+    scorer disagrees with the pipeline on parity_sample (first PARITY_ROWS rows); both are logged."""
+    log = log or logger
+    pipe = getattr(artifact_obj, "model", artifact_obj)
+    try:
+        scorer = compile_pipeline(pipe)
+    except (TypeError, ValueError) as e:
+        log.info(f"No compiled model for {type(pipe.named_steps['clf']).__name__}: {e}")
+        return None
+
+    diff = parity_max_diff(scorer, pipe, parity_sample.iloc[:PARITY_ROWS])
+    if diff > PARITY_ATOL:
+        log.warning(
+            f"Compiled model not written: max |p_compiled - p_pipeline| = {diff:.3g} "
+            f"on {min(len(parity_sample), PARITY_ROWS)} rows exceeds {PARITY_ATOL:g}"
+        )
+        return None
+    return write_compiled_npz(bundle_dir, scorer)
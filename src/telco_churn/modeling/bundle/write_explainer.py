@@ -0,0 +1,30 @@
+"""Precompute the model's explainer into explainer.joblib next to model.joblib."""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Any, Optional
+
+from telco_churn.explainability.backends import EXPLAINER_FILE, backend_name, save_explainer
+from telco_churn.explainability.explain import build_explainer
+
+logger = logging.getLogger(__name__)
+
+
+def write_explainer(bundle_dir: Path, artifact_obj: Any, *, log: Any = None) -> Optional[Path]:
+    """Returns None when there is nothing to precompute: native backends (lgb, xgb, lr) explain from
+    the model itself, and shap cannot convert every classifier. Nothing is written in either case."""
+    log = log or logger
+    pipe = getattr(artifact_obj, "model", artifact_obj)
+    explainer = build_explainer(pipe=pipe)
+    name = backend_name(explainer)
+    try:
+        state = explainer.export_state()
+    except ValueError as e:  # shap's InvalidModelError: classifier not supported by TreeExplainer
+        log.info(f"No explainer precomputed for {type(pipe.named_steps['clf']).__name__}: {e}")
+        return None
+    if state is None:
+        log.info(f"No explainer file: the {name} backend needs no precomputed state")
+        return None
+    return save_explainer(bundle_dir / EXPLAINER_FILE, explainer)
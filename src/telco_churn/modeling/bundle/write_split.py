@@ -0,0 +1,32 @@
+"""Write the fast-loading split model format (model_split/) next to model.joblib."""
+
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+from typing import Any, Optional
+
+from telco_churn.modeling.bundle.split_model import SPLIT_DIR, write_split_dir
+
+
+def write_split_model(bundle_dir: Path, artifact_obj: Any) -> Optional[Path]:
+    """Returns None when the pipeline has no split form (unsupported classifier or preprocessor step)."""
+    pipe = getattr(artifact_obj, "model", artifact_obj)
+    split_dir = bundle_dir / SPLIT_DIR
+    tmp_dir = bundle_dir / (SPLIT_DIR + ".tmp")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    try:
+        write_split_dir(
+            tmp_dir,
+            pipe,
+            run_id=getattr(artifact_obj, "run_id", ""),
+            model_type=getattr(artifact_obj, "model_type", ""),
+        )
+    except (TypeError, ValueError):
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        return None
+
+    shutil.rmtree(split_dir, ignore_errors=True)
+    tmp_dir.replace(split_dir)
+    return split_dir
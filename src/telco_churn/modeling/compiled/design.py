@@ -0,0 +1,122 @@
+"""Compile the fitted spec -> ColumnTransformer steps into per-output-column arrays."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from sklearn.compose import ColumnTransformer
+from sklearn.impute import SimpleImputer
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder, StandardScaler
+
+
+@dataclass(frozen=True)
+class DesignPlan:
+    """Design column j = ((fill_nan(X[:, source[j]], fill[j]) == category[j] if onehot[j] else ...) - shift[j]) / scale[j]."""
+    input_columns: list[str]
+    source: np.ndarray
+    fill: np.ndarray
+    onehot: np.ndarray
+    category: np.ndarray
+    shift: np.ndarray
+    scale: np.ndarray
+    input_float32: bool = False
+
+    @property
+    def n_outputs(self) -> int:
+        return int(self.source.shape[0])
+
+    def raw_matrix(self, X: pd.DataFrame) -> np.ndarray:
+        """Model input columns as one contiguous float64 matrix (missing columns / values -> NaN).
+
+        input_float32 rounds through float32 first, matching a float32 feature-spec step.
+        """
+        dtype = np.float32 if self.input_float32 else np.float64
+        raw = X.reindex(columns=self.input_columns).to_numpy(dtype=dtype, na_value=np.nan)
+        return np.ascontiguousarray(raw, dtype=np.float64)
+
+    def transform(self, X: pd.DataFrame) -> np.ndarray:
+        """Dense design matrix, same values as the fitted ColumnTransformer (vectorized form of the scorer kernel)."""
+        v = self.raw_matrix(X)[:, self.source]
+        v = np.where(np.isnan(v) & ~np.isnan(self.fill), self.fill, v)
+        v = np.where(self.onehot, (v == self.category).astype(np.float64), v)
+        return (v - self.shift) / self.scale
+
+
+def _steps(trans) -> list:
+    if isinstance(trans, Pipeline):
+        return [step for _, step in trans.steps]
+    return [trans]
+
+
+def spec_is_float32(spec) -> bool:
+    """True when the pipeline's spec step hands the preprocessor float32 values."""
+    return np.dtype(getattr(spec, "dtype", np.float64)) == np.float32
+
+
+def compile_design(pre: ColumnTransformer, *, input_float32: bool = False) -> DesignPlan:
+    input_columns: list[str] = []
+    source: list[int] = []
+    fill: list[float] = []
+    onehot: list[bool] = []
+    category: list[float] = []
+    shift: list[float] = []
+    scale: list[float] = []
+
+    for name, trans, cols in pre.transformers_:
+        if trans == "drop" or name == "remainder":
+            continue
+        if trans == "passthrough":
+            steps = []
+        else:
+            steps = _steps(trans)
+
+        cols = list(cols)
+        col_fill = np.full(len(cols), np.nan)
+        col_cats: list[np.ndarray] | None = None
+        col_shift = np.zeros(len(cols))
+        col_scale = np.ones(len(cols))
+
+        for step in steps:
+            if isinstance(step, SimpleImputer):
+                stats = np.asarray(step.statistics_, dtype=np.float64)
+                if np.isnan(stats).any():
+                    raise ValueError(f"Imputer in {name!r} dropped empty features; not compilable")
+                col_fill = np.where(np.isnan(col_fill), stats, col_fill)
+            elif isinstance(step, OneHotEncoder):
+                if getattr(step, "drop_idx_", None) is not None:
+                    raise ValueError(f"OneHotEncoder in {name!r} uses drop; not compilable")
+                col_cats = [np.asarray(c, dtype=np.float64) for c in step.categories_]
+            elif isinstance(step, StandardScaler):
+                if col_cats is not None:
+                    raise ValueError(f"Scaling after one-hot in {name!r} is not compilable")
+                col_shift = np.asarray(step.mean_, dtype=np.float64) if step.with_mean else col_shift
+                col_scale = np.asarray(step.scale_, dtype=np.float64) if step.with_std else col_scale
+            else:
+                raise ValueError(f"Unsupported step {type(step).__name__} in {name!r}")
+
+        for i, col in enumerate(cols):
+            if col not in input_columns:
+                input_columns.append(col)
+            src = input_columns.index(col)
+            cats = col_cats[i] if col_cats is not None else np.array([np.nan])
+            for cat in cats:
+                source.append(src)
+                fill.append(col_fill[i])
+                onehot.append(col_cats is not None)
+                category.append(cat)
+                shift.append(col_shift[i])
+                scale.append(col_scale[i])
+
+    return DesignPlan(
+        input_columns=input_columns,
+        source=np.asarray(source, dtype=np.int64),
+        fill=np.asarray(fill, dtype=np.float64),
+        onehot=np.asarray(onehot, dtype=np.bool_),
+        category=np.asarray(category, dtype=np.float64),
+        shift=np.asarray(shift, dtype=np.float64),
+        scale=np.asarray(scale, dtype=np.float64),
+        input_float32=bool(input_float32),
+    )
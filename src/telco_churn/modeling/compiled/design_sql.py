@@ -0,0 +1,176 @@
+"""Export a compiled DesignPlan as a DuckDB view, so the design matrix comes straight out of SQL."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import duckdb
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+from telco_churn.modeling.compiled.design import DesignPlan, compile_design, spec_is_float32
+from telco_churn.modeling.compiled.scorer import PARITY_ATOL, PARITY_ROWS
+
+_PARITY_TABLE = "_design_parity_sample"
+
+
+def _ident(name: str) -> str:
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _lit(x: float) -> str:
+    # Exponent form parses as DOUBLE (not DECIMAL) and round-trips exactly.
+    return f"{float(x):.17e}"
+
+
+def design_plan_for(model) -> DesignPlan:
+    """DesignPlan of a fitted pipeline or pipeline stand-in (CompiledTreeModel, SplitModel)."""
+    steps = model.named_steps
+    plan = getattr(steps["pre"], "plan", None)
+    if plan is not None:
+        return plan
+    return compile_design(steps["pre"], input_float32=spec_is_float32(steps["spec"]))
+
+
+def design_column_sql(plan: DesignPlan, j: int) -> str:
+    """SQL for design column j, mirroring the imputer / one-hot / scaler arithmetic of the pipeline.
+
+    With a float32 spec step sklearn imputes and scales in float32 (statistics cast to the block dtype),
+    so those columns are computed as FLOAT and only widened to DOUBLE at the end.
+    """
+    num_type = "FLOAT" if plan.input_float32 else "DOUBLE"
+
+    def lit(x: float) -> str:
+        return f"CAST({_lit(x)} AS {num_type})"
+
+    col = _ident(plan.input_columns[int(plan.source[j])])
+    v = f"NULLIF(CAST({col} AS {num_type}), 'NaN'::{num_type})"
+
+    if not np.isnan(plan.fill[j]):
+        v = f"COALESCE({v}, {lit(plan.fill[j])})"
+    if plan.onehot[j]:
+        return f"CASE WHEN {v} = {lit(plan.category[j])} THEN 1.0 ELSE 0.0 END::DOUBLE"
+
+    shift, scale = float(plan.shift[j]), float(plan.scale[j])
+    if shift != 0.0 or scale != 1.0:
+        v = f"({v} - {lit(shift)}) / {lit(scale)}"
+    return f"CAST({v} AS DOUBLE)"
+
+
+def design_select_sql(
+    plan: DesignPlan,
+    *,
+    source_table: str,
+    design_columns: list[str],
+    id_col: str = "customer_id",
+) -> str:
+    if len(design_columns) != plan.n_outputs:
+        raise ValueError(f"{len(design_columns)} design column names for {plan.n_outputs} outputs")
+    exprs = [_ident(id_col)] + [
+        f"{design_column_sql(plan, j)} AS {_ident(name)}" for j, name in enumerate(design_columns)
+    ]
+    return "SELECT\n  " + ",\n  ".join(exprs) + f"\nFROM {source_table}"
+
+
+class DesignColumns:
+    """Spec step over design-view rows: the design columns as one float64 matrix (CSR when the pipeline was sparse)."""
+
+    def __init__(self, columns: list[str], *, sparse_output: bool = False):
+        self.columns = list(columns)
+        self.sparse_output = sparse_output
+
+    def transform(self, X: pd.DataFrame):
+        out = np.ascontiguousarray(X[self.columns].to_numpy(dtype=np.float64, na_value=np.nan))
+        return sp.csr_matrix(out) if self.sparse_output else out
+
+
+class PassthroughDesign:
+    def transform(self, X_t):
+        return X_t
+
+
+class DesignViewModel:
+    """Pipeline stand-in scoring design-view rows: no sklearn transform, the classifier reads the matrix directly."""
+
+    def __init__(self, clf, design_columns: list[str], *, sparse_output: bool = False):
+        self.named_steps: dict[str, Any] = {
+            "spec": DesignColumns(design_columns, sparse_output=sparse_output),
+            "pre": PassthroughDesign(),
+            "clf": clf,
+        }
+
+    def get_params(self, deep: bool = True) -> dict[str, Any]:
+        return {}
+
+    def set_params(self, **params) -> "DesignViewModel":
+        return self
+
+    def predict_proba(self, X: pd.DataFrame) -> np.ndarray:
+        steps = self.named_steps
+        return steps["clf"].predict_proba(steps["spec"].transform(X))
+
+
+@dataclass(frozen=True)
+class DesignView:
+    view_name: str
+    model: DesignViewModel
+    parity_diff: float
+    parity_rows: int
+    atol: float = PARITY_ATOL
+
+    @property
+    def verified(self) -> bool:
+        return self.parity_diff <= self.atol
+
+
+def _dense(X_t) -> np.ndarray:
+    return np.asarray(X_t.toarray() if sp.issparse(X_t) else X_t, dtype=np.float64)
+
+
+def create_design_view(
+    con: duckdb.DuckDBPyConnection,
+    model,
+    *,
+    source_table: str,
+    view_name: str,
+    feature_names: Optional[list[str]] = None,
+    id_col: str = "customer_id",
+    parity_rows: int = PARITY_ROWS,
+) -> DesignView:
+    """CREATE OR REPLACE the design view over source_table and check it against the pipeline transform.
+
+    Parity compares the view with spec -> pre of the model on the first parity_rows source rows; callers
+    should keep the regular path when the returned view is not verified.
+    """
+    plan = design_plan_for(model)
+    design_columns = list(feature_names) if feature_names is not None else [f"x{j}" for j in range(plan.n_outputs)]
+    select_sql = design_select_sql(plan, source_table=source_table, design_columns=design_columns, id_col=id_col)
+    con.execute(f"CREATE OR REPLACE VIEW {view_name} AS\n{select_sql}")
+
+    steps = model.named_steps
+    sparse_output = bool(
+        getattr(steps["pre"], "sparse_output_", False) or getattr(steps["pre"], "sparse_output", False)
+    )
+    view_model = DesignViewModel(steps["clf"], design_columns, sparse_output=sparse_output)
+
+    con.execute(f"CREATE OR REPLACE TEMP TABLE {_PARITY_TABLE} AS SELECT * FROM {source_table} LIMIT {int(parity_rows)}")
+    try:
+        X = con.execute(f"SELECT * FROM {_PARITY_TABLE}").df()
+        got = con.execute(
+            design_select_sql(plan, source_table=_PARITY_TABLE, design_columns=design_columns, id_col=id_col)
+        ).df()
+    finally:
+        con.execute(f"DROP TABLE IF EXISTS {_PARITY_TABLE}")
+
+    diff = 0.0
+    if len(X):
+        ref = _dense(steps["pre"].transform(steps["spec"].transform(X)))
+        out = got[design_columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        if ref.shape != out.shape or not np.array_equal(np.isnan(ref), np.isnan(out)):
+            diff = float("inf")
+        else:
+            diff = float(np.nanmax(np.abs(out - ref), initial=0.0))
+
+    return DesignView(view_name=view_name, model=view_model, parity_diff=diff, parity_rows=len(X))
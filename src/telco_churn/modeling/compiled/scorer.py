@@ -0,0 +1,164 @@
+"""Numba-jitted scorer for a compiled spec -> preprocessor -> tree ensemble pipeline."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from numba import njit, prange
+
+from telco_churn.modeling.compiled.design import DesignPlan, compile_design, spec_is_float32
+from telco_churn.modeling.compiled.trees import MISSING_NAN, MISSING_ZERO, TreeArrays, tree_arrays
+
+COMPILED_MODEL_FILE = "model_compiled.npz"
+PARITY_ROWS = 256
+PARITY_ATOL = 1e-6
+
+_K_ZERO = 1e-35
+
+
+@njit(parallel=True, cache=False)
+def _score_kernel(
+    X, source, fill, onehot, category, shift, scale,
+    feature, threshold, left, right, value, default_left, missing, roots,
+    base_margin, sigmoid, strict_less, float32_split,
+):
+    n_rows = X.shape[0]
+    n_out = source.shape[0]
+    out = np.empty(n_rows, dtype=np.float64)
+
+    for i in prange(n_rows):
+        row = np.empty(n_out, dtype=np.float64)
+        for j in range(n_out):
+            v = X[i, source[j]]
+            if np.isnan(v) and not np.isnan(fill[j]):
+                v = fill[j]
+            if onehot[j]:
+                v = 1.0 if v == category[j] else 0.0
+            row[j] = (v - shift[j]) / scale[j]
+
+        margin = base_margin
+        for t in range(roots.shape[0]):
+            node = roots[t]
+            while left[node] >= 0:
+                v = row[feature[node]]
+                if float32_split:
+                    v = np.float64(np.float32(v))
+                m = missing[node]
+                if np.isnan(v) and m != MISSING_NAN:
+                    v = 0.0
+                if (m == MISSING_ZERO and abs(v) <= _K_ZERO) or (m == MISSING_NAN and np.isnan(v)):
+                    go_left = default_left[node]
+                elif strict_less:
+                    go_left = v < threshold[node]
+                else:
+                    go_left = v <= threshold[node]
+                node = left[node] if go_left else right[node]
+            margin += value[node]
+
+        out[i] = 1.0 / (1.0 + np.exp(-sigmoid * margin))
+
+    return out
+
+
+@dataclass(frozen=True)
+class CompiledTreeScorer:
+    design: DesignPlan
+    trees: TreeArrays
+
+    def predict_proba_positive(self, X: pd.DataFrame) -> np.ndarray:
+        d, t = self.design, self.trees
+        return _score_kernel(
+            d.raw_matrix(X), d.source, d.fill, d.onehot, d.category, d.shift, d.scale,
+            t.feature, t.threshold, t.left, t.right, t.value, t.default_left, t.missing, t.roots,
+            float(t.base_margin), float(t.sigmoid), bool(t.strict_less), bool(t.float32_split),
+        )
+
+    def predict_proba(self, X: pd.DataFrame) -> np.ndarray:
+        p = self.predict_proba_positive(X)
+        return np.column_stack([1.0 - p, p])
+
+
+def compile_pipeline(pipe) -> CompiledTreeScorer:
+    return CompiledTreeScorer(
+        design=compile_design(
+            pipe.named_steps["pre"],
+            input_float32=spec_is_float32(pipe.named_steps["spec"]),
+        ),
+        trees=tree_arrays(pipe.named_steps["clf"]),
+    )
+
+
+def parity_max_diff(scorer: CompiledTreeScorer, pipe, X: pd.DataFrame) -> float:
+    if len(X) == 0:
+        return 0.0
+    ref = pipe.predict_proba(X)[:, 1]
+    return float(np.max(np.abs(scorer.predict_proba_positive(X) - ref)))
+
+
+def write_compiled_npz(bundle_dir: Path, scorer: CompiledTreeScorer) -> Path:
+    bundle_dir.mkdir(parents=True, exist_ok=True)
+    path = bundle_dir / COMPILED_MODEL_FILE
+    tmp = bundle_dir / (COMPILED_MODEL_FILE + ".tmp")
+
+    arrays: dict[str, Any] = {
+        f"design__{k}": v for k, v in asdict(scorer.design).items() if k != "input_columns"
+    }
+    arrays["design__input_columns"] = np.asarray(scorer.design.input_columns, dtype=np.str_)
+    for k, v in asdict(scorer.trees).items():
+        arrays[f"trees__{k}"] = np.asarray(v)
+
+    with open(tmp, "wb") as f:
+        np.savez(f, **arrays)
+    tmp.replace(path)
+    return path
+
+
+def load_compiled_npz(path: str | Path) -> CompiledTreeScorer:
+    with np.load(path, allow_pickle=False) as z:
+        design_kw = {
+            f.name: z[f"design__{f.name}"] for f in fields(DesignPlan) if f"design__{f.name}" in z.files
+        }
+        design_kw["input_columns"] = [str(c) for c in design_kw["input_columns"]]
+        if "input_float32" in design_kw:
+            design_kw["input_float32"] = bool(design_kw["input_float32"])
+
+        trees_kw = {f.name: z[f"trees__{f.name}"] for f in fields(TreeArrays)}
+        trees_kw["kind"] = str(trees_kw["kind"])
+        for k in ("base_margin", "sigmoid"):
+            trees_kw[k] = float(trees_kw[k])
+        for k in ("strict_less", "float32_split"):
+            trees_kw[k] = bool(trees_kw[k])
+
+    return CompiledTreeScorer(design=DesignPlan(**design_kw), trees=TreeArrays(**trees_kw))
+
+
+class CompiledTreeModel:
+    """Pipeline stand-in: predict_proba through the compiled scorer, everything else delegated to the pipeline.
+
+    The first predict_proba call checks parity against the pipeline on up to PARITY_ROWS rows and
+    permanently falls back to the pipeline if the two disagree.
+    """
+
+    def __init__(self, pipe, scorer: CompiledTreeScorer, *, atol: float = PARITY_ATOL):
+        self.pipe = pipe
+        self.scorer = scorer
+        self.atol = atol
+        self.verified: bool | None = None
+        self.parity_diff: float | None = None
+
+    def __getattr__(self, name):
+        if name == "pipe":
+            raise AttributeError(name)
+        return getattr(self.pipe, name)
+
+    def predict_proba(self, X: pd.DataFrame) -> np.ndarray:
+        if self.verified is None and len(X):
+            self.parity_diff = parity_max_diff(self.scorer, self.pipe, X.iloc[:PARITY_ROWS])
+            self.verified = self.parity_diff <= self.atol
+        if self.verified is False:
+            return self.pipe.predict_proba(X)
+        return self.scorer.predict_proba(X)
@@ -0,0 +1,176 @@
+"""Flatten fitted LightGBM / XGBoost binary classifiers into NumPy node arrays."""
+
+from __future__ import annotations
+
+import json
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+MISSING_NONE = 0
+MISSING_ZERO = 1
+MISSING_NAN = 2
+
+_LGB_MISSING = {"None": MISSING_NONE, "Zero": MISSING_ZERO, "NaN": MISSING_NAN}
+
+
+@dataclass(frozen=True)
+class TreeArrays:
+    """Node arrays for a tree ensemble; leaves have left == right == -1 and carry value."""
+    kind: str
+    feature: np.ndarray
+    threshold: np.ndarray
+    left: np.ndarray
+    right: np.ndarray
+    value: np.ndarray
+    default_left: np.ndarray
+    missing: np.ndarray
+    roots: np.ndarray
+    base_margin: float
+    sigmoid: float
+    strict_less: bool
+    float32_split: bool
+
+
+class _NodeBuffer:
+    def __init__(self):
+        self.feature: list[int] = []
+        self.threshold: list[float] = []
+        self.left: list[int] = []
+        self.right: list[int] = []
+        self.value: list[float] = []
+        self.default_left: list[bool] = []
+        self.missing: list[int] = []
+        self.roots: list[int] = []
+
+    def add(self, *, feature=-1, threshold=0.0, value=0.0, default_left=False, missing=MISSING_NONE) -> int:
+        self.feature.append(int(feature))
+        self.threshold.append(float(threshold))
+        self.left.append(-1)
+        self.right.append(-1)
+        self.value.append(float(value))
+        self.default_left.append(bool(default_left))
+        self.missing.append(int(missing))
+        return len(self.feature) - 1
+
+    def arrays(self, **kw) -> TreeArrays:
+        threshold = np.asarray(self.threshold, dtype=np.float64)
+        if kw.get("float32_split"):
+            threshold = threshold.astype(np.float32).astype(np.float64)
+        return TreeArrays(
+            feature=np.asarray(self.feature, dtype=np.int64),
+            threshold=threshold,
+            left=np.asarray(self.left, dtype=np.int64),
+            right=np.asarray(self.right, dtype=np.int64),
+            value=np.asarray(self.value, dtype=np.float64),
+            default_left=np.asarray(self.default_left, dtype=np.bool_),
+            missing=np.asarray(self.missing, dtype=np.int8),
+            roots=np.asarray(self.roots, dtype=np.int64),
+            **kw,
+        )
+
+
+def _lgb_node(buf: _NodeBuffer, node: dict) -> int:
+    if "leaf_value" in node:
+        return buf.add(value=node["leaf_value"])
+
+    if node.get("decision_type", "<=") != "<=":
+        raise ValueError(f"Unsupported LightGBM decision_type {node.get('decision_type')!r}")
+
+    idx = buf.add(
+        feature=node["split_feature"],
+        threshold=node["threshold"],
+        default_left=node.get("default_left", True),
+        missing=_LGB_MISSING[node.get("missing_type", "None")],
+    )
+    buf.left[idx] = _lgb_node(buf, node["left_child"])
+    buf.right[idx] = _lgb_node(buf, node["right_child"])
+    return idx
+
+
+def lgb_tree_arrays(clf) -> TreeArrays:
+    dump = clf.booster_.dump_model()
+
+    objective = str(dump.get("objective", ""))
+    if not objective.startswith("binary") or dump.get("num_tree_per_iteration", 1) != 1 or dump.get("average_output"):
+        raise ValueError(f"Unsupported LightGBM model (objective={objective!r})")
+
+    sigmoid = 1.0
+    for token in objective.split():
+        if token.startswith("sigmoid:"):
+            sigmoid = float(token.split(":", 1)[1])
+
+    buf = _NodeBuffer()
+    for tree in dump["tree_info"]:
+        buf.roots.append(_lgb_node(buf, tree["tree_structure"]))
+
+    return buf.arrays(
+        kind="lgb",
+        base_margin=0.0,
+        sigmoid=sigmoid,
+        strict_less=False,
+        float32_split=False,
+    )
+
+
+def _xgb_base_margin(learner: dict) -> float:
+    raw = str(learner["learner_model_param"]["base_score"]).strip("[]")
+    base_score = float(raw.split(",")[0])
+    return math.log(base_score / (1.0 - base_score))
+
+
+def xgb_tree_arrays(clf) -> TreeArrays:
+    booster = clf.get_booster()
+    learner = json.loads(booster.save_raw("json"))["learner"]
+
+    if learner["objective"]["name"] != "binary:logistic":
+        raise ValueError(f"Unsupported XGBoost objective {learner['objective']['name']!r}")
+    gbm = learner["gradient_booster"]
+    if gbm["name"] != "gbtree":
+        raise ValueError(f"Unsupported XGBoost booster {gbm['name']!r}")
+
+    trees = gbm["model"]["trees"]
+    best = booster.attr("best_iteration")
+    if best is not None:
+        trees = trees[: gbm["model"]["iteration_indptr"][int(best) + 1]]
+
+    buf = _NodeBuffer()
+    for tree in trees:
+        if any(int(t) != 0 for t in tree["split_type"]):
+            raise ValueError("Categorical XGBoost splits are not supported")
+
+        offset = len(buf.feature)
+        lefts, rights = tree["left_children"], tree["right_children"]
+        for i in range(len(lefts)):
+            is_leaf = lefts[i] == -1
+            buf.add(
+                feature=-1 if is_leaf else tree["split_indices"][i],
+                threshold=0.0 if is_leaf else tree["split_conditions"][i],
+                value=tree["split_conditions"][i] if is_leaf else 0.0,
+                default_left=bool(tree["default_left"][i]),
+                missing=MISSING_NAN,
+            )
+            if not is_leaf:
+                buf.left[offset + i] = offset + lefts[i]
+                buf.right[offset + i] = offset + rights[i]
+        buf.roots.append(offset)
+
+    return buf.arrays(
+        kind="xgb",
+        base_margin=_xgb_base_margin(learner),
+        sigmoid=1.0,
+        strict_less=True,
+        float32_split=True,
+    )
+
+
+def tree_arrays(clf) -> TreeArrays:
+    from lightgbm import LGBMClassifier
+    from xgboost import XGBClassifier
+
+    if isinstance(clf, LGBMClassifier):
+        return lgb_tree_arrays(clf)
+    if isinstance(clf, XGBClassifier):
+        return xgb_tree_arrays(clf)
+    raise TypeError(f"No compiled tree form for {type(clf).__name__}")
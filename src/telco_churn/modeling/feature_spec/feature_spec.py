@@ -1,10 +1,12 @@
-"""Sklearn Pipeline wrapper around feature_spec."""
+"""Sklearn Pipeline wrappers around feature_spec."""
 
 from __future__ import annotations
 from typing import Any, Dict, Optional
 
+import numpy as np
 import pandas as pd
 from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.utils.validation import check_is_fitted
 
 from telco_churn.modeling.feature_spec.apply import feature_spec
 
@@ -38,3 +40,69 @@ class FeatureSpecTransformer(BaseEstimator, TransformerMixin):
             self.spec,
             add_missing_columns=self.add_missing_columns,
         )
+
+
+_NUMERIC_DTYPES = {"int", "float", "bool"}
+
+
+class CompiledFeatureSpecTransformer(BaseEstimator, TransformerMixin):
+    """feature_spec as one numeric matrix: column plan built from the spec at fit, single fill pass at transform.
+
+    Output is a DataFrame over one contiguous `dtype` block (NaN for missing columns / values), so the
+    ColumnTransformer still selects by name. Columns outside the spec are dropped.
+    """
+
+    def __init__(
+        self,
+        spec: Dict[str, Any],
+        *,
+        add_missing_columns: bool = True,
+        drop_columns: Optional[list[str]] = None,
+        dtype: str = "float32",
+    ):
+        self.spec = spec
+        self.add_missing_columns = add_missing_columns
+        self.drop_columns = drop_columns
+        self.dtype = dtype
+
+    def fit(self, X: pd.DataFrame, y=None):
+        drop = set(self.drop_columns or [])
+        columns: list[str] = []
+        for f in self.spec.get("features", []):
+            name = f["name"]
+            if name in drop:
+                continue
+            dtype = f.get("dtype")
+            if dtype not in _NUMERIC_DTYPES:
+                raise ValueError(f"Feature {name!r} has non-numeric dtype {dtype!r}; not compilable")
+            columns.append(name)
+
+        self.columns_ = columns
+        self.dtype_ = np.dtype(self.dtype)
+        return self
+
+    def get_feature_names_out(self, input_features=None) -> np.ndarray:
+        check_is_fitted(self, "columns_")
+        return np.asarray(self.columns_, dtype=object)
+
+    def transform(self, X: pd.DataFrame) -> pd.DataFrame:
+        if not isinstance(X, pd.DataFrame):
+            raise TypeError("CompiledFeatureSpecTransformer expects a pandas DataFrame as input.")
+        check_is_fitted(self, "columns_")
+
+        # Fortran order: each column is one contiguous write, and the frame below wraps it without a copy.
+        out = np.empty((len(X), len(self.columns_)), dtype=self.dtype_, order="F")
+        for j, name in enumerate(self.columns_):
+            if name not in X.columns:
+                if not self.add_missing_columns:
+                    raise KeyError(f"Missing feature column {name!r}")
+                out[:, j] = np.nan
+                continue
+            col = X[name]
+            values = col.to_numpy()
+            if values.dtype.kind in "biuf":
+                out[:, j] = values
+            else:
+                out[:, j] = col.to_numpy(dtype=self.dtype_, na_value=np.nan)
+
+        return pd.DataFrame(out, index=X.index, columns=self.columns_, copy=False)
@@ -6,7 +6,7 @@ import optuna
 from sklearn.pipeline import Pipeline
 from xgboost import XGBClassifier
 
-from telco_churn.modeling.feature_spec.feature_spec import FeatureSpecTransformer
+from telco_churn.modeling.feature_spec.feature_spec import CompiledFeatureSpecTransformer
 from telco_churn.modeling.feature_spec.load_spec import load_feature_spec
 from telco_churn.modeling.preprocessors.tree import preprocessor
 
@@ -21,7 +21,7 @@ class XGBTrainer:
         id_col = self.spec.get("entity_key", "customer_id")
         return Pipeline(
             steps=[
-                ("spec", FeatureSpecTransformer(self.spec, drop_columns=[id_col])),
+                ("spec", CompiledFeatureSpecTransformer(self.spec, drop_columns=[id_col])),
                 ("pre", preprocessor()),
                 ("clf", XGBClassifier(
                     random_state=self.seed,
@@ -5,6 +5,7 @@ Per-run batch context.
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Optional
 import dagster as dg
 from telco_churn.paths import REPO_ROOT
 
@@ -19,11 +20,16 @@ class BatchRunContext:
     summary_path: Path
 
 class BatchContextResource(dg.ConfigurableResource):
+    """layered: materialize bronze / silver batch tables (debugging); otherwise they are views and bronze -> gold
+    runs as one fused query. materialize_gold: with fused layers, False leaves gold as a view so readers stream
+    straight from the batch parquet."""
     repo_root: str = "."
     reports_dirname: str = "reports"
+    layered: bool = False
+    materialize_gold: bool = True
 
-    def get(self) -> BatchRunContext:
-        batch_id = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S_UTC")
+    def get(self, batch_id: Optional[str] = None) -> BatchRunContext:
+        batch_id = batch_id or datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S_UTC")
 
         reports_root = REPO_ROOT / self.reports_dirname
         batch_root = reports_root / f"batch_{batch_id}"
@@ -2,15 +2,30 @@
 Hugging-face dataset repo access.
 """
 
+from typing import Optional
+
 import dagster as dg
-from telco_churn.io.hf import download_dataset_hf, upload_dataset_hf
+from telco_churn.io.hf import download_dataset_hf, upload_dataset_hf, upload_dataset_files_hf, LocalCommitApi
 
 class HFDataResource(dg.ConfigurableResource):
     repo_id: str
     revision: str
+    upload_workers: int = 4
+    local_root: Optional[str] = None
 
     def download_data(self, filename: str) -> str:
         return download_dataset_hf(repo_id=self.repo_id, filename=filename, revision=self.revision)
     
     def upload_data(self, local_path: str, hf_path: str) -> None:
-        return upload_dataset_hf(repo_id=self.repo_id, local_path=local_path, hf_path=hf_path)
\ No newline at end of file
+        return upload_dataset_hf(repo_id=self.repo_id, local_path=local_path, hf_path=hf_path)
+
+    def upload_files(self, files: dict[str, str], commit_message: Optional[str] = None) -> None:
+        """Upload {hf_path: local_path} as a single commit (to local_root instead of the hub when set)."""
+        return upload_dataset_files_hf(
+            files=files,
+            repo_id=self.repo_id,
+            revision=self.revision,
+            commit_message=commit_message,
+            max_workers=self.upload_workers,
+            api=LocalCommitApi(self.local_root) if self.local_root else None,
+        )
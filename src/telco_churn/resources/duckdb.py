@@ -1,14 +1,120 @@
 """
-Resolves the DuckDB database path.
+DuckDB database paths and one shared database handle per file per process.
 """
 
-import dagster as dg
+import atexit
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Iterator, Optional
+
+import dagster as dg
+import duckdb
+
+from telco_churn.io.locks import file_lock
+
+@dataclass
+class _Handle:
+    con: duckdb.DuckDBPyConnection
+    read_only: bool
+    config: dict[str, Any]
+
+_HANDLES: dict[str, _Handle] = {}
+_HANDLES_LOCK = threading.Lock()
+
+def shared_handle(path: Path, *, read_only: bool = False, config: Optional[dict[str, Any]] = None) -> duckdb.DuckDBPyConnection:
+    """Process-wide database handle for path (catalog and buffer cache stay warm between callers).
+
+    A file has one access mode per process: DuckDB cannot open a second, read-only connection to a
+    file this process already holds read-write, and a cursor on that handle could write. Requesting
+    the mode the handle was not opened with raises RuntimeError. Across processes DuckDB admits either
+    one read-write process or any number of read-only ones, so readers cannot run next to a writer.
+    config only takes effect when the handle is opened: these settings are database-wide in DuckDB,
+    so later callers must not request a value that differs from the open handle's (RuntimeError);
+    settings they leave out are inherited.
+    """
+    key = str(path)
+    config = dict(config or {})
+    with _HANDLES_LOCK:
+        handle = _HANDLES.get(key)
+        if handle is not None:
+            if handle.read_only != read_only:
+                mode = "read-only" if handle.read_only else "read-write"
+                raise RuntimeError(f"DuckDB database is open {mode} in this process: {key}")
+            conflicts = {k: v for k, v in config.items() if handle.config.get(k) != v}
+            if conflicts:
+                raise RuntimeError(
+                    f"DuckDB database {key} is already open with settings {handle.config}; requested {conflicts}"
+                )
+            return handle.con
+        con = duckdb.connect(key, read_only=read_only, config=config)
+        _HANDLES[key] = _Handle(con=con, read_only=read_only, config=config)
+        return con
+
+def close_shared_handles() -> None:
+    with _HANDLES_LOCK:
+        for handle in _HANDLES.values():
+            handle.con.close()
+        _HANDLES.clear()
+
+atexit.register(close_shared_handles)
 
 class DuckDBResource(dg.ConfigurableResource):
     path: str
+    partitions_dirname: str = "partitions"
+    cache_suffix: str = "__cache"
+    read_only: bool = False
+    threads: Optional[int] = None
+    memory_limit: Optional[str] = None
+    temp_directory: Optional[str] = None
+    preserve_insertion_order: Optional[bool] = None
 
-    def db_path(self) -> Path:
+    def db_path(self, partition: Optional[str] = None) -> Path:
+        """Main database, or a per-partition file next to it so partitions can run in parallel processes."""
         p = Path(self.path).expanduser()
+        if partition is not None:
+            p = p.parent / self.partitions_dirname / f"{p.stem}__{partition}{p.suffix}"
         p.parent.mkdir(parents=True, exist_ok=True)
         return p.resolve()
+
+    def cache_path(self) -> Path:
+        """Score cache database shared by every partition, next to the main database."""
+        p = self.db_path()
+        return p.with_name(f"{p.stem}{self.cache_suffix}{p.suffix}")
+
+    def settings(self) -> dict[str, Any]:
+        """DuckDB config for new handles; unset fields keep DuckDB defaults."""
+        settings = {
+            "threads": self.threads,
+            "memory_limit": self.memory_limit,
+            "temp_directory": self.temp_directory,
+            "preserve_insertion_order": self.preserve_insertion_order,
+        }
+        return {k: v for k, v in settings.items() if v is not None}
+
+    @contextmanager
+    def connect(self, partition: Optional[str] = None) -> Iterator[duckdb.DuckDBPyConnection]:
+        """Cursor on the shared handle for the (partition) database; only the cursor is closed on exit."""
+        con = shared_handle(self.db_path(partition), read_only=self.read_only, config=self.settings())
+        cur = con.cursor()
+        try:
+            yield cur
+        finally:
+            cur.close()
+
+    @contextmanager
+    def connect_cache(self) -> Iterator[duckdb.DuckDBPyConnection]:
+        """Connection to the shared cache database, held under an exclusive file lock.
+
+        Partition steps run in separate processes and DuckDB admits one writing process per file,
+        so the cache is not kept on a shared handle: each use opens it under <cache>.lock and closes
+        it before the lock is released. Keep the block short; other partitions wait on it.
+        """
+        path = self.cache_path()
+        with file_lock(path.with_name(path.name + ".lock")):
+            con = duckdb.connect(str(path), config=self.settings())
+            try:
+                yield con
+            finally:
+                con.close()
@@ -0,0 +1,98 @@
+"""
+Asset output metadata at a configurable cost level.
+"""
+
+from enum import Enum
+from typing import Any
+
+import dagster as dg
+import duckdb
+import pandas as pd
+import pyarrow.parquet as pq
+
+class MetadataLevel(str, Enum):
+    OFF = "off"
+    LIGHT = "light"
+    FULL = "full"
+
+def _schema_md(cols) -> dg.MetadataValue:
+    return dg.MetadataValue.md("\n".join([f"- `{name}`: {dtype}" for (name, dtype, *_rest) in cols]))
+
+class MetadataResource(dg.ConfigurableResource):
+    """off: only what the asset passes in; light: catalog / footer / dtype info, no scans;
+    full: exact counts, previews and deep memory usage."""
+    level: MetadataLevel = MetadataLevel.FULL
+    preview_rows: int = 5
+
+    def table(self, con: duckdb.DuckDBPyConnection, table_name: str, **extra: Any) -> dict[str, Any]:
+        if self.level == MetadataLevel.OFF:
+            return extra
+
+        if self.level == MetadataLevel.LIGHT:
+            schema, _, name = table_name.rpartition(".")
+            schema = schema or "main"
+            stats = con.execute(
+                "SELECT estimated_size, column_count FROM duckdb_tables() "
+                "WHERE database_name = current_database() AND schema_name = ? AND table_name = ?",
+                [schema, name],
+            ).fetchone()
+            cols = con.execute(
+                "SELECT column_name, data_type FROM duckdb_columns() "
+                "WHERE database_name = current_database() AND schema_name = ? AND table_name = ? "
+                "ORDER BY column_index",
+                [schema, name],
+            ).fetchall()
+            return {
+                **extra,
+                "rows": int(stats[0]) if stats else None,
+                "columns": len(cols),
+                "schema": _schema_md(cols),
+            }
+
+        rows = con.execute(f"select count(*) from {table_name}").fetchone()[0]
+        cols = con.execute(f"describe {table_name}").fetchall()
+        preview_df = con.execute(f"select * from {table_name} limit {int(self.preview_rows)}").df()
+        return {
+            **extra,
+            "rows": rows,
+            "columns": len(cols),
+            "schema": _schema_md(cols),
+            "preview": dg.MetadataValue.md(preview_df.to_markdown(index=False)),
+        }
+
+    def frame(self, df: pd.DataFrame, *, memory: bool = False, **extra: Any) -> dict[str, Any]:
+        if self.level == MetadataLevel.OFF:
+            return extra
+
+        out = {**extra, "rows": df.shape[0], "columns": df.shape[1]}
+        if self.level == MetadataLevel.LIGHT:
+            if memory:
+                out["memory_bytes"] = int(df.memory_usage(deep=False).sum())
+            return out
+
+        out["preview"] = dg.MetadataValue.md(df.head(self.preview_rows).to_markdown(index=False))
+        if memory:
+            out["memory_bytes"] = int(df.memory_usage(deep=True).sum())
+        return out
+
+    def preview(self, df: pd.DataFrame) -> dict[str, Any]:
+        """Markdown preview only at full level (for assets that report their own counts)."""
+        if self.level != MetadataLevel.FULL:
+            return {}
+        return {"preview": dg.MetadataValue.md(df.head(self.preview_rows).to_markdown(index=False))}
+
+    def parquet(self, parquet_path: str, **extra: Any) -> dict[str, Any]:
+        if self.level == MetadataLevel.OFF:
+            return extra
+
+        if self.level == MetadataLevel.LIGHT:
+            md = pq.read_metadata(parquet_path)
+            return {**extra, "rows": md.num_rows, "columns": md.num_columns}
+
+        df_head = pd.read_parquet(parquet_path).head(self.preview_rows)
+        return {
+            **extra,
+            "rows_previewed": len(df_head),
+            "columns": len(df_head.columns),
+            "preview": dg.MetadataValue.md(df_head.to_markdown(index=False)),
+        }
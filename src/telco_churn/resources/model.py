@@ -2,11 +2,18 @@
 Hugging-face model repo access.
 """
 
-from dataclasses import dataclass
-from typing import Any, Optional
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any, Callable, Optional
 import dagster as dg
 from telco_churn.modeling.types import BundleOut
-from telco_churn.io.hf import read_model_json, load_model_hf, upload_model_bundle, upload_model_json_hf
+from telco_churn.io.hf import read_model_json, load_model_hf, load_compiled_model_hf, load_split_model_hf, upload_model_bundle, upload_model_json_hf, model_file_etag, download_model_file_hf
+from telco_churn.explainability.backends import EXPLAINER_FILE, load_explainer
+from telco_churn.explainability.explain import build_explainer
+from telco_churn.modeling.bundle.split_model import SPLIT_DIR
+from telco_churn.io.model_cache import ModelCache, CachedBundle
+from telco_churn.paths import REPO_ROOT
+from telco_churn.modeling.compiled.scorer import COMPILED_MODEL_FILE, CompiledTreeModel
 from telco_churn.io.hf_run_metrics import fetch_all_run_metrics, RunRow
 
 @dataclass(frozen=True)
@@ -15,10 +22,22 @@ class ModelBundle:
     model: Any
     threshold: Optional[float]
     feature_names: Optional[list[str]]
+    explainer_loader: Optional[Callable[[], Any]] = field(default=None, repr=False, compare=False)
+
+    @cached_property
+    def explainer(self):
+        """Precomputed explainer from the run bundle, loaded on first use; built from the model if the run has none."""
+        explainer = self.explainer_loader() if self.explainer_loader is not None else None
+        return explainer if explainer is not None else build_explainer(pipe=self.model)
 
 class HFModelResource(dg.ConfigurableResource):
     repo_id: str
     revision: str
+    use_compiled: bool = True
+    use_split: bool = True
+    cache_dir: Optional[str] = ".cache/models"
+    cache_max_versions: int = 3
+    cache_ttl_seconds: float = 0.0
 
     _bundle: ModelBundle | None = None
 
@@ -27,29 +46,82 @@ class HFModelResource(dg.ConfigurableResource):
 
     def model_artifact(self, path_in_repo):
         return load_model_hf(repo_id=self.repo_id, revision=self.revision, path_in_repo=path_in_repo)
+
+    def compiled_artifact(self, path_in_repo):
+        return load_compiled_model_hf(repo_id=self.repo_id, revision=self.revision, path_in_repo=path_in_repo)
+
+    def split_artifact(self, path_in_repo):
+        return load_split_model_hf(repo_id=self.repo_id, revision=self.revision, path_in_repo=path_in_repo)
     
+    def model_file(self, path_in_repo) -> Optional[str]:
+        return download_model_file_hf(repo_id=self.repo_id, revision=self.revision, path_in_repo=path_in_repo)
+
     def bundle_upload(self, bundle_dir: str, run_id: str):
         return upload_model_bundle(bundle_dir=bundle_dir, repo_id=self.repo_id, run_id=run_id, revision=self.revision)
 
+    def model_cache(self) -> Optional[ModelCache]:
+        if not self.cache_dir:
+            return None
+        root = REPO_ROOT / self.cache_dir / self.repo_id.replace("/", "__") / self.revision
+        return ModelCache(root=root, max_versions=self.cache_max_versions, ttl_seconds=self.cache_ttl_seconds)
+
+    def _download_bundle(self, model_version: str, *, with_compiled: bool) -> CachedBundle:
+        model = self.split_artifact(f"{model_version}/{SPLIT_DIR}") if self.use_split else None
+        if model is None:
+            artifact = self.model_artifact(f"{model_version}/model.joblib")
+            model = getattr(artifact, "model", artifact)
+
+        compiled = None
+        if with_compiled:
+            compiled = self.compiled_artifact(f"{model_version}/{COMPILED_MODEL_FILE}")
+
+        meta = self.model_json(f"{model_version}/metadata.json")
+        return CachedBundle(
+            model_version=model_version,
+            model=model,
+            compiled=compiled,
+            threshold=meta.get("cfg", {}).get("threshold"),
+            feature_names=meta.get("feature_names"),
+        )
+
+    def _explainer_loader(self, model_version: str, model, cache: Optional[ModelCache]) -> Callable[[], Any]:
+        def load():
+            local = cache.entry_file(model_version, EXPLAINER_FILE) if cache is not None else None
+            if local is None or not local.exists():
+                fetched = self.model_file(f"{model_version}/{EXPLAINER_FILE}")
+                if fetched is None:
+                    return None
+                local = cache.add_file(model_version, fetched, EXPLAINER_FILE) if cache is not None else fetched
+            return load_explainer(local, model.named_steps["clf"])
+        return load
+
     def get_model_bundle(self) -> BundleOut:
         if self._bundle is not None:
             return self._bundle
 
-        champion_ptr = self.model_json("champion.json")
-        model_version = champion_ptr["path_in_repo"]
-
-        artifact = self.model_artifact(f"{model_version}/model.joblib")
-        model = getattr(artifact, "model", artifact)
+        cache = self.model_cache()
+        if cache is None:
+            cached = self._download_bundle(self.model_json("champion.json")["path_in_repo"], with_compiled=self.use_compiled)
+        else:
+            model_version = cache.champion_version(
+                fetch_etag=lambda: model_file_etag(repo_id=self.repo_id, revision=self.revision, path_in_repo="champion.json"),
+                fetch_pointer=lambda: self.model_json("champion.json"),
+            )
+            cached = cache.load(model_version)
+            if cached is None:
+                cached = self._download_bundle(model_version, with_compiled=True)
+                cache.store(cached)
 
-        meta = self.model_json(f"{model_version}/metadata.json")
-        threshold = meta.get("cfg", {}).get("threshold")
-        feature_names = meta.get("feature_names")
+        model = cached.model
+        if self.use_compiled and cached.compiled is not None:
+            model = CompiledTreeModel(model, cached.compiled)
 
         self._bundle = ModelBundle(
-            model_version=model_version,
+            model_version=cached.model_version,
             model=model,
-            threshold=threshold,
-            feature_names=feature_names,
+            threshold=cached.threshold,
+            feature_names=cached.feature_names,
+            explainer_loader=self._explainer_loader(cached.model_version, model, cache),
         )
         return self._bundle
 
@@ -0,0 +1,22 @@
+"""
+Batch scoring engine config.
+"""
+
+import dagster as dg
+from telco_churn.batch.parallel import ParallelScorer
+
+class ScoringResource(dg.ConfigurableResource):
+    n_workers: int = 1
+    chunk_rows: int = 50_000
+    incremental: bool = False
+    priority_top_k: int = 0
+    top_reasons: int = 1
+
+    def scorer(self, *, model, names, explainer=None) -> ParallelScorer:
+        return ParallelScorer(
+            model=model,
+            names=names,
+            explainer=explainer,
+            n_workers=self.n_workers,
+            chunk_rows=self.chunk_rows,
+        )
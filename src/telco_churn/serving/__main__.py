@@ -0,0 +1,35 @@
+"""
+Run the online scoring service: python -m telco_churn.serving --port 8080
+"""
+
+import argparse
+import asyncio
+
+from telco_churn.config import REPO_ID, REVISION
+from telco_churn.resources.model import HFModelResource
+from telco_churn.serving.app import ScoringServer
+from telco_churn.serving.scorer import OnlineScorer
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Telco churn online scoring service.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--max-batch-size", type=int, default=64)
+    parser.add_argument("--max-wait-ms", type=float, default=5.0)
+    parser.add_argument("--repo-id", default=REPO_ID)
+    parser.add_argument("--revision", default=REVISION)
+    args = parser.parse_args()
+
+    bundle = HFModelResource(repo_id=args.repo_id, revision=args.revision).get_model_bundle()
+    server = ScoringServer(
+        OnlineScorer(bundle),
+        host=args.host,
+        port=args.port,
+        max_batch_size=args.max_batch_size,
+        max_wait_ms=args.max_wait_ms,
+    )
+    print(f"Serving {bundle.model_version} on http://{args.host}:{args.port}")
+    asyncio.run(server.serve_forever())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Minimal asyncio HTTP/1.1 scoring service.
+
+    GET  /health  -> {"status": "ok", "model_version": ...}
+    POST /score   -> body: one record, a list of records, or {"records": [...]}
+                     returns {"model_version": ..., "results": [...]}
+"""
+
+import asyncio
+import json
+from typing import Any
+
+from telco_churn.serving.batcher import MicroBatcher
+from telco_churn.serving.scorer import OnlineScorer
+
+MAX_BODY_BYTES = 8 * 1024 * 1024
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large", 500: "Internal Server Error"}
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+def _content_length(headers: dict[str, str]) -> int:
+    raw = headers.get("content-length", "") or "0"
+    if not (raw.isascii() and raw.isdigit()):
+        raise HTTPError(400, f"invalid Content-Length: {raw!r}")
+    return int(raw)
+
+def parse_records(body: bytes) -> list[dict]:
+    try:
+        payload = json.loads(body or b"null")
+    except json.JSONDecodeError as e:
+        raise HTTPError(400, f"invalid JSON: {e}")
+
+    if isinstance(payload, dict) and "records" in payload:
+        payload = payload["records"]
+    if isinstance(payload, dict):
+        payload = [payload]
+    if not isinstance(payload, list) or not payload or not all(isinstance(r, dict) for r in payload):
+        raise HTTPError(400, "expected a record object, a list of records, or {\"records\": [...]}")
+    return payload
+
+class ScoringServer:
+    def __init__(
+        self,
+        scorer: OnlineScorer,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 5.0,
+    ):
+        self.scorer = scorer
+        self.host = host
+        self.port = port
+        self.batcher = MicroBatcher(scorer.score, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+
+    async def route(self, method: str, path: str, body: bytes) -> dict[str, Any]:
+        path = path.split("?", 1)[0]
+        if path == "/health":
+            if method != "GET":
+                raise HTTPError(405, "use GET")
+            return {"status": "ok", "model_version": self.scorer.bundle.model_version}
+        if path == "/score":
+            if method != "POST":
+                raise HTTPError(405, "use POST")
+            records = parse_records(body)
+            results = await asyncio.gather(*(self.batcher.submit(r) for r in records))
+            return {"model_version": self.scorer.bundle.model_version, "results": list(results)}
+        raise HTTPError(404, f"no route for {path}")
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                parts = request_line.decode("latin-1").split()
+                if len(parts) != 3:
+                    break
+                method, path, version = parts
+
+                headers: dict[str, str] = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    key, _, value = line.decode("latin-1").partition(":")
+                    headers[key.strip().lower()] = value.strip()
+
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                length = None
+                try:
+                    length = _content_length(headers)
+                    if length > MAX_BODY_BYTES:
+                        raise HTTPError(413, "request body too large")
+                    body = await reader.readexactly(length) if length else b""
+                    status, payload = 200, await self.route(method.upper(), path, body)
+                except HTTPError as e:
+                    status, payload = e.status, {"error": str(e)}
+                    # An unread or unframed body leaves the stream unusable for another request.
+                    keep_alive = keep_alive and length is not None and e.status != 413
+                except Exception as e:
+                    status, payload = 500, {"error": f"{type(e).__name__}: {e}"}
+
+                data = json.dumps(payload).encode("utf-8")
+                writer.write(
+                    (
+                        f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+                        "Content-Type: application/json\r\n"
+                        f"Content-Length: {len(data)}\r\n"
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+                    ).encode("latin-1") + data
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve_forever(self) -> None:
+        await self.batcher.start()
+        server = await asyncio.start_server(self.handle, self.host, self.port)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.batcher.stop()
@@ -0,0 +1,84 @@
+"""
+Gold features for online records, built with the packaged silver base.sql and gold features.sql on an in-memory DuckDB.
+"""
+
+import duckdb
+import pandas as pd
+from telco_churn.db.executor import SQLExecutor
+
+SILVER_SQL_PKG = "telco_churn.data_layers.silver"
+BASE_SQL_FILE = "base.sql"
+GOLD_SQL_PKG = "telco_churn.data_layers.gold"
+FEATURES_SQL_FILE = "features.sql"
+
+# Silver column (online record field) -> bronze column read by base.sql.
+SILVER_TO_BRONZE = {
+    "gender": "gender",
+    "partner": "Partner",
+    "dependents": "Dependents",
+    "phone_service": "PhoneService",
+    "multiple_lines": "MultipleLines",
+    "internet_service": "InternetService",
+    "online_security": "OnlineSecurity",
+    "online_backup": "OnlineBackup",
+    "device_protection": "DeviceProtection",
+    "tech_support": "TechSupport",
+    "streaming_tv": "StreamingTV",
+    "streaming_movies": "StreamingMovies",
+    "contract": "Contract",
+    "paperless_billing": "PaperlessBilling",
+    "payment_method": "PaymentMethod",
+    "senior_citizen": "SeniorCitizen",
+    "tenure": "tenure",
+    "monthly_charges": "MonthlyCharges",
+    "total_charges": "TotalCharges",
+}
+
+SILVER_NUMERIC_COLS = ["senior_citizen", "tenure", "monthly_charges", "total_charges"]
+
+def _col(df: pd.DataFrame, name: str) -> pd.Series:
+    return df[name] if name in df.columns else pd.Series(pd.NA, index=df.index, dtype="object")
+
+class OnlineFeatureBuilder:
+    """Not thread-safe: owns one DuckDB connection, use from a single worker thread.
+
+    Records go through the same base.sql as batch and training (normalization, allowed categories,
+    value ranges), so invalid values become NULL online too. base.sql dedups by customer_id; records
+    are keyed by position for it so every record keeps its own row.
+    """
+
+    def __init__(self):
+        self.con = duckdb.connect(":memory:")
+        self.ex = SQLExecutor(self.con)
+        self.silver_sql = self.ex.load_sql(SILVER_SQL_PKG, BASE_SQL_FILE).format(
+            base_table="silver.online_base",
+            bronze_table="bronze_online",
+        )
+        self.sql = self.ex.load_sql(GOLD_SQL_PKG, FEATURES_SQL_FILE).format(
+            features_table="gold.online_features",
+            base_table="silver.online_base",
+        )
+
+    def bronze_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Records as base.sql input: bronze column names, customerID = record position."""
+        out = pd.DataFrame({"customerID": pd.Series(range(len(df)), index=df.index).astype("string")})
+        for c, bronze in SILVER_TO_BRONZE.items():
+            if c in SILVER_NUMERIC_COLS:
+                out[bronze] = pd.to_numeric(_col(df, c), errors="coerce").astype("float64")
+            else:
+                out[bronze] = _col(df, c).astype("string")
+        return out
+
+    def build(self, records: list[dict]) -> pd.DataFrame:
+        df = pd.DataFrame.from_records(records)
+        self.con.register("bronze_online", self.bronze_frame(df))
+        try:
+            self.ex.execute_script(self.silver_sql)
+            self.ex.execute_script(self.sql)
+            X = self.con.execute(
+                "SELECT * FROM gold.online_features ORDER BY CAST(customer_id AS BIGINT)"
+            ).df()
+        finally:
+            self.con.unregister("bronze_online")
+        X["customer_id"] = _col(df, "customer_id").astype("string").str.strip().to_numpy()
+        return X
@@ -0,0 +1,43 @@
+"""
+Score raw silver-shaped records with the champion bundle.
+"""
+
+import numpy as np
+import pandas as pd
+
+from telco_churn.batch.scored import RISK_LABELS, risk_bucket_codes
+from telco_churn.explainability.explain import build_explainer, top_feature_indices
+from telco_churn.explainability.reason_map import ReasonCodeMap
+from telco_churn.serving.features import OnlineFeatureBuilder
+
+class OnlineScorer:
+    """Not thread-safe: run score() from a single worker thread."""
+
+    def __init__(self, bundle):
+        self.bundle = bundle
+        self.threshold = float(bundle.threshold)
+        self.reasons = ReasonCodeMap.from_feature_names(bundle.feature_names)
+        self.reason_codes = np.asarray(self.reasons.reason_codes, dtype=object)
+        self.features = OnlineFeatureBuilder()
+        self.explainer = getattr(bundle, "explainer", None) or build_explainer(pipe=bundle.model)
+
+    def score(self, records: list[dict]) -> list[dict]:
+        X = self.features.build(records)
+        proba = self.bundle.model.predict_proba(X)[:, 1]
+
+        top_idx = top_feature_indices(pipe=self.bundle.model, explainer=self.explainer, X=X, k=1)[:, 0]
+        reason_code = self.reason_codes[self.reasons.reason_index(top_idx)]
+
+        risk_bucket = np.asarray(RISK_LABELS, dtype=object)[risk_bucket_codes(proba)]
+
+        return [
+            {
+                "customer_id": None if pd.isna(cid) else str(cid),
+                "probability": float(p),
+                "decision": int(p >= self.threshold),
+                "risk_bucket": str(bucket),
+                "reason_code": str(reason),
+                "model_version": self.bundle.model_version,
+            }
+            for cid, p, bucket, reason in zip(X["customer_id"], proba, risk_bucket, reason_code)
+        ]